@@ -0,0 +1,82 @@
+class AppendStore:
+    """Columnar append buffer that builds a DataFrame only when a view needs one
+
+    Rows are kept as one Python list per column, so appending is amortized O(1)
+    instead of copying the whole frame with pd.concat on every insert. The
+    DataFrame is built lazily from the columns and cached until the next change.
+    """
+
+    def __init__(self, columns, frame=None, category_columns=()):
+        self.columns = list(columns)
+        # Columns whose values repeat, given a categorical dtype in the frame
+        self.category_columns = [column for column in category_columns if column in self.columns]
+        self._data = {column: [] for column in self.columns}
+        self._length = 0
+        self._frame = None
+        # Incremented on every change, so views and exports can tell stale data
+        self.version = 0
+
+        if frame is not None and not frame.empty:
+            self._length = len(frame)
+            for column in self.columns:
+                if column in frame.columns:
+                    self._data[column] = frame[column].tolist()
+                else:
+                    self._data[column] = [None] * self._length
+
+    def __len__(self):
+        return self._length
+
+    @property
+    def empty(self):
+        return self._length == 0
+
+    def append(self, row):
+        """Append a single row given as a dict keyed by column name"""
+        for column in self.columns:
+            self._data[column].append(row.get(column))
+        self._length += 1
+        self._frame = None
+        self.version += 1
+
+    def extend(self, rows):
+        """Append several rows given as dicts keyed by column name"""
+        for row in rows:
+            self.append(row)
+
+    def extend_columns(self, columns):
+        """Append rows given column-wise as a dict of equally long lists"""
+        n_rows = len(next(iter(columns.values()))) if columns else 0
+        for column in self.columns:
+            values = columns.get(column)
+            self._data[column].extend(values if values is not None else [None] * n_rows)
+        self._length += n_rows
+        self._frame = None
+        self.version += 1
+
+    def get(self, row, column):
+        """Value of a single cell"""
+        return self._data[column][row]
+
+    def set(self, row, column, value):
+        """Overwrite a single cell"""
+        self._data[column][row] = value
+        self._frame = None
+        self.version += 1
+
+    def column(self, column):
+        """Values of a column as a list (do not modify)"""
+        return self._data[column]
+
+    @property
+    def frame(self):
+        """DataFrame view of all rows, rebuilt only after a change"""
+        if self._frame is None:
+            # Imported here so the stores can be used without loading pandas
+            import pandas as pd
+
+            frame = pd.DataFrame(self._data, columns=self.columns)
+            for column in self.category_columns:
+                frame[column] = frame[column].fillna("").astype(str).astype("category")
+            self._frame = frame
+        return self._frame
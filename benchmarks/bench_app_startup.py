@@ -0,0 +1,81 @@
+"""App startup and rerun time with lazily loaded screens vs all screens loaded.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_app_startup [--processes 3] [--reruns 20]
+
+Each page is opened in fresh processes through Streamlit's AppTest: "startup"
+is the first run of the app (imports, session initialization, the page), and
+"rerun" the best of --reruns runs that follow. "lazy" is the app as it runs,
+importing only the screen it shows; "eager" imports every screen module before
+the first run, like the single-module app did. Also reports whether the page
+loaded pandas.
+
+AppTest parses (for Streamlit's magic commands) and compiles the entry script
+again on every run, which the app server does once per process and edit, so
+reruns here also pay for the size of manufacturing_tag_config.py.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from screens import SCREENS
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "manufacturing_tag_config.py")
+
+# Run in a fresh interpreter per measurement; prints one JSON line
+PROBE = """
+import importlib, json, logging, sys, time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+for name in ("streamlit.deprecation_util", "streamlit.runtime.scriptrunner_utils.script_run_context"):
+    logging.getLogger(name).disabled = True
+if {eager}:
+    for module_name, _ in {screens}.values():
+        importlib.import_module(module_name)
+at = AppTest.from_file({app!r}, default_timeout=120)
+at.session_state.page = {page!r}
+at.run()
+startup = time.perf_counter() - t0
+assert not at.exception, at.exception[0].value
+reruns = []
+for _ in range({reruns}):
+    t = time.perf_counter()
+    at.run()
+    reruns.append(time.perf_counter() - t)
+print(json.dumps({{"startup": startup, "rerun": min(reruns), "pandas": "pandas" in sys.modules}}))
+"""
+
+
+def probe(page, eager, reruns, directory):
+    code = PROBE.format(eager=eager, screens=SCREENS, app=APP_PATH, page=page, reruns=reruns)
+    root = os.path.dirname(APP_PATH)
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")])))
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=directory, env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processes", type=int, default=3, help="fresh processes per page and mode, the best is kept")
+    parser.add_argument("--reruns", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'page':<11} {'mode':<6} {'startup ms':>11} {'rerun ms':>9}  pandas")
+    with tempfile.TemporaryDirectory() as directory:
+        for page in SCREENS:
+            for mode in ("lazy", "eager"):
+                runs = [probe(page, mode == "eager", args.reruns, directory) for _ in range(args.processes)]
+                startup = min(run["startup"] for run in runs)
+                rerun = min(run["rerun"] for run in runs)
+                print(f"{page:<11} {mode:<6} {startup * 1000:11.0f} {rerun * 1000:9.1f}  {runs[0]['pandas']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Insert cost of the generic tag stores versus one-row pd.concat appends.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_append_store [--tags 100000]
+
+The time per batch of inserts stays flat for the append store (linear total
+cost). The legacy concat-per-row baseline copies the whole frame on every
+insert, so it is orders of magnitude slower per row and grows with the frame.
+"""
+
+import argparse
+import time
+import uuid
+
+import pandas as pd
+
+from generic_tag_registry import GENERIC_TAG_COLUMNS, GenericTagMapping, GenericTagRegistry
+
+
+def make_entry(i):
+    return {
+        "Generic_Tag": f"GENERIC_TAG_{i}",
+        "UUID": str(uuid.uuid4()),
+        "Tag_Description": f"Description {i}",
+        "Industry": "Cement",
+        "Equipment": f"EQUIPMENT_{i % 50}",
+    }
+
+
+def bench_registry(n_tags, batch):
+    """Seconds per batch of GenericTagRegistry.add calls"""
+    registry = GenericTagRegistry()
+    timings = []
+    for start in range(0, n_tags, batch):
+        t0 = time.perf_counter()
+        for i in range(start, min(start + batch, n_tags)):
+            entry = make_entry(i)
+            registry.add(
+                entry["Generic_Tag"],
+                entry["UUID"],
+                entry["Tag_Description"],
+                entry["Industry"],
+                entry["Equipment"],
+            )
+        timings.append(time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    frame = registry.frame
+    build = time.perf_counter() - t0
+    assert len(frame) == n_tags
+    return timings, build
+
+
+def bench_mapping(n_tags, batch):
+    """Seconds per batch of GenericTagMapping.record calls"""
+    mapping = GenericTagMapping()
+    timings = []
+    for start in range(0, n_tags, batch):
+        t0 = time.perf_counter()
+        for i in range(start, min(start + batch, n_tags)):
+            mapping.record(f"GENERIC_TAG_{i}", "Cement", f"EQUIPMENT_{i % 50}")
+        timings.append(time.perf_counter() - t0)
+    return timings
+
+
+def bench_concat(n_tags, batch):
+    """Seconds per batch of the legacy one-row pd.concat appends"""
+    frame = pd.DataFrame(columns=GENERIC_TAG_COLUMNS)
+    timings = []
+    for start in range(0, n_tags, batch):
+        t0 = time.perf_counter()
+        for i in range(start, min(start + batch, n_tags)):
+            frame = pd.concat([frame, pd.DataFrame([make_entry(i)])], ignore_index=True)
+        timings.append(time.perf_counter() - t0)
+    return timings
+
+
+def report(name, timings, batch):
+    print(f"\n{name}")
+    for i, seconds in enumerate(timings):
+        print(f"  rows {i * batch:>7}-{(i + 1) * batch:>7}: {seconds * 1000:9.1f} ms")
+    print(f"  total: {sum(timings):.2f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tags", type=int, default=100_000)
+    parser.add_argument("--batches", type=int, default=10)
+    parser.add_argument(
+        "--concat-tags",
+        type=int,
+        default=5_000,
+        help="rows for the legacy pd.concat baseline (quadratic, keep small)",
+    )
+    args = parser.parse_args()
+
+    batch = max(1, args.tags // args.batches)
+    timings, build = bench_registry(args.tags, batch)
+    report(f"GenericTagRegistry.add x {args.tags}", timings, batch)
+    print(f"  DataFrame build: {build * 1000:.1f} ms")
+
+    report(f"GenericTagMapping.record x {args.tags}", bench_mapping(args.tags, batch), batch)
+
+    if args.concat_tags:
+        concat_batch = max(1, args.concat_tags // args.batches)
+        report(
+            f"pd.concat per row x {args.concat_tags} (legacy)",
+            bench_concat(args.concat_tags, concat_batch),
+            concat_batch,
+        )
+
+
+if __name__ == "__main__":
+    main()
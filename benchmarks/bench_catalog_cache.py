@@ -0,0 +1,79 @@
+"""Load time and memory of many sessions editing tag_metadata.csv.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_catalog_cache [--tags 200000 --sessions 30]
+
+Before, every session parsed the catalog with its own pd.read_csv and kept a
+private copy. TagMetadataFile parses it once per process and gives sessions
+copy-on-write views, so a session that edits one limit only copies the limit
+columns. Each approach runs in a fresh process; memory is its peak RSS growth.
+"""
+
+import argparse
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.bench_tag_journal import make_catalog
+from tag_metadata_file import TagMetadataFile
+
+
+def peak_rss():
+    """Peak resident memory of this process in bytes"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def sessions(csv_path, shared, n_sessions, results):
+    """Load the catalog and edit one cell per session, in a fresh process"""
+    tag_file = TagMetadataFile(csv_path)
+    before = peak_rss()
+    t0 = time.perf_counter()
+    frames = []
+    for i in range(n_sessions):
+        df = tag_file.load()[0] if shared else pd.read_csv(csv_path)
+        df.loc[i, "High_Limit"] = 95.0
+        frames.append(df)
+    elapsed = time.perf_counter() - t0
+
+    # Every session sees only its own edit
+    for i, df in enumerate(frames):
+        assert (df["High_Limit"] == 95.0).sum() == 1 and df.at[i, "High_Limit"] == 95.0
+    results.put((elapsed, peak_rss() - before))
+
+
+def measure(csv_path, shared, n_sessions):
+    results = multiprocessing.Queue()
+    process = multiprocessing.Process(target=sessions, args=(csv_path, shared, n_sessions, results))
+    process.start()
+    elapsed, memory = results.get()
+    process.join()
+    return elapsed, memory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tags", type=int, default=200_000)
+    parser.add_argument("--sessions", type=int, default=30)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, "tag_metadata.csv")
+        tag_file = TagMetadataFile(csv_path)
+        tag_file.replace(make_catalog(args.tags))
+        print(f"catalog: {args.tags} tags, {os.path.getsize(csv_path) / 1e6:.1f} MB, {args.sessions} sessions")
+
+        private_time, private_memory = measure(csv_path, False, args.sessions)
+        shared_time, shared_memory = measure(csv_path, True, args.sessions)
+        print(f"\n  private read_csv per session: {private_time:6.2f} s, {private_memory / 1e6:8.1f} MB peak RSS growth")
+        print(f"  shared copy-on-write catalog: {shared_time:6.2f} s, {shared_memory / 1e6:8.1f} MB peak RSS growth")
+
+
+if __name__ == "__main__":
+    main()
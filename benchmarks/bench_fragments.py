@@ -0,0 +1,79 @@
+"""Cost of an interaction on the Tags Configuration screen: fragment vs whole page.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_fragments [--tags 0,10,50,1000,10000] [--reruns 10]
+
+Section 1, Section 2, the configured tags list and the hierarchy tree are
+fragments: typing in Section 1 or editing the tag description reruns only
+that section, deleting a tag only the list. Runs the screen through AppTest
+with profiling on and --tags configured tags, and reports the best full page
+rerun (what every interaction cost before) and the time of each fragment in
+it (what an interaction inside that fragment costs now).
+"""
+
+import argparse
+import json
+import logging
+import os
+import tempfile
+import time
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "manufacturing_tag_config.py")
+
+FRAGMENTS = ["tag_basic_info_section", "tag_generated_info_section", "configured_tags_list"]
+
+
+def last_rerun():
+    with open(os.environ["TAG_PROFILE_TRACE"], encoding="utf-8") as f:
+        return json.loads(f.readlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tags", default="0,10,50,1000,10000", help="configured tags (not yet finished)")
+    parser.add_argument("--reruns", type=int, default=10)
+    args = parser.parse_args()
+
+    # Fragment times come from the rerun profile, which is set up when the app's modules are imported
+    directory = tempfile.mkdtemp()
+    os.environ["TAG_PROFILE"] = "1"
+    os.environ["TAG_PROFILE_TRACE"] = os.path.join(directory, "rerun_trace.jsonl")
+    from benchmarks.synthetic_plant import generate_tags
+    from streamlit.testing.v1 import AppTest
+
+    for name in ("streamlit.deprecation_util", "streamlit.runtime.scriptrunner_utils.script_run_context"):
+        logging.getLogger(name).disabled = True
+
+    print(f"{'tags':>6} {'page ms':>8}  " + "  ".join(f"{name + ' ms':>30}" for name in FRAGMENTS))
+    cwd = os.getcwd()
+    os.chdir(directory)
+    try:
+        for n_tags in [int(n) for n in args.tags.split(",")]:
+            at = AppTest.from_file(APP_PATH, default_timeout=600).run()
+            tags = generate_tags(max(n_tags, 1))
+            industry, plant, area, equipment, asset = tags.iloc[0, :5].tolist()
+            at.session_state.catalog.tag_entries = tags.head(n_tags).to_dict("records")
+            at.session_state.selected_industry = industry
+            at.session_state.plant_hierarchy = {"plant": plant, "area": area, "equipment": equipment, "asset": asset}
+            at.session_state.tag_form_submitted = True
+            at.session_state.page = "tags"
+            at.run()
+
+            best = None
+            for _ in range(args.reruns):
+                t0 = time.perf_counter()
+                at.run()
+                elapsed = time.perf_counter() - t0
+                if best is None or elapsed < best[0]:
+                    best = (elapsed, last_rerun())
+            elapsed, rerun = best
+            calls = rerun["calls"]
+            fragments = "  ".join(f"{calls[name]['ms'] if name in calls else 0.0:30.1f}" for name in FRAGMENTS)
+            print(f"{n_tags:6} {rerun['ms']:8.1f}  {fragments}")
+    finally:
+        os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    main()
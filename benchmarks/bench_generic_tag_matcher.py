@@ -0,0 +1,112 @@
+"""Ranking generic tags for DCS tags with the n-gram matcher.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_generic_tag_matcher [--generic-tags 10000] [--tags 100000]
+
+Generic tags are synthetic AREA_EQUIPMENT_MEASUREMENT_NN names with
+descriptions; DCS tags abbreviate them (KL_GB_TT-02 for KILN_GEARBOX_TT_02)
+and come with a raw parameter, like a point list. Reports the index build
+time, single-query latency, batch throughput and how often the generic tag
+a DCS tag was derived from is ranked first or in the top 5.
+"""
+
+import argparse
+import random
+import time
+
+import pandas as pd
+
+from tag_catalog import TagCatalog
+
+AREAS = [
+    "KILN", "COOLER", "PREHEATER", "CALCINER", "RAW_MILL", "COAL_MILL", "CEMENT_MILL", "CRUSHER", "STACKER",
+    "RECLAIMER", "SILO", "PACKER", "BAG_FILTER", "ESP", "CYCLONE", "BURNER", "CONVEYOR", "ELEVATOR",
+    "SEPARATOR", "HOPPER", "FEEDER", "BLENDING", "CLINKER", "GYPSUM", "FLYASH", "LIMESTONE", "CLAY",
+    "WATER", "COMPRESSOR", "BOILER", "TURBINE", "CONDENSER", "DEAERATOR", "CHIMNEY", "SCRUBBER",
+    "THICKENER", "FURNACE", "LADLE", "CASTER", "ROLLING",
+]
+EQUIPMENT = [
+    "GEARBOX", "MOTOR", "FAN", "PUMP", "BEARING", "INLET", "OUTLET", "DAMPER", "VALVE", "DRIVE", "SHELL",
+    "HOOD", "DUCT", "ROLLER", "TABLE", "CLASSIFIER", "BELT", "SCREW", "BUCKET", "SEAL", "NOZZLE", "LINER",
+    "COOLING", "LUBE", "HYDRAULIC",
+]
+MEASUREMENTS = {
+    "TT": "temperature", "PT": "pressure", "FT": "flow", "LT": "level", "ST": "speed", "IT": "current",
+    "VT": "vibration", "ZT": "position", "DPT": "differential pressure", "AT": "analyzer", "WT": "weight",
+    "JT": "power",
+}
+
+
+def abbreviation(word):
+    # KILN -> KL, RAW_MILL -> RM, GEARBOX -> GB, like typical DCS tag names
+    parts = word.split("_")
+    if len(parts) > 1:
+        return "".join(part[0] for part in parts)
+    return word[0] + next((c for c in word[1:] if c not in "AEIOU"), word[1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--generic-tags", type=int, default=10_000)
+    parser.add_argument("--tags", type=int, default=100_000, help="DCS tags scored in the batch")
+    parser.add_argument("--equipment", type=int, default=50, help="equipment the generic tags are spread over")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    names = {}
+    while len(names) < args.generic_tags:
+        area, equipment, kind = rng.choice(AREAS), rng.choice(EQUIPMENT), rng.choice(list(MEASUREMENTS))
+        number = rng.randint(1, 20)
+        name = f"{area}_{equipment}_{kind}_{number:02d}"
+        names[name] = (area, equipment, kind, number)
+
+    catalog = TagCatalog()
+    generic_tags = list(names)
+    catalog.generic_tag_registry.add_columns(
+        {
+            "Generic_Tag": generic_tags,
+            "UUID": [str(i) for i in range(len(generic_tags))],
+            "Tag_Description": [
+                f"{area.replace('_', ' ').title()} {equipment.lower()} {MEASUREMENTS[kind]} {number}"
+                for area, equipment, kind, number in names.values()
+            ],
+            "Industry": ["Cement"] * len(generic_tags),
+            "Equipment": [f"EQUIPMENT_{i % args.equipment}" for i in range(len(generic_tags))],
+        }
+    )
+
+    start = time.perf_counter()
+    catalog.generic_tag_matcher()
+    print(f"index of {len(generic_tags):,} generic tags built in {time.perf_counter() - start:.2f}s")
+
+    targets = [rng.randrange(len(generic_tags)) for _ in range(args.tags)]
+    rows = []
+    for n, target in enumerate(targets):
+        area, equipment, kind, number = names[generic_tags[target]]
+        dcs_tag = f"{abbreviation(area)}_{rng.randint(100, 999)}_{abbreviation(equipment)}_{kind}-{number:02d}"
+        raw_parameter = f"{area.replace('_', ' ').lower()} {MEASUREMENTS[kind]}" if n % 2 else ""
+        rows.append((dcs_tag, raw_parameter, "Cement", f"EQUIPMENT_{target % args.equipment}"))
+    tags = pd.DataFrame(rows, columns=["DCS_Tag", "Raw_Parameter", "Industry", "Equipment"])
+
+    sample = tags.head(2_000)
+    start = time.perf_counter()
+    for dcs_tag, raw_parameter, industry, equipment in sample.itertuples(index=False):
+        catalog.match_generic_tags(f"{dcs_tag} {raw_parameter}", industry, equipment)
+    latency = (time.perf_counter() - start) / len(sample)
+    print(f"single query: {latency * 1000:.3f} ms")
+
+    start = time.perf_counter()
+    matches = catalog.match_tags(tags)
+    elapsed = time.perf_counter() - start
+    print(f"batch of {len(tags):,} tags: {elapsed:.2f}s ({len(tags) / elapsed:,.0f} tags/s)")
+
+    first = sum(bool(found) and found[0][0] == generic_tags[t] for found, t in zip(matches, targets))
+    top5 = sum(generic_tags[t] in [tag for tag, _ in found] for found, t in zip(matches, targets))
+    print(f"derived generic tag ranked first: {first / len(tags):.1%}, in the top 5: {top5 / len(tags):.1%}")
+    dcs_tag, raw_parameter = tags.iloc[1][["DCS_Tag", "Raw_Parameter"]]
+    print(f"example: {dcs_tag} / {raw_parameter!r} -> {matches[1][:3]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Multi-file generic tags upload: parsing in worker processes vs one file after another.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_parallel_upload [--files 8] [--rows 50000] [--format xlsx]
+
+Every file is parsed and validated like on the Upload screen, then all of
+them are added to an empty registry in one batch. The first parallel run
+includes starting the worker processes, the second reuses them.
+"""
+
+import argparse
+import io
+import time
+
+import pandas as pd
+
+from generic_tag_registry import GenericTagMapping, GenericTagRegistry
+from generic_tag_upload import UPLOAD_PARSE_PROCESSES, ingest_generic_tags_batch, parse_upload, parse_uploads
+
+
+def make_upload(index, rows, file_format):
+    df = pd.DataFrame(
+        {
+            "Generic Tag": [f"GENERIC_TAG_{i % 500}" for i in range(rows)],
+            "Tag Description": [f"Description {i}" for i in range(rows)],
+            "Source": ["DCS"] * rows,
+        }
+    )
+    buffer = io.BytesIO()
+    if file_format == "csv":
+        df.to_csv(buffer, index=False)
+    else:
+        df.to_excel(buffer, index=False)
+    return f"Cement__EQUIPMENT_{index}.{file_format}", buffer.getvalue()
+
+
+def run(parse, uploads):
+    start = time.perf_counter()
+    results = parse(uploads)
+    batches = [(df, "Cement", f"EQUIPMENT_{i}") for i, (df, _) in enumerate(results)]
+    rows, _ = ingest_generic_tags_batch(batches, GenericTagRegistry(), GenericTagMapping(), [])
+    return rows, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=8)
+    parser.add_argument("--rows", type=int, default=50_000, help="rows per file")
+    parser.add_argument("--format", choices=["csv", "xlsx"], default="xlsx")
+    args = parser.parse_args()
+
+    uploads = [make_upload(i, args.rows, args.format) for i in range(args.files)]
+    megabytes = sum(len(content) for _, content in uploads) / 1024 / 1024
+    print(f"{args.files} {args.format} files, {args.rows:,} rows each ({megabytes:.1f} MB), "
+          f"{UPLOAD_PARSE_PROCESSES} worker processes")
+
+    def sequential(uploads):
+        return [parse_upload(file_name, content) for file_name, content in uploads]
+
+    for name, parse in [("sequential", sequential), ("parallel, cold", parse_uploads), ("parallel, warm", parse_uploads)]:
+        rows, elapsed = run(parse, uploads)
+        print(f"  {name:<16} {elapsed:7.2f}s  {rows / elapsed:10,.0f} rows/s  {megabytes / elapsed:6.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
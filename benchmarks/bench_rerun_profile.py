@@ -0,0 +1,62 @@
+"""Cost of the rerun profiling mode per profiled call and per rerun.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_rerun_profile [--calls 1000000]
+
+With profiling off (the default) @profiled returns the function itself, so
+calls cost exactly what they did before. With TAG_PROFILE=1 each call of a
+profiled function pays for two clock reads and a dict update, and each rerun
+for one JSONL line appended to the trace.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import rerun_profile
+from rerun_profile import _timed, finish_rerun, start_rerun
+
+
+def lookup(key):
+    return key
+
+
+def per_call(func, calls):
+    t0 = time.perf_counter()
+    for i in range(calls):
+        func(i)
+    return (time.perf_counter() - t0) / calls * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=1_000_000)
+    parser.add_argument("--reruns", type=int, default=1000)
+    args = parser.parse_args()
+
+    timed = _timed(lookup, "lookup", "helper")
+    print(f"profiling {'on' if rerun_profile.PROFILING else 'off'} in this process (TAG_PROFILE)\n")
+    print("ns per call:")
+    print(f"  plain function (profiling off):      {per_call(lookup, args.calls):8.1f}")
+    print(f"  profiled, outside a rerun:           {per_call(timed, args.calls):8.1f}")
+    start_rerun("bench")
+    print(f"  profiled, recording a rerun:         {per_call(timed, args.calls):8.1f}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        trace_path = os.path.join(directory, "trace.jsonl")
+        finish_rerun(trace_path)
+        t0 = time.perf_counter()
+        for _ in range(args.reruns):
+            start_rerun("bench")
+            for i in range(50):
+                timed(i)
+            finish_rerun(trace_path)
+        elapsed = (time.perf_counter() - t0) / args.reruns
+        print(f"\nrerun with 50 profiled calls, traced: {elapsed * 1e6:8.1f} us "
+              f"({os.path.getsize(trace_path) / args.reruns:.0f} bytes of trace)")
+
+
+if __name__ == "__main__":
+    main()
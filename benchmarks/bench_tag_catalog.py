@@ -0,0 +1,71 @@
+"""Import time and call rates of the UI-free TagCatalog.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_tag_catalog [--tags 100000]
+
+Import times are measured in fresh interpreters. TagCatalog does not import
+streamlit and only imports pandas once a DataFrame is needed, so services
+can resolve UUIDs and tag descriptions without paying for either.
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+
+def import_time(module):
+    """Seconds to import a module in a fresh interpreter"""
+    code = f"import time; t0 = time.perf_counter(); import {module}; print(time.perf_counter() - t0)"
+    return float(subprocess.check_output([sys.executable, "-c", code], text=True))
+
+
+def rate(func, calls):
+    t0 = time.perf_counter()
+    for i in range(calls):
+        func(i)
+    return calls / (time.perf_counter() - t0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tags", type=int, default=100_000, help="generic tags in the registry")
+    args = parser.parse_args()
+
+    print("fresh import:")
+    for module in ("tag_catalog", "pandas", "streamlit"):
+        print(f"  {module:<12} {import_time(module) * 1000:8.1f} ms")
+
+    from tag_catalog import TagCatalog
+
+    catalog = TagCatalog()
+    n_equipment = 50
+    catalog.generic_tag_registry.add_columns(
+        {
+            "Generic_Tag": [f"GENERIC_TAG_{i}" for i in range(args.tags)],
+            "UUID": [f"uuid-{i}" for i in range(args.tags)],
+            "Tag_Description": [f"Description {i}" for i in range(args.tags)],
+            "Industry": ["Cement"] * args.tags,
+            "Equipment": [f"EQUIPMENT_{i % n_equipment}" for i in range(args.tags)],
+        }
+    )
+
+    def known(i):
+        tag = i % args.tags
+        return catalog.resolve_uuid(f"GENERIC_TAG_{tag}", "Cement", f"EQUIPMENT_{tag % n_equipment}")
+
+    def description(i):
+        tag = i % args.tags
+        return catalog.tag_description(f"GENERIC_TAG_{tag}", "Cement", f"EQUIPMENT_{tag % n_equipment}")
+
+    print(f"\ncalls per second ({args.tags} generic tags):")
+    print(f"  resolve_uuid, known tag:  {rate(known, 200_000):12,.0f}")
+    print(f"  resolve_uuid, new tag:    {rate(lambda i: catalog.resolve_uuid(f'NEW_{i}', 'Cement', 'KILN'), 100_000):12,.0f}")
+    print(f"  tag_description:          {rate(description, 200_000):12,.0f}")
+    print(f"  unique_values:            {rate(lambda i: catalog.unique_values('Plant', 'Cement'), 200_000):12,.0f}")
+    print(f"  pandas imported: {'pandas' in sys.modules}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Save latency of the tag_metadata.csv journal versus full rewrites.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_tag_journal [--tags 200000]
+
+Changing one tag rewrites the whole file with to_csv, so its cost grows with
+the catalog. The journal appends one record per change, so its cost depends
+only on the size of the change. Replaying the log on read and compacting it
+into the base file are reported too.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import uuid
+
+import pandas as pd
+
+from tag_journal import TagMetadataJournal
+
+
+def make_catalog(n_tags):
+    return pd.DataFrame(
+        {
+            "Industry": "Cement",
+            "Plant": [f"PLANT_{i % 5}" for i in range(n_tags)],
+            "Area": [f"AREA_{i % 20}" for i in range(n_tags)],
+            "Equipment": [f"EQUIPMENT_{i % 50}" for i in range(n_tags)],
+            "Asset": [f"ASSET_{i % 200}" for i in range(n_tags)],
+            "DCS_Tag": [f"TI-{i}" for i in range(n_tags)],
+            "Raw_Parameter": [f"RAW_{i}" for i in range(n_tags)],
+            "Generic_Tag": [f"GENERIC_TAG_{i % 300}" for i in range(n_tags)],
+            "UUID": [str(uuid.uuid4()) for _ in range(n_tags)],
+            "Tag_Description": [f"Description {i}" for i in range(n_tags)],
+            "UOM": "°C",
+            "Low_Low_Limit": 0.0,
+            "Low_Limit": 10.0,
+            "High_Limit": 90.0,
+            "High_High_Limit": 100.0,
+        }
+    )
+
+
+def timed(func):
+    t0 = time.perf_counter()
+    result = func()
+    return time.perf_counter() - t0, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tags", type=int, default=200_000)
+    parser.add_argument("--saves", type=int, default=20, help="one-tag saves to time")
+    args = parser.parse_args()
+
+    catalog = make_catalog(args.tags)
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, "tag_metadata.csv")
+        catalog.to_csv(csv_path, index=False)
+        print(f"catalog: {args.tags} tags, {os.path.getsize(csv_path) / 1e6:.1f} MB")
+
+        # Never compact during the timed saves
+        full_path = os.path.join(directory, "tag_metadata_full.csv")
+        journal = TagMetadataJournal(csv_path, compact_bytes=float("inf"))
+        rewrite, append = [], []
+        for i in range(args.saves):
+            row = (i * 7919) % args.tags
+            catalog.loc[row, "High_Limit"] = 95.0 + i
+            rewrite.append(timed(lambda: catalog.to_csv(full_path, index=False))[0])
+            append.append(timed(lambda: journal.append_updates([([row], {"High_Limit": 95.0 + i})]))[0])
+
+        print(f"\none-tag save x {args.saves}")
+        print(f"  full to_csv rewrite: {sum(rewrite) / len(rewrite) * 1000:9.2f} ms per save")
+        print(f"  journal append:      {sum(append) / len(append) * 1000:9.2f} ms per save")
+
+        expected = pd.read_csv(full_path)
+        read_time, replayed = timed(journal.read)
+        assert replayed.equals(expected)
+        print(f"\nread with {journal.pending_records()} records replayed: {read_time * 1000:.1f} ms")
+
+        compact_time, _ = timed(journal.compact)
+        assert pd.read_csv(csv_path).equals(expected)
+        print(f"compaction into the base file:  {compact_time * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Memory of a tags DataFrame per layout: object columns, pandas strings, compact.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_tag_memory [--tags 100000]
+
+"object" is the layout the app used to build (Python strings, limits as
+objects), "str" what read_csv gives with pandas' string dtype, "compact" the
+layout of compact_tags (categorical hierarchy, vocabularies and UUIDs, float32
+limits). Sizes are per 100k tags, values included.
+"""
+
+import argparse
+import time
+
+import pandas as pd
+
+from benchmarks.bench_tag_validation import make_tags
+from tag_catalog import TAG_COLUMNS, TAG_LIMIT_COLUMNS, compact_tags
+
+
+def megabytes_per_100k(df):
+    return df.memory_usage(index=False, deep=True) / 1e6 * 100_000 / len(df)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tags", type=int, default=100_000)
+    args = parser.parse_args()
+
+    tags = make_tags(args.tags)
+    layouts = {
+        "object": tags.astype(object).astype({column: object for column in TAG_LIMIT_COLUMNS}),
+        "str": tags,
+    }
+    t0 = time.perf_counter()
+    layouts["compact"] = compact_tags(tags)
+    compact_seconds = time.perf_counter() - t0
+
+    sizes = pd.DataFrame({name: megabytes_per_100k(df) for name, df in layouts.items()}).loc[TAG_COLUMNS]
+    sizes.loc["total"] = sizes.sum()
+    print(f"MB per 100k tags ({args.tags:,} tags, {sizes.loc['UUID', 'compact'] * 10:.1f} bytes per UUID compact):")
+    print(sizes.round(2).to_string())
+    for name in ("object", "str"):
+        saving = 1 - sizes.loc["total", "compact"] / sizes.loc["total", name]
+        print(f"compact vs {name}: {saving:.0%} smaller")
+    print(f"compact_tags: {compact_seconds * 1000:.0f} ms ({args.tags / compact_seconds:,.0f} tags/s)")
+
+
+if __name__ == "__main__":
+    main()
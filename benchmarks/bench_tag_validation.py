@@ -0,0 +1,113 @@
+"""Catalog-wide tag validation: time per rule and for the whole report.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_tag_validation [--tags 1000000] [--issues 0.001]
+
+Builds a synthetic catalog (Cement plants, 40 generic tags per equipment) and
+breaks a share of the tags with each kind of issue: limits out of order,
+duplicate DCS tags, a generic tag with a second UUID, unknown UOMs, invalid
+hierarchy names. Reports how many of each were found and how long each rule
+and the whole validate_tags call took (best of --repeat runs), on plain and
+on compact (categorical) columns.
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from tag_catalog import DEFAULT_UOMS, compact_tags
+from tag_validation import RULES, _Columns, validate_tags
+
+
+def make_tags(n_tags, seed=7):
+    """n_tags valid tags spread over plants, areas, equipment and assets"""
+    rng = np.random.default_rng(seed)
+    tag = np.arange(n_tags)
+    equipment = tag // 200
+    generic = rng.integers(0, 40, n_tags)
+    low = rng.uniform(0, 100, n_tags).round(1)
+    return pd.DataFrame(
+        {
+            "Industry": "Cement",
+            "Plant": pd.Series(equipment // 500, dtype=str).radd("PLANT_"),
+            "Area": pd.Series(equipment // 20, dtype=str).radd("AREA_"),
+            "Equipment": pd.Series(equipment % 25, dtype=str).radd("EQUIPMENT_"),
+            "Asset": pd.Series(tag // 20, dtype=str).radd("ASSET_"),
+            "DCS_Tag": pd.Series(tag, dtype=str).radd("TI-"),
+            "Raw_Parameter": "Temperature",
+            "Generic_Tag": pd.Series(generic, dtype=str).radd("GENERIC_TAG_"),
+            # 36-character UUIDs, one per generic tag and equipment name
+            "UUID": pd.Series(generic * 25 + equipment % 25, dtype=str).str.zfill(8) + "-0000-4000-8000-000000000000",
+            "Tag_Description": "Temperature",
+            "UOM": np.array(DEFAULT_UOMS)[rng.integers(0, len(DEFAULT_UOMS), n_tags)],
+            "Low_Low_Limit": low,
+            "Low_Limit": low + 10,
+            "High_Limit": low + 20,
+            "High_High_Limit": low + 30,
+        }
+    )
+
+
+def break_tags(df, share, seed=7):
+    """Give a share of the tags one issue each; returns {issue: tags broken}"""
+    rng = np.random.default_rng(seed)
+    n_broken = max(int(len(df) * share), 1)
+    rows = rng.choice(len(df) - 1, 5 * n_broken, replace=False).reshape(5, n_broken)
+    df.loc[rows[0], "Low_Limit"] = df.loc[rows[0], "High_Limit"] + 1
+    # Each duplicate also flags the tag it copies
+    df.loc[rows[1], "DCS_Tag"] = df.loc[rows[1] + 1, "DCS_Tag"].to_numpy()
+    df.loc[rows[2], "UUID"] = "uuid-other"
+    df.loc[rows[3], "UOM"] = "furlong"
+    df.loc[rows[4], "Asset"] = "asset 1"
+    return {
+        "limits out of order": n_broken,
+        "duplicate DCS tags": n_broken,
+        "second UUID": n_broken,
+        "unknown UOM": n_broken,
+        "invalid names": n_broken,
+    }
+
+
+def best_of(func, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - t0)
+    return min(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tags", type=int, default=1_000_000)
+    parser.add_argument("--issues", type=float, default=0.001, help="share of tags broken with each kind of issue")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    df = make_tags(args.tags)
+    broken = break_tags(df, args.issues)
+    print(f"{args.tags:,} tags, broken: " + ", ".join(f"{issue} {count:,}" for issue, count in broken.items()))
+
+    options = {"known_uoms": DEFAULT_UOMS}
+    print("\nrules (columns factorized once, shared):")
+    columns = _Columns(df)
+    for rule in RULES:
+        t0 = time.perf_counter()
+        found = sum(int(mask.sum()) for mask, _, _ in rule(columns, options))
+        print(f"  {rule.__name__:<22} {(time.perf_counter() - t0) * 1000:8.1f} ms  {found:8,} issues")
+
+    elapsed, issues = best_of(lambda: validate_tags(df, known_uoms=DEFAULT_UOMS), args.repeat)
+    print(f"\nvalidate_tags: {elapsed * 1000:.0f} ms ({args.tags / elapsed:,.0f} tags/s), {len(issues):,} issues")
+    print(issues.groupby(["Column", "Issue"], sort=False).size().to_string())
+
+    # tags_data and loaded catalogs are kept compact, so their categorical columns come factorized
+    compact = compact_tags(df)
+    elapsed, _ = best_of(lambda: validate_tags(compact, known_uoms=DEFAULT_UOMS), args.repeat)
+    print(f"\nvalidate_tags, compact layout: {elapsed * 1000:.0f} ms ({args.tags / elapsed:,.0f} tags/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""Stress test of concurrent tag_metadata.csv saves from many processes.
+
+Run from the repository root:
+
+    python -m benchmarks.stress_tag_metadata_writers [--writers 8 --saves 25]
+
+Every writer process owns one row of the catalog and repeatedly loads the
+catalog, sets its row's High_Limit to the save number and saves it back. All
+writers also overwrite the same shared cell, so every save races the others.
+Reader processes keep parsing the file meanwhile, and some extra writers are
+killed mid-run to simulate crashes.
+
+With TagMetadataFile (plain and journaled) no update may be lost, every read
+must see a complete catalog and the version stamp must count every save. The
+legacy load / to_csv cycle is run as a baseline and reports its lost updates.
+Finally a torn journal line, as left by a crash mid-append, must not hide the
+saves made after it.
+"""
+
+import argparse
+import itertools
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+
+import pandas as pd
+
+from tag_journal import TagMetadataJournal
+from tag_metadata_file import TagMetadataFile
+
+SHARED_ROW = 0
+
+
+def open_file(csv_path, mode):
+    if mode == "journal":
+        # Small journal so compactions run during the test
+        return TagMetadataFile(csv_path, TagMetadataJournal(csv_path, compact_bytes=4096))
+    return TagMetadataFile(csv_path)
+
+
+def writer(csv_path, mode, row, n_saves, results):
+    """Save n_saves times, or until killed if n_saves is None"""
+    rng = random.Random(row)
+    saved = failed = 0
+    for save in range(n_saves) if n_saves is not None else itertools.count():
+        if mode == "legacy":
+            try:
+                df = pd.read_csv(csv_path)
+                time.sleep(rng.random() * 0.002)
+                df.loc[row, "High_Limit"] = float(save)
+                df.loc[SHARED_ROW, "Low_Limit"] = float(row)
+                df.to_csv(csv_path, index=False)
+            except Exception:
+                # Typically a file truncated by another writer's to_csv
+                failed += 1
+                continue
+        else:
+            tag_file = open_file(csv_path, mode)
+            df, version = tag_file.load()
+            # Widen the window between load and save
+            time.sleep(rng.random() * 0.002)
+            changes = [
+                ([row], {"High_Limit": float(save)}, {"High_Limit": [df.at[row, "High_Limit"]]}),
+                ([SHARED_ROW], {"Low_Limit": float(row)}, {"Low_Limit": [df.at[SHARED_ROW, "Low_Limit"]]}),
+            ]
+            for row_ids, values, _ in changes:
+                df.loc[row_ids, list(values)] = list(values.values())
+            tag_file.save_changes(df, changes, version)
+        saved += 1
+    results.put(("saved", saved, failed))
+
+
+def reader(csv_path, mode, n_rows, stop, results):
+    reads = errors = 0
+    while not stop.is_set():
+        try:
+            if mode == "journal":
+                df, _ = open_file(csv_path, mode).load()
+            else:
+                df = pd.read_csv(csv_path)
+            if len(df) != n_rows:
+                errors += 1
+        except Exception:
+            errors += 1
+        reads += 1
+        time.sleep(0.001)
+    results.put(("reads", reads, errors))
+
+
+def run(mode, n_writers, n_saves, n_readers, n_crashers):
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, "tag_metadata.csv")
+        n_rows = n_writers + n_crashers + 1
+        catalog = pd.DataFrame(
+            {
+                "DCS_Tag": [f"TI-{i}" for i in range(n_rows)],
+                "Low_Limit": 0.0,
+                "High_Limit": -1.0,
+            }
+        )
+        if mode == "legacy":
+            catalog.to_csv(csv_path, index=False)
+        else:
+            open_file(csv_path, mode).replace(catalog)
+
+        results = multiprocessing.Queue()
+        stop = multiprocessing.Event()
+        writers = [
+            multiprocessing.Process(target=writer, args=(csv_path, mode, row, n_saves, results))
+            for row in range(1, n_writers + 1)
+        ]
+        crashers = [
+            multiprocessing.Process(target=writer, args=(csv_path, mode, row, None, results))
+            for row in range(n_writers + 1, n_rows)
+        ]
+        readers = [
+            multiprocessing.Process(target=reader, args=(csv_path, mode, n_rows, stop, results))
+            for _ in range(n_readers)
+        ]
+
+        t0 = time.perf_counter()
+        for process in writers + crashers + readers:
+            process.start()
+        time.sleep(0.5)
+        for process in crashers:
+            process.kill()
+        for process in writers:
+            process.join()
+        stop.set()
+        for process in readers + crashers:
+            process.join()
+        elapsed = time.perf_counter() - t0
+
+        saves = failed_saves = reads = read_errors = 0
+        for _ in range(n_writers + n_readers):
+            kind, a, b = results.get()
+            if kind == "saved":
+                saves += a
+                failed_saves += b
+            else:
+                reads += a
+                read_errors += b
+
+        print(f"\n{mode}: {n_writers} writers x {n_saves} saves, {n_readers} readers, {n_crashers} killed writers")
+        print(f"  {saves} saves in {elapsed:.2f} s ({saves / elapsed:.0f} saves/s), {failed_saves} failed")
+        if mode == "legacy":
+            try:
+                final = pd.read_csv(csv_path)
+            except Exception as e:
+                # A writer killed mid to_csv can leave a truncated file behind
+                print(f"  catalog left unreadable: {e}")
+                return n_writers
+        else:
+            tag_file = open_file(csv_path, mode)
+            final, version = tag_file.load()
+
+        expected = float(n_saves - 1)
+        lost = sum(final.at[row, "High_Limit"] != expected for row in range(1, n_writers + 1))
+        print(f"  writer rows with a lost last update: {lost} of {n_writers}")
+        print(f"  reads: {reads}, incomplete or unparsable: {read_errors}")
+        if mode != "legacy":
+            # Killed writers may have saved any number of times before dying
+            print(f"  version stamp: {version} (at least {saves + 1} saves expected)")
+            leftovers = [name for name in os.listdir(directory) if name.endswith(".tmp")]
+            print(f"  temp files left by killed writers: {len(leftovers)}")
+            assert lost == failed_saves == read_errors == 0 and version[1] >= saves + 1, mode
+        return lost
+
+
+def run_torn_line(n_saves):
+    """Saves after a crash that left a torn last line in the journal must all be kept"""
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, "tag_metadata.csv")
+        catalog = pd.DataFrame({"DCS_Tag": [f"TI-{i}" for i in range(n_saves)], "High_Limit": -1.0})
+        journal = TagMetadataJournal(csv_path)
+        TagMetadataFile(csv_path, journal).replace(catalog)
+        pending = journal.pending_records()
+        with open(journal.journal_path, "a", encoding="utf-8") as f:
+            f.write('{"op": "update", "rows": [0], "val')
+
+        for row in range(n_saves):
+            tag_file = TagMetadataFile(csv_path, journal)
+            df, version = tag_file.load()
+            changes = [([row], {"High_Limit": float(row)}, {"High_Limit": [df.at[row, "High_Limit"]]})]
+            df.loc[[row], "High_Limit"] = float(row)
+            tag_file.save_changes(df, changes, version)
+
+        final, _ = TagMetadataFile(csv_path, journal).load()
+        lost = int((final["High_Limit"] != final.index.astype(float)).sum())
+        print(f"\ntorn journal line: {n_saves} saves after it, {lost} lost, "
+              f"{journal.pending_records() - pending} of them logged")
+        assert lost == 0 and journal.pending_records() == pending + n_saves
+        return lost
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--saves", type=int, default=25)
+    parser.add_argument("--readers", type=int, default=2)
+    parser.add_argument("--crashers", type=int, default=2, help="extra writers killed mid-run")
+    args = parser.parse_args()
+
+    for mode in ("locked", "journal", "legacy"):
+        run(mode, args.writers, args.saves, args.readers, args.crashers)
+    run_torn_line(args.saves)
+
+
+if __name__ == "__main__":
+    main()
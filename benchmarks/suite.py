@@ -0,0 +1,401 @@
+"""Benchmark suite over synthetic plants, with results stored per commit.
+
+Run from the repository root:
+
+    python -m benchmarks.suite [--sizes 10k,100k,1M] [--compare BASE] [--threshold 0.25]
+
+For each size a synthetic plant (benchmarks.synthetic_plant) is generated and
+every case is timed: hierarchy dropdowns (get_unique_values), generic tag
+lookups (description, UUID, tags of an equipment), usage counting
+(update_generic_tags_mapping), upload processing (parse and ingest the plant's
+generic tag files), tag_metadata.csv save/load, and full reruns of each screen
+and button clicks (each must render the page once) through Streamlit's AppTest
+with the plant loaded in the session. The UI helpers wrap TagCatalog methods
+one to one, so they are timed through the catalog; the screens run the real
+app.
+
+Results are written to benchmarks/results/<commit>.json (merged with earlier
+runs of the same commit, so sizes can be run separately). --compare BASE, a
+commit or a results file, prints each metric against BASE and exits with
+status 1 if any is slower by more than --threshold. Timings only compare on
+the same machine, so results are not committed.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from benchmarks.synthetic_plant import generate_tags, generic_tag_files
+from generic_tag_registry import register_generic_tags
+from generic_tag_upload import ingest_generic_tags_batch, mapping_from_file_name, parse_upload
+from hierarchy_index import HIERARCHY_LEVELS, HierarchyIndex
+from tag_catalog import HIERARCHY_COLUMNS, TagCatalog
+from tag_metadata_file import TagMetadataFile
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "manufacturing_tag_config.py")
+SIZES = {"10k": 10_000, "100k": 100_000, "1M": 1_000_000}
+SCREENS = ["welcome", "hierarchy", "tags", "summary", "upload", "edit_tags"]
+
+
+def best_seconds(func, repeat):
+    """Best wall time of repeat calls of func (the least disturbed by the rest of the machine)"""
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def per_call(func, queries, repeat):
+    """Best seconds per call of func(*query) over queries"""
+
+    def run():
+        for query in queries:
+            func(*query)
+
+    return best_seconds(run, repeat) / len(queries)
+
+
+def sample_rows(tags, n, seed=0):
+    rows = tags[HIERARCHY_COLUMNS + ["Generic_Tag", "Tag_Description"]].drop_duplicates()
+    return list(rows.sample(min(n, len(rows)), random_state=seed).itertuples(index=False, name=None))
+
+
+def plant_catalog(tags):
+    """A memory catalog holding a plant's hierarchy and generic tags"""
+    catalog = TagCatalog()
+    catalog.hierarchy_index = HierarchyIndex(tags[HIERARCHY_COLUMNS].drop_duplicates())
+    register_generic_tags(tags, catalog.generic_tag_registry)
+    catalog.set_tags_data(tags)
+    return catalog
+
+
+def bench_unique_values(tags, catalog, options):
+    """get_unique_values: the hierarchy dropdown options at each level"""
+    queries = []
+    for industry, plant, area, equipment, _, _, _ in sample_rows(tags, options.queries):
+        parents = {"Plant": plant, "Area": area, "Equipment": equipment}
+        for depth, level in enumerate(HIERARCHY_LEVELS):
+            queries.append((level, industry, {parent: parents[parent] for parent in HIERARCHY_LEVELS[:depth]}))
+    results = {
+        "hierarchy_index_build": best_seconds(
+            lambda: HierarchyIndex(tags[HIERARCHY_COLUMNS].drop_duplicates()), options.repeat
+        ),
+        "unique_values_call": per_call(
+            lambda level, industry, filters: catalog.unique_values(level, industry=industry, filters=filters),
+            queries,
+            options.repeat,
+        ),
+    }
+    # Assets filtered by their area only (a partial filter walks the tree)
+    partial = [("Asset", industry, {"Area": area}) for industry, _, area, *_ in sample_rows(tags, options.queries)]
+    results["unique_values_partial_filter_call"] = per_call(
+        lambda level, industry, filters: catalog.unique_values(level, industry=industry, filters=filters),
+        partial,
+        options.repeat,
+    )
+    return results
+
+
+def bench_generic_tag_lookups(tags, catalog, options):
+    """get_tag_description_for_generic_tag, get_or_create_uuid_for_generic_tag, get_generic_tags_for_equipment"""
+    queries = [
+        (generic_tag, industry, equipment)
+        for industry, _, _, equipment, _, generic_tag, _ in sample_rows(tags, options.queries)
+    ]
+    return {
+        "tag_description_call": per_call(catalog.tag_description, queries, options.repeat),
+        "resolve_uuid_call": per_call(catalog.resolve_uuid, queries, options.repeat),
+        "generic_tags_for_equipment_call": per_call(
+            catalog.generic_tags_for_equipment, [query[1:] for query in queries], options.repeat
+        ),
+    }
+
+
+def bench_generic_tags_mapping(tags, catalog, options):
+    """update_generic_tags_mapping: one more use of a generic tag"""
+    queries = [
+        (generic_tag, industry, equipment)
+        for industry, _, _, equipment, _, generic_tag, _ in sample_rows(tags, options.queries)
+    ]
+    return {"record_generic_tag_use_call": per_call(catalog.record_generic_tag_use, queries, options.repeat)}
+
+
+def bench_upload(tags, catalog, options):
+    """Upload screen: parse the plant's generic tag files and ingest them into an empty catalog"""
+    uploads = [
+        (file_name, df.to_csv(index=False).encode("utf-8")) for file_name, df in generic_tag_files(tags).items()
+    ]
+    industries = sorted(tags["Industry"].unique())
+    parsed = []
+
+    def parse():
+        parsed[:] = [(file_name, parse_upload(file_name, content)[0]) for file_name, content in uploads]
+
+    def ingest():
+        target = TagCatalog()
+        batches = [(df, *mapping_from_file_name(file_name, industries)) for file_name, df in parsed]
+        ingest_generic_tags_batch(
+            batches, target.generic_tag_registry, target.generic_tags_mapping, target.generic_tags
+        )
+
+    return {
+        "upload_parse": best_seconds(parse, options.repeat),
+        "upload_ingest": best_seconds(ingest, options.repeat),
+    }
+
+
+def bench_csv(tags, catalog, options):
+    """tag_metadata.csv: save the catalog, load it in a new process (parse) and in another session (cached)"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tag_metadata.csv")
+        results = {"csv_save": best_seconds(lambda: TagMetadataFile(path).replace(tags), options.repeat)}
+        results["csv_load"] = best_seconds(lambda: TagMetadataFile(path).load(), options.repeat)
+        tag_file = TagMetadataFile(path)
+        tag_file.load()
+        results["csv_load_cached"] = best_seconds(tag_file.load, options.repeat)
+    return results
+
+
+def plant_app(tags):
+    """The app in AppTest with the plant in its session (run in a directory holding its tag_metadata.csv)"""
+    from streamlit.testing.v1 import AppTest
+
+    # Deprecation notices and session access between reruns would be logged on every rerun
+    for name in ("streamlit.deprecation_util", "streamlit.runtime.scriptrunner_utils.script_run_context"):
+        logging.getLogger(name).disabled = True
+
+    industry, plant, area, equipment, asset = tags[HIERARCHY_COLUMNS].iloc[0].tolist()
+    tags.to_csv("tag_metadata.csv", index=False)
+    at = AppTest.from_file(APP_PATH, default_timeout=600).run()
+    session = at.session_state.catalog
+    for row in tags[HIERARCHY_COLUMNS].drop_duplicates().itertuples(index=False):
+        session.add_hierarchy_path(*row)
+    register_generic_tags(tags, session.generic_tag_registry)
+    session.set_tags_data(tags)
+    at.session_state.selected_industry = industry
+    at.session_state.plant_hierarchy = {"plant": plant, "area": area, "equipment": equipment, "asset": asset}
+    return at
+
+
+def bench_screens(tags, catalog, options):
+    """Full rerun of each screen through AppTest, with the plant in the session and in tag_metadata.csv"""
+    results = {}
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        # The app keeps tag_metadata.csv (and the tag database) in its working directory
+        os.chdir(directory)
+        try:
+            at = plant_app(tags)
+            for screen in SCREENS:
+                at.session_state.page = screen
+                # The first rerun of a screen builds its caches (edit grid, validation report)
+                at.run()
+                if at.exception:
+                    raise RuntimeError(f"{screen} screen: {at.exception[0].value}")
+                results[f"screen_{screen}"] = best_seconds(at.run, options.repeat)
+        finally:
+            os.chdir(cwd)
+    return results
+
+
+def bench_actions(tags, catalog, options):
+    """Clicks through AppTest with the plant loaded: navigation, tree quick-select, the tag form and the edit grid"""
+    _, plant, area, equipment, asset = tags[HIERARCHY_COLUMNS].iloc[0].tolist()
+    results = {}
+
+    def click(at, metric, key=None, label=None):
+        button = next(b for b in at.button if (key and b.key == key) or (label and b.label == label))
+        t0 = time.perf_counter()
+        button.click().run()
+        seconds = time.perf_counter() - t0
+        if at.exception:
+            raise RuntimeError(f"{metric}: {at.exception[0].value}")
+        # Every action is drawn by the one rerun its click triggers
+        if at.session_state.action_reruns != 1:
+            raise RuntimeError(f"{metric}: {at.session_state.action_reruns} reruns")
+        results[metric] = min(results.get(metric, seconds), seconds)
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            at = plant_app(tags)
+            for _ in range(options.repeat):
+                click(at, "action_go_to_hierarchy", key="qa_hierarchy")
+                at.text_input(key="hierarchy_tree_search").input(asset).run()
+                click(at, "action_quick_select", key=f"btn_select_{plant}/{area}/{equipment}/{asset}")
+                click(at, "action_go_to_tags", key="qa_tags")
+                at.text_input(key="dcs_tag_input").input("TI-101")
+                at.text_input(key="raw_param_input").input("Kiln Temperature")
+                at.selectbox(key="generic_tag_select").select("Temperature")
+                at.selectbox(key="uom_select").select("°C").run()
+                click(at, "action_submit", key="submit_section1")
+                at.text_area(key="tag_description_input").input("Kiln temperature").run()
+                click(at, "action_add_tag", label="➕ Add Tag")
+                click(at, "action_delete_tag", key="delete_0")
+                click(at, "action_clear_all", key="clear_all_button")
+                click(at, "action_go_to_edit_tags", key="qa_update_tags")
+                click(at, "action_select_page", key="edit_tags_select_page")
+                click(at, "action_edit_selected", key="edit_selected_tags")
+                click(at, "action_cancel_edit", key="bulk_edit_cancel")
+                click(at, "action_clear_selection", key="edit_tags_clear_selection")
+        finally:
+            os.chdir(cwd)
+    return results
+
+
+CASES = {
+    "unique_values": bench_unique_values,
+    "generic_tag_lookups": bench_generic_tag_lookups,
+    "generic_tags_mapping": bench_generic_tags_mapping,
+    "upload": bench_upload,
+    "csv": bench_csv,
+    "screens": bench_screens,
+    "actions": bench_actions,
+}
+
+
+def git(*args):
+    try:
+        return subprocess.run(["git", *args], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def results_path(name):
+    """Results file of a commit (or the path itself if it is one)"""
+    if os.path.exists(name):
+        return name
+    return os.path.join(RESULTS_DIR, f"{git('rev-parse', '--short', name) or name}.json")
+
+
+def load_results(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_results(sizes):
+    """Merge this run's metrics into the results file of the current commit; returns its path"""
+    import streamlit
+
+    commit = git("rev-parse", "--short", "HEAD") or "unknown"
+    path = os.path.join(RESULTS_DIR, f"{commit}.json")
+    results = load_results(path) if os.path.exists(path) else {"sizes": {}}
+    results.update(
+        {
+            "commit": commit,
+            "subject": git("log", "-1", "--format=%s"),
+            # Uncommitted changes to tracked files were benchmarked too
+            "dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "machine": f"{platform.machine()} {platform.processor()} {os.cpu_count()} CPUs".strip(),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "streamlit": streamlit.__version__,
+            "storage": os.environ.get("TAG_STORAGE", "memory"),
+        }
+    )
+    for size, metrics in sizes.items():
+        results["sizes"].setdefault(size, {}).update(metrics)
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
+    return path
+
+
+def compare(sizes, base, threshold):
+    """Print every metric against the base results; returns the regressions"""
+    print(f"\nvs {base.get('commit', '?')} {base.get('subject', '')} ({base.get('date', '')}):")
+    regressions = []
+    for size, metrics in sizes.items():
+        base_metrics = base["sizes"].get(size, {})
+        for metric, seconds in metrics.items():
+            if metric not in base_metrics:
+                continue
+            ratio = seconds / base_metrics[metric]
+            flag = ""
+            if ratio > 1 + threshold:
+                flag = "  REGRESSION"
+                regressions.append((size, metric, ratio))
+            elif ratio < 1 - threshold:
+                flag = "  faster"
+            print(f"  {size:>5} {metric:<36} {format_seconds(base_metrics[metric]):>10} -> "
+                  f"{format_seconds(seconds):>10}  x{ratio:5.2f}{flag}")
+    return regressions
+
+
+def format_seconds(seconds):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f} ms"
+    return f"{seconds:.2f} s"
+
+
+def parse_sizes(text):
+    sizes = {}
+    for name in text.split(","):
+        name = name.strip()
+        if name in SIZES:
+            sizes[name] = SIZES[name]
+        else:
+            n_tags = int(float(name.lower().rstrip("km")) * {"k": 1e3, "m": 1e6}.get(name[-1].lower(), 1))
+            sizes[name] = n_tags
+    return sizes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10k,100k", help="tags per plant, e.g. 10k,100k,1M (default: %(default)s)")
+    parser.add_argument("--cases", default=",".join(CASES), help="cases to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per metric, the best is kept")
+    parser.add_argument("--queries", type=int, default=1000, help="lookups per call metric")
+    parser.add_argument("--compare", metavar="BASE", help="commit or results file to compare with")
+    parser.add_argument("--threshold", type=float, default=0.25, help="slowdown reported as a regression")
+    parser.add_argument("--no-save", action="store_true", help="do not write benchmarks/results/<commit>.json")
+    args = parser.parse_args()
+
+    cases = [name.strip() for name in args.cases.split(",")]
+    unknown = [name for name in cases if name not in CASES]
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(unknown)} (choose from {', '.join(CASES)})")
+    base = None
+    if args.compare:
+        path = results_path(args.compare)
+        if not os.path.exists(path):
+            parser.error(f"no results for {args.compare} ({path})")
+        base = load_results(path)
+
+    sizes = {}
+    for size, n_tags in parse_sizes(args.sizes).items():
+        t0 = time.perf_counter()
+        tags = generate_tags(n_tags)
+        catalog = plant_catalog(tags)
+        print(f"{size}: {len(tags):,} tags generated and loaded in {time.perf_counter() - t0:.1f} s")
+        metrics = sizes[size] = {}
+        for name in cases:
+            for metric, seconds in CASES[name](tags, catalog, args).items():
+                metrics[metric] = seconds
+                print(f"  {metric:<36} {format_seconds(seconds):>10}")
+
+    if not args.no_save:
+        print(f"\nresults saved to {os.path.relpath(save_results(sizes))}")
+    if base is not None and compare(sizes, base, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
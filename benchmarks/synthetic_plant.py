@@ -0,0 +1,171 @@
+"""Synthetic plants: industries x plants x areas x equipment x assets x tags.
+
+Run from the repository root to write a plant to a directory:
+
+    python -m benchmarks.synthetic_plant --tags 100000 --output synthetic_plant
+
+The directory gets tag_metadata.csv (the catalog, as saved by the Summary
+screen) and generic_tags/<Industry>__<EQUIPMENT>.csv upload files, named so
+the Upload screen maps each file to its industry and equipment. Every tag uses
+one of its equipment's generic tags, with that generic tag's UUID.
+"""
+
+import argparse
+import math
+import os
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from tag_catalog import TAG_COLUMNS
+
+INDUSTRIES = ["Cement", "Aluminum", "Steel", "Tyre", "Paper & Pulp", "Oil & Gas", "Automobile"]
+EQUIPMENT = [
+    "KILN", "COOLER", "RAW_MILL", "COAL_MILL", "CEMENT_MILL", "CRUSHER", "PREHEATER", "BAG_FILTER",
+    "COMPRESSOR", "BOILER", "TURBINE", "FURNACE", "CONVEYOR", "SEPARATOR", "PUMP_HOUSE", "PACKER",
+]
+# Measurement code -> (description, UOM)
+MEASUREMENTS = {
+    "TT": ("temperature", "°C"),
+    "PT": ("pressure", "bar"),
+    "FT": ("flow", "m³/h"),
+    "LT": ("level", "%"),
+    "ST": ("speed", "RPM"),
+    "IT": ("current", "A"),
+    "VT": ("vibration", "mm/s"),
+    "JT": ("power", "kW"),
+}
+# Tags per asset, and assets per equipment for a requested number of tags
+TAGS_PER_ASSET = 10
+GENERIC_TAGS_PER_EQUIPMENT = 40
+
+
+def plant_shape(n_tags, industries=2, plants=5, areas=10, equipment=10):
+    """Hierarchy sizes giving at least n_tags tags, growing the number of assets"""
+    assets = max(math.ceil(n_tags / (industries * plants * areas * equipment * TAGS_PER_ASSET)), 1)
+    return {"industries": industries, "plants": plants, "areas": areas, "equipment": equipment, "assets": assets}
+
+
+def generic_tags(industries, equipment, per_equipment=GENERIC_TAGS_PER_EQUIPMENT, seed=0):
+    """Generic tags of every industry and equipment: Generic_Tag, Code (measurement), UUID, Tag_Description, Industry, Equipment, UOM"""
+    rng = np.random.default_rng(seed)
+    codes = list(MEASUREMENTS)
+    rows = []
+    for industry in INDUSTRIES[:industries]:
+        for equipment_name in EQUIPMENT[:equipment]:
+            for i in range(per_equipment):
+                code = codes[i % len(codes)]
+                description, uom = MEASUREMENTS[code]
+                number = i // len(codes) + 1
+                rows.append(
+                    (
+                        f"{equipment_name}_{code}_{number:02d}",
+                        code,
+                        str(uuid.UUID(bytes=rng.bytes(16), version=4)),
+                        f"{equipment_name.replace('_', ' ').title()} {description} {number}",
+                        industry,
+                        equipment_name,
+                        uom,
+                    )
+                )
+    return pd.DataFrame(rows, columns=["Generic_Tag", "Code", "UUID", "Tag_Description", "Industry", "Equipment", "UOM"])
+
+
+def generate_tags(n_tags, seed=0, **shape):
+    """A tag catalog (TAG_COLUMNS) of n_tags tags over plant_shape(n_tags, **shape)"""
+    shape = plant_shape(n_tags, **shape)
+    catalog = generic_tags(shape["industries"], shape["equipment"], seed=seed)
+    rng = np.random.default_rng(seed + 1)
+
+    # Tag i sits in asset i // TAGS_PER_ASSET; hierarchy positions from the innermost level out
+    tag = np.arange(n_tags)
+    asset = tag // TAGS_PER_ASSET
+    equipment = asset // shape["assets"]
+    area = equipment // shape["equipment"]
+    plant = area // shape["areas"]
+    industry = plant // shape["plants"] % shape["industries"]
+    equipment_name = equipment % shape["equipment"]
+
+    # One of the equipment's generic tags per tag
+    generic = (industry * shape["equipment"] + equipment_name) * GENERIC_TAGS_PER_EQUIPMENT
+    generic = generic + rng.integers(0, GENERIC_TAGS_PER_EQUIPMENT, n_tags)
+    used = catalog.iloc[generic].reset_index(drop=True)
+
+    def numbered(prefix, values, count):
+        # Names from a vocabulary of count names, e.g. "AREA_01"..."AREA_10"
+        return np.array([f"{prefix}{i:02d}" for i in range(1, count + 1)], dtype=object)[values]
+
+    equipment_names = np.array(EQUIPMENT, dtype=object)[equipment_name]
+    low = rng.uniform(0, 100, n_tags).round(1)
+    tags = pd.DataFrame(
+        {
+            "Industry": np.array(INDUSTRIES, dtype=object)[industry],
+            "Plant": numbered("PLANT_", plant % shape["plants"], shape["plants"]),
+            "Area": numbered("AREA_", area % shape["areas"], shape["areas"]),
+            "Equipment": equipment_names,
+            "Asset": numbered("ASSET_", asset % shape["assets"], shape["assets"]),
+            # Unique within a plant, like "A03_KILN_12_TT07"
+            "DCS_Tag": (
+                numbered("A", area % shape["areas"], shape["areas"]) + "_" + equipment_names + "_"
+                + numbered("", asset % shape["assets"], shape["assets"]) + "_"
+                + used["Code"].to_numpy(dtype=object) + numbered("", tag % TAGS_PER_ASSET, TAGS_PER_ASSET)
+            ),
+            "Raw_Parameter": used["Tag_Description"],
+            "Generic_Tag": used["Generic_Tag"],
+            "UUID": used["UUID"],
+            "Tag_Description": used["Tag_Description"],
+            "UOM": used["UOM"],
+            "Low_Low_Limit": low,
+            "Low_Limit": low + 10,
+            "High_Limit": low + 50,
+            "High_High_Limit": low + 60,
+        },
+        columns=TAG_COLUMNS,
+    )
+    return tags
+
+
+def generic_tag_files(tags):
+    """Upload files of the generic tags a catalog uses: {"<Industry>__<EQUIPMENT>.csv": DataFrame}"""
+    used = tags.drop_duplicates(["Industry", "Equipment", "Generic_Tag"])
+    return {
+        f"{industry}__{equipment}.csv": group[["Generic_Tag", "Tag_Description"]]
+        .rename(columns={"Generic_Tag": "Generic Tag", "Tag_Description": "Tag Description"})
+        .reset_index(drop=True)
+        for (industry, equipment), group in used.groupby(["Industry", "Equipment"], sort=True)
+    }
+
+
+def write_plant(directory, tags):
+    """Write tag_metadata.csv and generic_tags/*.csv for a catalog; returns the upload file paths"""
+    os.makedirs(os.path.join(directory, "generic_tags"), exist_ok=True)
+    tags.to_csv(os.path.join(directory, "tag_metadata.csv"), index=False)
+    paths = []
+    for file_name, df in generic_tag_files(tags).items():
+        path = os.path.join(directory, "generic_tags", file_name)
+        df.to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tags", type=int, default=100_000)
+    parser.add_argument("--industries", type=int, default=2, choices=range(1, len(INDUSTRIES) + 1))
+    parser.add_argument("--plants", type=int, default=5, help="plants per industry")
+    parser.add_argument("--areas", type=int, default=10, help="areas per plant")
+    parser.add_argument("--equipment", type=int, default=10, choices=range(1, len(EQUIPMENT) + 1),
+                        help="equipment per area")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="synthetic_plant", help="directory to write (default: %(default)s)")
+    args = parser.parse_args()
+
+    shape = {"industries": args.industries, "plants": args.plants, "areas": args.areas, "equipment": args.equipment}
+    tags = generate_tags(args.tags, seed=args.seed, **shape)
+    paths = write_plant(args.output, tags)
+    print(f"{len(tags):,} tags ({plant_shape(args.tags, **shape)}) and {len(paths)} generic tags files in {args.output}")
+
+
+if __name__ == "__main__":
+    main()
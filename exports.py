@@ -0,0 +1,68 @@
+import io
+import threading
+
+from tag_catalog import plain_columns
+
+
+def to_csv_bytes(df, sheet_name=None):
+    return df.to_csv(index=False).encode("utf-8")
+
+
+def to_json_bytes(df, sheet_name=None):
+    return plain_columns(df).to_json(orient="records", indent=2).encode("utf-8")
+
+
+def to_excel_bytes(df, sheet_name="Sheet1"):
+    """Excel workbook built in memory, so no scratch file is shared between sessions"""
+    with io.BytesIO() as buffer:
+        plain_columns(df).to_excel(buffer, index=False, sheet_name=sheet_name, engine="openpyxl")
+        return buffer.getvalue()
+
+
+# Export format -> (builder, file extension, mime type, download label)
+EXPORT_FORMATS = {
+    "csv": (to_csv_bytes, "csv", "text/csv", "📥 Download CSV"),
+    "xlsx": (
+        to_excel_bytes,
+        "xlsx",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        "📥 Download Excel",
+    ),
+    "json": (to_json_bytes, "json", "application/json", "📥 Download JSON"),
+}
+
+
+class ExportCache:
+    """Export payloads built on demand and memoized per data version
+
+    Only the latest version of each (name, format) payload is kept, so the
+    cache never holds more than one payload per export button.
+    """
+
+    def __init__(self):
+        self._payloads = {}  # (name, format) -> (version, payload)
+        self._lock = threading.Lock()
+
+    def builder(self, name, version, frame, export_format, sheet_name="Sheet1"):
+        """Zero-argument callable that returns the payload, building it only if needed
+
+        Meant for st.download_button(data=...), which calls it when the button is
+        clicked, on a thread outside the script run. frame may also be a
+        zero-argument callable, so large frames are only loaded on a click.
+        """
+        build_payload = EXPORT_FORMATS[export_format][0]
+        key = (name, export_format)
+
+        def build():
+            with self._lock:
+                cached = self._payloads.get(key)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+
+            df = frame() if callable(frame) else frame
+            payload = build_payload(df, sheet_name=sheet_name)
+            with self._lock:
+                self._payloads[key] = (version, payload)
+            return payload
+
+        return build
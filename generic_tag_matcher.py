@@ -0,0 +1,169 @@
+import math
+import re
+
+import numpy as np
+
+# Length of the character n-grams indexed for every token
+GRAM_SIZE = 3
+# Weight of grams that only occur in a generic tag's description
+DESCRIPTION_WEIGHT = 0.5
+# Score bonus of generic tags already available for the tag's equipment (or industry)
+EQUIPMENT_PRIOR = 0.15
+# Candidates scoring below this are not suggested
+MIN_SCORE = 0.1
+# Score cells (queries x generic tags) computed at once by match_many
+BLOCK_CELLS = 1000
+
+_TOKEN = re.compile(r"[A-Z]+|[0-9]+")
+_VOWELS = re.compile(r"(?<!^)[AEIOU]")
+
+
+def tokens(text):
+    """Letter and digit runs of a tag name or description, upper-cased, numbers without leading zeros"""
+    return [token.lstrip("0") or "0" if token.isdigit() else token for token in _TOKEN.findall(str(text).upper())]
+
+
+def grams(text):
+    """Character n-grams of each token padded with "#", plus the start of its consonant skeleton (KILN -> KLN)"""
+    found = set()
+    for token in tokens(text):
+        padded = f"#{token}#"
+        found.update(padded[i:i + GRAM_SIZE] for i in range(max(len(padded) - GRAM_SIZE + 1, 1)))
+        if token.isalpha() and len(token) > 1:
+            found.add("~" + _VOWELS.sub("", token)[:2])
+    return found
+
+
+class GenericTagMatcher:
+    """Ranks generic tags by idf-weighted cosine similarity over a character n-gram inverted index"""
+
+    def __init__(self, entries=()):
+        self._tags = []
+        self._ids = {}
+        # gram -> candidate ids and weights, as lists while growing
+        self._postings = {}
+        self._weights = {}
+        # gram -> (ids array, weights array), rebuilt only for grams that changed
+        self._arrays = {}
+        # Number of name grams per candidate, the candidate's vector norm
+        self._sizes = []
+        self._norms = None
+        self.add_many(entries)
+
+    def __len__(self):
+        return len(self._tags)
+
+    def __contains__(self, generic_tag):
+        return generic_tag in self._ids
+
+    def add(self, generic_tag, tag_description=""):
+        """Index a generic tag; returns False if it was already indexed"""
+        if not generic_tag or generic_tag in self._ids:
+            return False
+        tag_id = len(self._tags)
+        self._tags.append(generic_tag)
+        self._ids[generic_tag] = tag_id
+
+        name_grams = grams(generic_tag)
+        weighted = dict.fromkeys(name_grams, 1.0)
+        for gram in grams(tag_description or ""):
+            weighted.setdefault(gram, DESCRIPTION_WEIGHT)
+        for gram, weight in weighted.items():
+            self._postings.setdefault(gram, []).append(tag_id)
+            self._weights.setdefault(gram, []).append(weight)
+            self._arrays.pop(gram, None)
+        self._sizes.append(max(len(name_grams), 1))
+        self._norms = None
+        return True
+
+    def add_many(self, entries):
+        """Index (generic tag, description) pairs; returns the number of pairs read"""
+        n_entries = 0
+        for generic_tag, tag_description in entries:
+            self.add(generic_tag, tag_description)
+            n_entries += 1
+        return n_entries
+
+    def _posting(self, gram):
+        arrays = self._arrays.get(gram)
+        if arrays is None:
+            arrays = (
+                np.array(self._postings[gram], dtype=np.int32),
+                np.array(self._weights[gram], dtype=np.float32),
+            )
+            self._arrays[gram] = arrays
+        return arrays
+
+    def _query(self, text):
+        """Postings and idf weights of the indexed grams of a query text"""
+        postings = [self._posting(gram) for gram in grams(text) if gram in self._postings]
+        n_tags = len(self._tags)
+        return postings, [math.log((n_tags + 1) / len(ids)) + 1.0 for ids, _ in postings]
+
+    def _scores(self, queries):
+        """Similarity of every generic tag to each query, as a (queries, generic tags) array"""
+        n_tags = len(self._tags)
+        if self._norms is None:
+            self._norms = np.sqrt(np.array(self._sizes, dtype=np.float32))
+
+        ids, weights, idfs, query_norms = [], [], [], []
+        for row, (postings, query_idfs) in enumerate(queries):
+            for posting_ids, posting_weights in postings:
+                ids.append(posting_ids + row * n_tags)
+                weights.append(posting_weights)
+            idfs.extend(query_idfs)
+            query_norms.append(math.sqrt(sum(idf * idf for idf in query_idfs)) or 1.0)
+        if not ids:
+            return np.zeros((len(queries), n_tags))
+
+        weights = np.concatenate(weights) * np.repeat(np.array(idfs, dtype=np.float32), [len(part) for part in ids])
+        scores = np.bincount(np.concatenate(ids), weights, minlength=len(queries) * n_tags)
+        scores = scores.reshape(len(queries), n_tags)
+        scores /= self._norms
+        scores /= np.array(query_norms)[:, None]
+        return scores
+
+    def _match_block(self, queries, limit, preferred_ids):
+        scores = self._scores(queries)
+        if len(preferred_ids):
+            # Only candidates that match the text at all get the prior
+            prior = scores[:, preferred_ids]
+            scores[:, preferred_ids] = prior + EQUIPMENT_PRIOR * (prior > 0)
+
+        # The limit best candidates of each query, by descending score
+        if limit < scores.shape[1]:
+            top = np.argpartition(-scores, limit, axis=1)[:, :limit]
+        else:
+            top = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+        values = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-values, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1).tolist()
+        values = np.take_along_axis(values, order, axis=1).tolist()
+        return [
+            [(self._tags[column], round(value, 3)) for column, value in zip(columns, row_values) if value >= MIN_SCORE]
+            for columns, row_values in zip(top, values)
+        ]
+
+    def _preferred_ids(self, preferred):
+        return np.array([self._ids[tag] for tag in preferred if tag in self._ids], dtype=np.intp)
+
+    def match(self, text, limit=5, preferred=()):
+        """Best (generic tag, score) pairs for a DCS tag and/or raw parameter text, preferred ones ranked higher"""
+        if not self._tags:
+            return []
+        return self._match_block([self._query(text)], limit, self._preferred_ids(preferred))[0]
+
+    def match_many(self, texts, limit=5, preferred=()):
+        """match() for many texts with the same preferred generic tags, scored in blocks"""
+        texts = list(texts)
+        if not self._tags:
+            return [[] for _ in texts]
+        preferred_ids = self._preferred_ids(preferred)
+        unique_texts = list(dict.fromkeys(texts))
+        block_size = max(BLOCK_CELLS // len(self._tags), 1)
+        found = {}
+        for start in range(0, len(unique_texts), block_size):
+            block = unique_texts[start:start + block_size]
+            matches = self._match_block([self._query(text) for text in block], limit, preferred_ids)
+            found.update(zip(block, matches))
+        return [found[text] for text in texts]
@@ -0,0 +1,219 @@
+from datetime import datetime
+
+from append_store import AppendStore
+
+GENERIC_TAG_COLUMNS = ["Generic_Tag", "UUID", "Tag_Description", "Industry", "Equipment"]
+MAPPING_COLUMNS = ["Generic_Tag", "Industry", "Equipment", "Count", "Last_Updated"]
+# Columns of the generic tag frames kept categorical, since their values repeat
+GENERIC_TAG_CATEGORY_COLUMNS = ["Generic_Tag", "Industry", "Equipment"]
+
+
+class GenericTagRegistry:
+    """Available generic tags with dictionary indexes for constant-time lookups"""
+
+    def __init__(self, frame=None):
+        self._store = AppendStore(GENERIC_TAG_COLUMNS, frame, GENERIC_TAG_CATEGORY_COLUMNS)
+        self._rebuild_indexes()
+
+    def __len__(self):
+        return len(self._store)
+
+    @property
+    def empty(self):
+        return self._store.empty
+
+    @property
+    def frame(self):
+        """DataFrame view of the available generic tags"""
+        return self._store.frame
+
+    @property
+    def version(self):
+        """Change counter of the available generic tags"""
+        return self._store.version
+
+    def _rebuild_indexes(self):
+        """Rebuild all indexes from the stored rows"""
+        # (Generic_Tag, Industry, Equipment) -> first matching row
+        self._by_tag_equipment = {}
+        # (Generic_Tag, Industry) -> first matching row
+        self._by_tag_industry = {}
+        # (Industry, Equipment) and Industry -> generic tags in first-seen order
+        self._tags_by_equipment = {}
+        self._tags_by_industry = {}
+
+        rows = zip(
+            self._store.column("Generic_Tag"),
+            self._store.column("Industry"),
+            self._store.column("Equipment"),
+        )
+        for row, (generic_tag, industry, equipment) in enumerate(rows):
+            self._index_row(row, generic_tag, industry, equipment)
+
+    def _index_row(self, row, generic_tag, industry, equipment):
+        """Register a single row in every index, keeping the first occurrence"""
+        self._by_tag_equipment.setdefault((generic_tag, industry, equipment), row)
+        self._by_tag_industry.setdefault((generic_tag, industry), row)
+        self._tags_by_equipment.setdefault((industry, equipment), {}).setdefault(generic_tag)
+        self._tags_by_industry.setdefault(industry, {}).setdefault(generic_tag)
+
+    def find(self, generic_tag, industry, equipment):
+        """Row for a generic tag: exact equipment match first, then industry only"""
+        row = self._by_tag_equipment.get((generic_tag, industry, equipment))
+        if row is None:
+            row = self._by_tag_industry.get((generic_tag, industry))
+        return row
+
+    def contains(self, generic_tag, industry, equipment):
+        """Check whether the exact generic tag, industry and equipment combination exists"""
+        return (generic_tag, industry, equipment) in self._by_tag_equipment
+
+    def get(self, generic_tag, industry, equipment, column, default=""):
+        """Value of a column for a generic tag, using the same fallback as find()"""
+        row = self.find(generic_tag, industry, equipment)
+        if row is None:
+            return default
+        return self._store.get(row, column)
+
+    def tags_for_equipment(self, industry, equipment):
+        """Generic tags for an industry and equipment, falling back to the industry"""
+        tags = self._tags_by_equipment.get((industry, equipment))
+        if not tags:
+            tags = self._tags_by_industry.get(industry)
+        return list(tags) if tags else []
+
+    def industries(self):
+        """Sorted industries that have generic tags"""
+        return sorted(self._tags_by_industry)
+
+    def equipment_for(self, industry):
+        """Sorted equipment that has generic tags in an industry"""
+        return sorted({eq for ind, eq in self._tags_by_equipment if ind == industry})
+
+    def descriptions(self, start=0):
+        """(Generic_Tag, Tag_Description) of the entries from position start on, in insertion order"""
+        return list(zip(self._store.column("Generic_Tag")[start:], self._store.column("Tag_Description")[start:]))
+
+    def rows_for(self, industry, equipment):
+        """Generic tags of an industry and equipment as a DataFrame"""
+        frame = self.frame
+        return frame[(frame["Industry"] == industry) & (frame["Equipment"] == equipment)]
+
+    def add(self, generic_tag, tag_uuid, tag_description, industry, equipment):
+        """Append a single generic tag"""
+        self._index_row(len(self._store), generic_tag, industry, equipment)
+        self._store.append(
+            {
+                "Generic_Tag": generic_tag,
+                "UUID": tag_uuid,
+                "Tag_Description": tag_description,
+                "Industry": industry,
+                "Equipment": equipment,
+            }
+        )
+
+    def add_many(self, entries):
+        """Append several generic tag entries (dicts keyed by GENERIC_TAG_COLUMNS)"""
+        for entry in entries:
+            self._index_row(
+                len(self._store),
+                entry["Generic_Tag"],
+                entry["Industry"],
+                entry["Equipment"],
+            )
+            self._store.append(entry)
+
+    def add_columns(self, columns):
+        """Append generic tags given column-wise as a dict of equally long lists"""
+        start = len(self._store)
+        rows = zip(columns["Generic_Tag"], columns["Industry"], columns["Equipment"])
+        for offset, (generic_tag, industry, equipment) in enumerate(rows):
+            self._index_row(start + offset, generic_tag, industry, equipment)
+        self._store.extend_columns(columns)
+
+    def update_description(self, generic_tag, industry, equipment, tag_description):
+        """Update the tag description of an exact match; returns False if there is none"""
+        row = self._by_tag_equipment.get((generic_tag, industry, equipment))
+        if row is None:
+            return False
+        self._store.set(row, "Tag_Description", tag_description)
+        return True
+
+
+def register_generic_tags(tags, registry):
+    """Add the generic tags used by a tags DataFrame that the registry does not have
+
+    Only the first tag with a UUID of each generic tag, industry and equipment
+    combination is added; existing entries are never changed, since generic tags
+    are immutable once created with their UUID. Returns the number of entries added.
+    """
+    candidates = tags[(tags["Generic_Tag"].fillna("") != "") & (tags["UUID"].fillna("") != "")]
+    candidates = candidates.drop_duplicates(["Generic_Tag", "Industry", "Equipment"])
+    rows = zip(
+        candidates["Generic_Tag"].tolist(),
+        candidates["UUID"].tolist(),
+        candidates["Tag_Description"].tolist(),
+        candidates["Industry"].tolist(),
+        candidates["Equipment"].tolist(),
+    )
+    added = 0
+    for generic_tag, tag_uuid, tag_description, industry, equipment in rows:
+        if not registry.contains(generic_tag, industry, equipment):
+            registry.add(generic_tag, tag_uuid, tag_description, industry, equipment)
+            added += 1
+    return added
+
+
+class GenericTagMapping:
+    """Usage count of each generic tag per industry and equipment"""
+
+    def __init__(self, frame=None):
+        self._store = AppendStore(MAPPING_COLUMNS, frame)
+        # (Generic_Tag, Industry, Equipment) -> row
+        self._rows = {}
+        rows = zip(
+            self._store.column("Generic_Tag"),
+            self._store.column("Industry"),
+            self._store.column("Equipment"),
+        )
+        for row, key in enumerate(rows):
+            self._rows.setdefault(key, row)
+
+    def __len__(self):
+        return len(self._store)
+
+    @property
+    def empty(self):
+        return self._store.empty
+
+    @property
+    def frame(self):
+        """DataFrame view of the generic tags mapping"""
+        return self._store.frame
+
+    def record(self, generic_tag, industry, equipment):
+        """Add a new mapping with count 1 or increment the count of an existing one"""
+        self.record_counts([(generic_tag, 1)], industry, equipment)
+
+    def record_counts(self, counts, industry, equipment):
+        """Upsert (generic_tag, count) pairs for one industry and equipment"""
+        last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        for generic_tag, count in counts:
+            key = (generic_tag, industry, equipment)
+            row = self._rows.get(key)
+
+            if row is None:
+                self._rows[key] = len(self._store)
+                self._store.append(
+                    {
+                        "Generic_Tag": generic_tag,
+                        "Industry": industry,
+                        "Equipment": equipment,
+                        "Count": count,
+                        "Last_Updated": last_updated,
+                    }
+                )
+            else:
+                self._store.set(row, "Count", self._store.get(row, "Count") + count)
+                self._store.set(row, "Last_Updated", last_updated)
@@ -0,0 +1,453 @@
+import hashlib
+import io
+import multiprocessing
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+
+from rerun_profile import profiled
+
+REQUIRED_COLUMNS = ["Generic Tag", "Tag Description"]
+# Rows parsed and ingested per chunk when streaming an uploaded file
+CHUNK_ROWS = 50_000
+# Total size of parsed uploads kept in the cache
+UPLOAD_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# Files up to this size are fully parsed in the background once uploaded;
+# larger files are only streamed when they are processed
+BACKGROUND_PARSE_MAX_BYTES = 50 * 1024 * 1024
+# Worker processes parsing multi-file uploads
+UPLOAD_PARSE_PROCESSES = min(os.cpu_count() or 1, 8)
+
+
+def _estimate_size(value):
+    """Approximate memory footprint of a cached value in bytes"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, (tuple, list)):
+        return sum(_estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class ParsedUploadCache:
+    """Process-wide LRU cache of parsed uploads keyed by content hash, bounded by total size
+
+    Cached values are shared and must not be modified.
+    """
+
+    def __init__(self, max_bytes=UPLOAD_CACHE_MAX_BYTES, max_workers=2):
+        self.max_bytes = max_bytes
+        self._max_workers = max_workers
+        self._entries = OrderedDict()  # key -> (value, size)
+        self._total_bytes = 0
+        self._pending = {}  # key -> Future of a background parse
+        self._digests = OrderedDict()  # uploaded file id -> content digest
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def digest(self, file):
+        """Content hash of an uploaded file, memoized per upload"""
+        file_id = getattr(file, "file_id", None)
+        with self._lock:
+            if file_id is not None and file_id in self._digests:
+                self._digests.move_to_end(file_id)
+                return self._digests[file_id]
+
+        content_hash = hashlib.blake2b(file.getbuffer(), digest_size=20).hexdigest()
+
+        if file_id is not None:
+            with self._lock:
+                self._digests[file_id] = content_hash
+                while len(self._digests) > 128:
+                    self._digests.popitem(last=False)
+        return content_hash
+
+    def get(self, key):
+        """Cached value for a key, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value):
+        """Cache a value, evicting the least recently used entries over budget"""
+        size = _estimate_size(value)
+        with self._lock:
+            if key in self._entries:
+                self._total_bytes -= self._entries.pop(key)[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self._total_bytes += size
+            while self._total_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_size
+
+    def get_or_compute(self, key, compute):
+        """Cached value for a key, computing and caching it on a miss"""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def submit(self, key, compute):
+        """Compute a value in a background thread unless it is cached or running"""
+        with self._lock:
+            if key in self._entries or key in self._pending:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="upload-parse"
+                )
+            future = self._executor.submit(compute)
+            self._pending[key] = future
+        future.add_done_callback(lambda done: self._finish(key, done))
+
+    def _finish(self, key, future):
+        with self._lock:
+            self._pending.pop(key, None)
+        if future.exception() is None:
+            self.put(key, future.result())
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+            self._digests.clear()
+
+
+upload_cache = ParsedUploadCache()
+
+
+def is_csv(file_name):
+    """Check whether an uploaded file is a CSV file (anything else is Excel)"""
+    return file_name.lower().endswith(".csv")
+
+
+def is_streamable_excel(file_name):
+    """Check whether an Excel file can be streamed with openpyxl (.xlsx / .xlsm)"""
+    return file_name.lower().endswith((".xlsx", ".xlsm"))
+
+
+def missing_required_columns(columns):
+    """Required columns that are not present in a file header"""
+    return [col for col in REQUIRED_COLUMNS if col not in columns]
+
+
+def _iter_excel_rows(file):
+    """Stream (row tuple, sheet row count) for the first worksheet in openpyxl's read-only mode"""
+    import openpyxl
+
+    file.seek(0)
+    workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        total_rows = sheet.max_row or 0
+        for row in sheet.iter_rows(values_only=True):
+            # Read-only sheets can report trailing empty rows
+            if any(value is not None for value in row):
+                yield row, total_rows
+    finally:
+        workbook.close()
+
+
+@profiled("io")
+def read_header(file, file_name):
+    """Column names of an uploaded file, read from the header row only"""
+    file.seek(0)
+    if is_csv(file_name):
+        return pd.read_csv(file, nrows=0).columns.tolist()
+    if not is_streamable_excel(file_name):
+        return pd.read_excel(file, nrows=0).columns.tolist()
+
+    for row, _ in _iter_excel_rows(file):
+        return [str(value) if value is not None else "" for value in row]
+    return []
+
+
+@profiled("io")
+def read_preview(file, file_name, n_rows=10):
+    """First rows of an uploaded file, without parsing the rest of it"""
+    file.seek(0)
+    if is_csv(file_name):
+        return pd.read_csv(file, nrows=n_rows)
+    if not is_streamable_excel(file_name):
+        return pd.read_excel(file, nrows=n_rows)
+
+    header = None
+    rows = []
+    for row, _ in _iter_excel_rows(file):
+        if header is None:
+            header = [str(value) if value is not None else "" for value in row]
+            continue
+        rows.append(row)
+        if len(rows) >= n_rows:
+            break
+    return pd.DataFrame(rows, columns=header)
+
+
+def iter_chunks(file, file_name, chunk_rows=CHUNK_ROWS):
+    """Stream the required columns of an uploaded file in chunks of chunk_rows rows
+
+    Yields (chunk DataFrame, fraction of the file processed so far).
+    """
+    if is_csv(file_name):
+        file_size = file.seek(0, io.SEEK_END) or 1
+        file.seek(0)
+        reader = pd.read_csv(file, usecols=REQUIRED_COLUMNS, chunksize=chunk_rows)
+        with reader:
+            for chunk in reader:
+                yield chunk, min(file.tell() / file_size, 1.0)
+        return
+
+    if not is_streamable_excel(file_name):
+        # Legacy .xls files cannot be streamed, parse them in one go
+        file.seek(0)
+        df = pd.read_excel(file, usecols=REQUIRED_COLUMNS)
+        for start in range(0, len(df), chunk_rows):
+            yield df.iloc[start:start + chunk_rows], min((start + chunk_rows) / len(df), 1.0)
+        return
+
+    positions = None
+    columns = {col: [] for col in REQUIRED_COLUMNS}
+    n_rows = 0
+    for row, total_rows in _iter_excel_rows(file):
+        n_rows += 1
+        if positions is None:
+            header = [str(value) if value is not None else "" for value in row]
+            positions = [header.index(col) for col in REQUIRED_COLUMNS]
+            continue
+
+        for col, position in zip(REQUIRED_COLUMNS, positions):
+            columns[col].append(row[position] if position < len(row) else None)
+
+        if len(columns[REQUIRED_COLUMNS[0]]) >= chunk_rows:
+            yield pd.DataFrame(columns), min(n_rows / total_rows, 1.0) if total_rows else 0.0
+            columns = {col: [] for col in REQUIRED_COLUMNS}
+
+    if columns[REQUIRED_COLUMNS[0]]:
+        yield pd.DataFrame(columns), 1.0
+
+
+def _cache_key(cache, file, file_name, *options):
+    """Cache key for an uploaded file: content hash, file type and parse options"""
+    file_type = "csv" if is_csv(file_name) else file_name.rsplit(".", 1)[-1].lower()
+    return (cache.digest(file), file_type) + options
+
+
+@profiled("io")
+def inspect_upload(file, file_name, n_rows=10, cache=upload_cache):
+    """Header columns, missing required columns and preview rows of an upload, cached by file content"""
+
+    def parse():
+        columns = read_header(file, file_name)
+        return columns, missing_required_columns(columns), read_preview(file, file_name, n_rows)
+
+    return cache.get_or_compute(_cache_key(cache, file, file_name, "inspect", n_rows), parse)
+
+
+def parse_required_columns(file, file_name):
+    """Parse the required columns of a whole file into one DataFrame"""
+    chunks = [chunk for chunk, _ in iter_chunks(file, file_name)]
+    if not chunks:
+        return pd.DataFrame(columns=REQUIRED_COLUMNS)
+    return pd.concat(chunks, ignore_index=True)
+
+
+@profiled("io")
+def prefetch_upload(file, file_name, cache=upload_cache):
+    """Start parsing a small enough upload in the background"""
+    if len(file.getbuffer()) > BACKGROUND_PARSE_MAX_BYTES:
+        return
+    key = _cache_key(cache, file, file_name, "frame", tuple(REQUIRED_COLUMNS))
+    # The background thread reads its own copy so it never races the preview
+    content = io.BytesIO(file.getvalue())
+    cache.submit(key, lambda: parse_required_columns(content, file_name))
+
+
+@profiled("io")
+def parsed_upload(file, file_name, cache=upload_cache):
+    """Fully parsed required columns of an upload if the background parse is done"""
+    return cache.get(_cache_key(cache, file, file_name, "frame", tuple(REQUIRED_COLUMNS)))
+
+
+def ingest_generic_tags_batch(batches, registry, mapping, generic_tags):
+    """Add every row of several (DataFrame, industry, equipment) uploads as available generic tags
+
+    Rows without a generic tag are skipped. registry, mapping and generic_tags are
+    updated in place. Returns (rows processed, elapsed seconds).
+    """
+    start = time.perf_counter()
+    # Rows without a generic tag are dropped before anything is updated
+    valid_batches = []
+    for df, industry, equipment in batches:
+        tags = df["Generic Tag"]
+        has_tag = tags.notna() & (tags.astype(str).str.strip() != "")
+        valid_batches.append((tags[has_tag].astype(str), df.loc[has_tag, "Tag Description"], industry, equipment))
+
+    columns = {column: [] for column in ("Generic_Tag", "UUID", "Tag_Description", "Industry", "Equipment")}
+    known_tags = set(generic_tags)
+    new_tags = {}
+
+    for tags, descriptions, industry, equipment in valid_batches:
+        n_rows = len(tags)
+        if n_rows == 0:
+            continue
+
+        # Usage count per generic tag in first-seen order, upserted into the mapping
+        counts = tags.groupby(tags, sort=False).size()
+        mapping.record_counts(
+            ((generic_tag, int(count)) for generic_tag, count in counts.items()),
+            industry,
+            equipment,
+        )
+        new_tags.update((tag, None) for tag in counts.index if tag not in known_tags)
+
+        # Batch UUID assignment, one per uploaded row
+        columns["Generic_Tag"].extend(tags.tolist())
+        columns["UUID"].extend(str(uuid.uuid4()) for _ in range(n_rows))
+        columns["Tag_Description"].extend(descriptions.tolist())
+        columns["Industry"].extend([industry] * n_rows)
+        columns["Equipment"].extend([equipment] * n_rows)
+
+    if not columns["UUID"]:
+        return 0, 0.0
+    if new_tags:
+        generic_tags.extend(new_tags)
+        generic_tags.sort()
+    registry.add_columns(columns)
+
+    return len(columns["UUID"]), time.perf_counter() - start
+
+
+def ingest_generic_tags(df, industry, equipment, registry, mapping, generic_tags):
+    """Add every row of one uploaded generic tags file, see ingest_generic_tags_batch"""
+    return ingest_generic_tags_batch([(df, industry, equipment)], registry, mapping, generic_tags)
+
+
+def mapping_from_file_name(file_name, industries):
+    """(industry or None, equipment) named by an uploaded file's name, like Cement__KILN.xlsx or KILN.xlsx"""
+    stem = os.path.splitext(os.path.basename(file_name))[0].strip()
+    industry = None
+    if "__" in stem:
+        prefix, rest = stem.split("__", 1)
+        industry = next((name for name in industries if name.lower() == prefix.strip().lower()), None)
+        if industry is not None:
+            stem = rest
+    equipment = re.sub(r"[^A-Z0-9_]+", "_", stem.upper()).strip("_")
+    return industry, equipment
+
+
+def parse_upload(file_name, content):
+    """Parse and validate the required columns of an uploaded file's content in an upload worker
+
+    Returns (DataFrame, None), or (None, error message) if the file is not valid.
+    """
+    file = io.BytesIO(content)
+    try:
+        missing = missing_required_columns(read_header(file, file_name))
+        if missing:
+            return None, f"Missing required columns: {', '.join(missing)}"
+        return parse_required_columns(file, file_name), None
+    except Exception as e:
+        return None, f"Error reading file: {e}"
+
+
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+
+def _upload_process_pool():
+    """Process-wide pool of upload parsing workers, started on first use"""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            # Spawned rather than forked, since the app server runs threads
+            _process_pool = ProcessPoolExecutor(
+                max_workers=UPLOAD_PARSE_PROCESSES, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _process_pool
+
+
+@profiled("io")
+def parse_uploads(uploads, on_progress=None):
+    """Parse (file name, content) uploads in parallel worker processes
+
+    Returns (DataFrame or None, error or None) per upload, in uploads order.
+    on_progress(files done, files) is called as files finish.
+    """
+    uploads = list(uploads)
+    if len(uploads) <= 1:
+        return [parse_upload(file_name, content) for file_name, content in uploads]
+
+    global _process_pool
+    pool = _upload_process_pool()
+    results = [None] * len(uploads)
+    done = 0
+    try:
+        futures = {
+            pool.submit(parse_upload, file_name, content): i for i, (file_name, content) in enumerate(uploads)
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+            done += 1
+            if on_progress is not None:
+                on_progress(done, len(uploads))
+    except BrokenProcessPool:
+        # A worker died (e.g. out of memory); start a new pool next time and parse the rest here
+        with _process_pool_lock:
+            if _process_pool is pool:
+                _process_pool = None
+        for i, (file_name, content) in enumerate(uploads):
+            if results[i] is None:
+                results[i] = parse_upload(file_name, content)
+                done += 1
+                if on_progress is not None:
+                    on_progress(done, len(uploads))
+    return results
+
+
+def ingest_generic_tags_file(
+    file,
+    file_name,
+    industry,
+    equipment,
+    registry,
+    mapping,
+    generic_tags,
+    on_progress=None,
+    chunk_rows=CHUNK_ROWS,
+    cache=None,
+):
+    """Stream an uploaded file, or its frame parsed in the background, through ingest_generic_tags
+
+    on_progress(fraction, rows so far) is called after every chunk. Returns
+    (rows processed, elapsed seconds including parsing).
+    """
+    start = time.perf_counter()
+    parsed = parsed_upload(file, file_name, cache) if cache is not None else None
+    if parsed is not None:
+        chunks = (
+            (parsed.iloc[begin:begin + chunk_rows], min((begin + chunk_rows) / len(parsed), 1.0))
+            for begin in range(0, len(parsed), chunk_rows)
+        )
+    else:
+        chunks = iter_chunks(file, file_name, chunk_rows)
+
+    n_rows = 0
+    for chunk, fraction in chunks:
+        rows, _ = ingest_generic_tags(chunk, industry, equipment, registry, mapping, generic_tags)
+        n_rows += rows
+        if on_progress is not None:
+            on_progress(fraction, n_rows)
+    return n_rows, time.perf_counter() - start
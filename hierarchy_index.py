@@ -0,0 +1,182 @@
+from bisect import insort
+
+HIERARCHY_LEVELS = ["Plant", "Area", "Equipment", "Asset"]
+
+
+class SortedSet:
+    """Set of names that is always iterated in sorted order"""
+
+    __slots__ = ("_items", "_members")
+
+    def __init__(self):
+        self._items = []
+        self._members = set()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __contains__(self, value):
+        return value in self._members
+
+    def add(self, value):
+        """Insert a value in sorted position; returns False if it was already present"""
+        if value in self._members:
+            return False
+        insort(self._items, value)
+        self._members.add(value)
+        return True
+
+    def slice(self, start, stop):
+        """Values between two positions in sorted order"""
+        return self._items[start:stop]
+
+    def tolist(self):
+        return list(self._items)
+
+
+class _Node:
+    """One level of the hierarchy: sorted child names and their sub-trees"""
+
+    __slots__ = ("names", "children")
+
+    def __init__(self):
+        self.names = SortedSet()
+        self.children = {}
+
+    def child(self, name):
+        """Sub-tree for a child name, created if missing"""
+        node = self.children.get(name)
+        if node is None:
+            node = _Node()
+            self.children[name] = node
+            self.names.add(name)
+        return node
+
+
+class HierarchyIndex:
+    """Nested Industry -> Plant -> Area -> Equipment -> Asset index
+
+    Children of every node are kept in sorted sets, so dropdown options and the
+    hierarchy tree are read without filtering or sorting the hierarchy data.
+    """
+
+    def __init__(self, frame=None):
+        self._roots = {}  # industry -> _Node of plants
+        self._level_names = {}  # (industry, level) -> SortedSet of all names at that level
+        self._size = 0
+
+        if frame is not None and not frame.empty:
+            rows = zip(
+                frame["Industry"].tolist(),
+                *(frame[level].tolist() for level in HIERARCHY_LEVELS),
+            )
+            for row in rows:
+                self.add(*row)
+
+    def __len__(self):
+        """Number of distinct Industry/Plant/Area/Equipment/Asset paths"""
+        return self._size
+
+    def add(self, industry, plant, area, equipment, asset):
+        """Add a hierarchy path; returns False if it already existed"""
+        node = self._roots.get(industry)
+        if node is None:
+            node = self._roots[industry] = _Node()
+
+        path = (plant, area, equipment, asset)
+        for level, name in zip(HIERARCHY_LEVELS, path):
+            names = self._level_names.get((industry, level))
+            if names is None:
+                names = self._level_names[(industry, level)] = SortedSet()
+            names.add(name)
+
+        for name in path[:-1]:
+            node = node.child(name)
+        if asset in node.children:
+            return False
+        node.child(asset)
+        self._size += 1
+        return True
+
+    def names(self, industry, *path):
+        """Sorted set of child names under a path (empty path -> plants), or None"""
+        node = self._roots.get(industry)
+        for name in path:
+            if node is None:
+                return None
+            node = node.children.get(name)
+        return node.names if node is not None else None
+
+    def children(self, industry, *path):
+        """Sorted child names under a path (empty path -> plants)"""
+        names = self.names(industry, *path)
+        return names.tolist() if names is not None else []
+
+    def search(self, industry, text, limit=None):
+        """Full paths of an industry where any level name contains text (case-insensitive)
+
+        Paths are returned in sorted order, stopping after limit matches.
+        """
+        text = text.lower()
+        matches = []
+
+        def walk(node, path, matched):
+            for name in node.names:
+                child_path = path + (name,)
+                child_matched = matched or text in str(name).lower()
+                if len(child_path) == len(HIERARCHY_LEVELS):
+                    if child_matched:
+                        matches.append(child_path)
+                else:
+                    walk(node.children[name], child_path, child_matched)
+                if limit is not None and len(matches) >= limit:
+                    return
+
+        root = self._roots.get(industry)
+        if root is not None:
+            walk(root, (), False)
+        return matches[:limit] if limit is not None else matches
+
+    def values(self, level, industry=None, filters=None):
+        """Sorted unique names at a level, optionally filtered by industry and parent names
+
+        Mirrors filtering the hierarchy DataFrame: empty filter values are ignored.
+        """
+        depth = HIERARCHY_LEVELS.index(level)
+        filters = filters or {}
+        parents = [filters.get(parent) for parent in HIERARCHY_LEVELS[:depth]]
+
+        if industry:
+            # Every parent given: the children of a single node
+            if all(parents):
+                return self.children(industry, *parents)
+            # No parent given: all names at that level in the industry
+            if not any(parents):
+                names = self._level_names.get((industry, level))
+                return names.tolist() if names is not None else []
+            roots = [self._roots[industry]] if industry in self._roots else []
+        else:
+            roots = list(self._roots.values())
+
+        # Partial filters: walk the tree, descending only into filtered names
+        result = set()
+
+        def walk(node, level_idx):
+            if level_idx == depth:
+                result.update(node.names)
+                return
+            wanted = parents[level_idx]
+            if wanted:
+                child = node.children.get(wanted)
+                if child is not None:
+                    walk(child, level_idx + 1)
+            else:
+                for child in node.children.values():
+                    walk(child, level_idx + 1)
+
+        for root in roots:
+            walk(root, 0)
+        return sorted(result)
@@ -1,6 +1,148 @@
-def main():
-    print("Hello from tag-configuration!")
+"""Headless batch jobs on the tag catalog, without starting Streamlit.
+
+    python main.py import-generic-tags FILE... --industry Cement --equipment KILN
+    python main.py load-tags FILE... [--industry Cement]
+    python main.py validate [--report issues.csv] [--uom UOM...]
+    python main.py export --format csv|json|xlsx [--output PATH] [--generic-tags-only]
+
+The catalog is the one the app uses, picked with the same TAG_STORAGE and
+TAG_DB_PATH environment variables (or --storage / --db). Input files are parsed
+in parallel worker processes (--jobs).
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime
+
+from exports import EXPORT_FORMATS
+from tag_batch import BatchStore, export_frame, import_generic_tags, load_point_lists
+from tag_catalog import DEFAULT_UOMS
+from tag_validation import validate_tags
+
+# Issues printed by validate (all of them go to --report)
+MAX_PRINTED_ISSUES = 20
+
+
+class ValidationFailed(Exception):
+    def __init__(self, issues):
+        super().__init__(f"{len(issues)} validation issues")
+        self.issues = issues
+
+
+def print_issues(issues, report=None):
+    """Summarize validation issues by column and problem, optionally saving all of them"""
+    if report is not None:
+        issues.to_csv(report, index=False)
+    if issues.empty:
+        print("No issues found")
+        return
+    summary = issues.groupby(["Column", "Issue"], sort=False).size()
+    print(f"{len(issues):,} issues:")
+    for (column, issue), count in summary.items():
+        print(f"  {column}: {issue} ({count:,})")
+    print(issues.head(MAX_PRINTED_ISSUES).to_string(index=False))
+    if len(issues) > MAX_PRINTED_ISSUES:
+        print(f"... {len(issues) - MAX_PRINTED_ISSUES:,} more" + (f", see {report}" if report else ""))
+
+
+def import_generic_tags_command(store, args):
+    counts, elapsed = import_generic_tags(store, args.files, args.industry, args.equipment, args.jobs)
+    for path, count in zip(args.files, counts):
+        print(f"{path}: {count:,} generic tags")
+    total = sum(counts)
+    print(f"Imported {total:,} generic tags for {args.industry} - {args.equipment} "
+          f"from {len(counts)} files in {elapsed:.2f}s ({total / elapsed if elapsed else total:,.0f} rows/s)")
+
+
+def load_tags_command(store, args):
+    def check(tags):
+        issues = validate_tags(tags)
+        if not issues.empty and not args.force:
+            raise ValidationFailed(issues)
+
+    try:
+        tags, elapsed = load_point_lists(store, args.files, args.industry, args.jobs, check)
+    except ValidationFailed as e:
+        print_issues(e.issues, args.report)
+        print("Nothing was saved, fix the point lists or use --force", file=sys.stderr)
+        return 1
+    print(f"Loaded {len(tags):,} tags from {len(args.files)} files in {elapsed:.2f}s "
+          f"({len(tags) / elapsed if elapsed else len(tags):,.0f} tags/s)")
+    return 0
+
+
+def validate_command(store, args):
+    issues = validate_tags(store.tags(), known_uoms=DEFAULT_UOMS + args.uom)
+    print_issues(issues, args.report)
+    return 1 if not issues.empty else 0
+
+
+def export_command(store, args):
+    if args.generic_tags_only:
+        df = store.generic_tags()
+        prefix, sheet_name = "available_generic_tags", "Generic Tags"
+    else:
+        df = store.tags()
+        prefix, sheet_name = "tags_config", "Tags"
+
+    extension = EXPORT_FORMATS[args.format][1]
+    output = args.output or f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+    export_frame(df, output, args.format, sheet_name=sheet_name)
+    print(f"Exported {len(df):,} rows to {output}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--storage", choices=["memory", "journal", "sqlite"],
+                        default=os.environ.get("TAG_STORAGE", "memory"),
+                        help="catalog backend, as TAG_STORAGE for the app (default: %(default)s)")
+    parser.add_argument("--catalog", default="tag_metadata.csv", help="tag catalog CSV (default: %(default)s)")
+    parser.add_argument("--db", default=os.environ.get("TAG_DB_PATH", "tag_catalog.db"),
+                        help="tag database with --storage sqlite (default: %(default)s)")
+    parser.add_argument("--generic-tags", default="available_generic_tags.csv",
+                        help="available generic tags CSV, unless --storage sqlite (default: %(default)s)")
+    parser.add_argument("--jobs", type=int, default=None, help="parser processes (default: one per CPU)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("import-generic-tags", help="add generic tags files for an industry and equipment")
+    command.add_argument("files", nargs="+", help="CSV or Excel files with 'Generic Tag' and 'Tag Description' columns")
+    command.add_argument("--industry", required=True)
+    command.add_argument("--equipment", required=True)
+    command.set_defaults(run=import_generic_tags_command)
+
+    command = commands.add_parser("load-tags", help="add or replace tags from DCS point lists")
+    command.add_argument("files", nargs="+",
+                         help="CSV or Excel files with tag_metadata.csv columns; Plant, Area, Equipment, "
+                              "Asset and DCS_Tag are required")
+    command.add_argument("--industry", help="industry of rows without one")
+    command.add_argument("--force", action="store_true", help="save even if the tags do not validate")
+    command.add_argument("--report", help="write all validation issues to this CSV")
+    command.set_defaults(run=load_tags_command)
+
+    command = commands.add_parser("validate", help="check the whole tag catalog")
+    command.add_argument("--report", help="write all issues to this CSV")
+    command.add_argument("--uom", action="append", default=[],
+                         help="UOM to accept besides the app's default list (repeatable)")
+    command.set_defaults(run=validate_command)
+
+    command = commands.add_parser("export", help="export the tag catalog like the Summary screen")
+    command.add_argument("--format", choices=list(EXPORT_FORMATS), default="csv")
+    command.add_argument("--output", help="output file (default: timestamped name in the current directory)")
+    command.add_argument("--generic-tags-only", action="store_true", help="export the available generic tags instead")
+    command.set_defaults(run=export_command)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    store = BatchStore(args.storage, args.catalog, args.db, args.generic_tags)
+    try:
+        return args.run(store, args) or 0
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
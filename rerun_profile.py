@@ -0,0 +1,128 @@
+"""Optional per-rerun timing of the app's screens, helpers and file I/O
+
+Turned on with TAG_PROFILE=1 (read once, when the app starts). Functions
+decorated with @profiled then add their wall time and call count to the
+profile of the rerun running on the current thread, and every finished rerun
+is appended to a JSONL trace (TAG_PROFILE_TRACE). When profiling is off,
+profiled returns the function itself, so decorated code runs unchanged.
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from functools import wraps
+
+PROFILING = os.environ.get("TAG_PROFILE", "") not in ("", "0")
+TRACE_PATH = os.environ.get("TAG_PROFILE_TRACE", "rerun_trace.jsonl")
+
+
+class _RerunLocal(threading.local):
+    # Profile of the rerun running on each script thread
+    profile = None
+
+
+_local = _RerunLocal()
+_trace_lock = threading.Lock()
+
+
+class RerunProfile:
+    """Wall time and call count per profiled function during one rerun
+
+    Times are inclusive: a screen's time includes the helpers and I/O it calls.
+    """
+
+    def __init__(self, page):
+        self.page = page
+        self.started = datetime.now()
+        self.seconds = None
+        self._start = time.perf_counter()
+        # name -> [kind, calls, seconds]
+        self.calls = {}
+
+    def record(self, name, kind, seconds):
+        entry = self.calls.get(name)
+        if entry is None:
+            self.calls[name] = [kind, 1, seconds]
+        else:
+            entry[1] += 1
+            entry[2] += seconds
+
+    def finish(self):
+        self.seconds = time.perf_counter() - self._start
+
+    def rows(self):
+        """(name, kind, calls, milliseconds) by descending time"""
+        rows = [(name, kind, calls, seconds * 1000) for name, (kind, calls, seconds) in self.calls.items()]
+        return sorted(rows, key=lambda row: row[3], reverse=True)
+
+    def to_record(self):
+        return {
+            "time": self.started.isoformat(timespec="milliseconds"),
+            "page": self.page,
+            "ms": round(self.seconds * 1000, 3),
+            "calls": {
+                name: {"kind": kind, "calls": calls, "ms": round(ms, 3)} for name, kind, calls, ms in self.rows()
+            },
+        }
+
+
+def start_rerun(page):
+    """Start profiling the rerun running on this thread"""
+    profile = RerunProfile(page)
+    _local.profile = profile
+    return profile
+
+
+def finish_rerun(trace_path=None):
+    """Stop profiling this thread's rerun and append it to the trace; returns its profile"""
+    profile = _local.profile
+    if profile is None:
+        return None
+    _local.profile = None
+    profile.finish()
+    line = json.dumps(profile.to_record()) + "\n"
+    with _trace_lock:
+        with open(trace_path or TRACE_PATH, "a", encoding="utf-8") as f:
+            f.write(line)
+    return profile
+
+
+def _timed(func, name, kind):
+    @wraps(func)
+    def timed(*args, **kwargs):
+        profile = _local.profile
+        if profile is None:
+            if kind != "fragment":
+                return func(*args, **kwargs)
+            # A fragment rerunning on its own (without the script) is profiled as a rerun of its own
+            start_rerun(name)
+            try:
+                return timed(*args, **kwargs)
+            finally:
+                finish_rerun()
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.record(name, kind, time.perf_counter() - start)
+
+    return timed
+
+
+def profiled(kind, name=None):
+    """Decorator recording a function's time in the current rerun's profile
+
+    kind groups the functions in the report ("screen", "sidebar", "fragment",
+    "helper", "io", "import"); name defaults to the function's qualified name.
+    A "fragment" called outside a rerun (a fragment rerun) records its own
+    rerun, named after it.
+    """
+
+    def decorate(func):
+        if not PROFILING:
+            return func
+        return _timed(func, name or func.__qualname__, kind)
+
+    return decorate
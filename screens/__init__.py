@@ -0,0 +1,38 @@
+"""Screens of the tag configuration app, one module per page
+
+A page's module is imported the first time a session is routed to it, so the
+app starts and reruns without loading the screens (and their dependencies,
+like pandas) it does not show.
+"""
+
+import importlib
+import sys
+
+from rerun_profile import profiled
+
+# Page -> (module, screen function)
+SCREENS = {
+    "welcome": ("screens.welcome", "welcome_screen"),
+    "hierarchy": ("screens.hierarchy", "plant_hierarchy_screen"),
+    "tags": ("screens.tags", "tags_configuration_screen"),
+    "summary": ("screens.summary", "summary_screen"),
+    "upload": ("screens.upload", "upload_generic_tags_screen"),
+    "edit_tags": ("screens.edit_tags", "edit_tags_screen"),
+}
+
+
+@profiled("import", name="import screen")
+def _import_screen(module_name):
+    return importlib.import_module(module_name)
+
+
+def load_screen(page):
+    """Screen function of a page, importing its module on first use; None for an unknown page"""
+    if page not in SCREENS:
+        return None
+    module_name, function_name = SCREENS[page]
+    # Looked up in sys.modules on every rerun, so a module reloaded after an edit is picked up
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = _import_screen(module_name)
+    return getattr(module, function_name)
@@ -0,0 +1,210 @@
+"""Session state, storage backend and helpers shared by the screens
+
+Imported by every screen, so it stays free of pandas: a session that only
+shows the Welcome or Plant Hierarchy screen never loads it.
+"""
+
+import streamlit as st
+import os
+from functools import wraps
+
+from exports import ExportCache
+from rerun_profile import profiled
+from tag_catalog import TagCatalog
+
+# Storage backend: "memory" keeps tags in session DataFrames and tag_metadata.csv,
+# "journal" saves only the changes to a log next to tag_metadata.csv (compacted
+# in the background), "sqlite" keeps tags, hierarchy and generic tags in a
+# database shared by all sessions
+TAG_STORAGE = os.environ.get("TAG_STORAGE", "memory")
+TAG_DB_PATH = os.environ.get("TAG_DB_PATH", "tag_catalog.db")
+
+if TAG_STORAGE == "sqlite":
+    from sqlite_store import open_database
+
+# Industries list
+INDUSTRIES = [
+    "🏢 Cement",
+    "⚙️ Aluminum",
+    "🔩 Steel",
+    "🛞 Tyre",
+    "📄 Paper & Pulp",
+    "🛢️ Oil & Gas",
+    "🚙 Automobile",
+]
+
+
+@profiled("io")
+def tag_database():
+    """Process-wide SQLite tag database, or None with the memory backend"""
+    if TAG_STORAGE != "sqlite":
+        return None
+    # tag_metadata.csv is imported the first time the database is opened
+    return open_database(TAG_DB_PATH, migrate_csv="tag_metadata.csv")
+
+
+def init_session_state():
+    """Default session state of a new session (run once per session)"""
+    if "page" not in st.session_state:
+        st.session_state.page = "welcome"
+    if "selected_industry" not in st.session_state:
+        st.session_state.selected_industry = None
+    if "plant_hierarchy" not in st.session_state:
+        st.session_state.plant_hierarchy = {
+            "plant": "",
+            "area": "",
+            "equipment": "",
+            "asset": "",
+        }
+    # Tags, hierarchy, generic tags and UOMs of this session (in the tag database if configured)
+    if "catalog" not in st.session_state:
+        st.session_state.catalog = TagCatalog(tag_database())
+    if "selected_hierarchy_path" not in st.session_state:
+        st.session_state.selected_hierarchy_path = None
+    # Export payloads built on demand and memoized per data version
+    if "export_cache" not in st.session_state:
+        st.session_state.export_cache = ExportCache()
+    # Track if user selected "+ Add New" for generic tag
+    if "show_new_generic_tag" not in st.session_state:
+        st.session_state.show_new_generic_tag = False
+    # Track if user selected "+ Add New" for UOM
+    if "show_new_uom" not in st.session_state:
+        st.session_state.show_new_uom = False
+    # Track tag input values for clearing
+    if "clear_tag_inputs" not in st.session_state:
+        st.session_state.clear_tag_inputs = False
+    # Track the last visited page to detect page changes
+    if "last_page" not in st.session_state:
+        st.session_state.last_page = None
+    # Track if first section of tag form has been submitted
+    if "tag_form_submitted" not in st.session_state:
+        st.session_state.tag_form_submitted = False
+    # Renders (whole page, or a fragment on its own) in this session and since the last user action
+    if "reruns" not in st.session_state:
+        st.session_state.reruns = 0
+        st.session_state.last_action = None
+        st.session_state.action_reruns = 0
+    # Set while main() renders the whole page, and by callbacks of fragment widgets that change other regions
+    if "page_running" not in st.session_state:
+        st.session_state.page_running = False
+        st.session_state.page_rerun_requested = False
+    st.session_state.session_initialized = True
+
+
+def user_action(func):
+    """Decorator for widget callbacks: the renders that follow count as this action's
+
+    A callback runs before the rerun its widget triggers, so state changed
+    there is drawn by that one rerun; st.session_state.action_reruns counts
+    the renders since the last action.
+    """
+
+    @wraps(func)
+    def callback(*args, **kwargs):
+        st.session_state.last_action = func.__name__
+        st.session_state.action_reruns = 0
+        return func(*args, **kwargs)
+
+    return callback
+
+
+def count_rerun():
+    """Count a render of the whole page or of a fragment on its own"""
+    st.session_state.reruns += 1
+    st.session_state.action_reruns += 1
+
+
+def request_page_rerun():
+    """Redraw the whole page rather than the fragment, from the callback of a widget in a fragment"""
+    st.session_state.page_rerun_requested = True
+
+
+def fragment_rerun():
+    """First call in a fragment: counts a fragment rerun, or turns it into the requested page rerun"""
+    if st.session_state.page_running:
+        return
+    if st.session_state.page_rerun_requested:
+        # Before the fragment draws anything, so the action still renders once
+        st.rerun()
+    count_rerun()
+
+
+@user_action
+def go_to_page(page):
+    """Switch to another page (button callback)"""
+    st.session_state.page = page
+
+
+@profiled("helper")
+def update_generic_tags_mapping(generic_tag, industry, equipment):
+    """Update or add generic tag mapping with industry and equipment"""
+    st.session_state.catalog.record_generic_tag_use(generic_tag, industry, equipment)
+
+
+@profiled("helper")
+def get_generic_tags_for_equipment(industry, equipment):
+    """Get available generic tags based on industry and equipment from uploaded data"""
+    return st.session_state.catalog.generic_tags_for_equipment(industry, equipment)
+
+
+@profiled("helper")
+def match_generic_tags(dcs_tag, raw_parameter, industry, equipment):
+    """Generic tags ranked by similarity to a DCS tag and raw parameter"""
+    return st.session_state.catalog.match_generic_tags(f"{dcs_tag} {raw_parameter}", industry, equipment)
+
+
+@profiled("helper")
+def get_tag_description_for_generic_tag(generic_tag, industry, equipment):
+    """Get tag description for a specific generic tag based on industry and equipment"""
+    return st.session_state.catalog.tag_description(generic_tag, industry, equipment)
+
+
+@profiled("helper")
+def get_or_create_uuid_for_generic_tag(generic_tag, industry, equipment, tag_description=""):
+    """Get existing UUID or create a new one for a generic tag"""
+    return st.session_state.catalog.resolve_uuid(generic_tag, industry, equipment, tag_description)
+
+
+@profiled("helper")
+def set_tags_data(df):
+    """Replace tags_data and mark its cached exports as stale"""
+    st.session_state.catalog.set_tags_data(df)
+
+
+@profiled("sidebar")
+def quick_actions_sidebar():
+    """Display expandable quick actions sidebar available on all pages"""
+    with st.sidebar:
+        st.markdown("### 🚀 Quick Actions")
+        st.markdown("---")
+
+        # Navigation buttons
+        st.button("🏠 Home", use_container_width=True, key="qa_home", on_click=go_to_page, args=("welcome",))
+        st.button("🏭 Plant Hierarchy", use_container_width=True, key="qa_hierarchy", on_click=go_to_page, args=("hierarchy",))
+        st.button(
+            "📝 Configure New Tags", use_container_width=True, key="qa_tags",
+            disabled=(st.session_state.page == "welcome"), on_click=go_to_page, args=("tags",),
+        )
+        st.button("📊 View Summary", use_container_width=True, key="qa_summary", on_click=go_to_page, args=("summary",))
+        st.button(
+            "✏️ Update Tags Metadata", use_container_width=True, key="qa_update_tags",
+            on_click=go_to_page, args=("edit_tags",),
+        )
+
+        st.markdown("---")
+
+        # Upload action
+        st.button(
+            "📤 Upload Generic Tags", use_container_width=True, type="primary", key="qa_upload",
+            on_click=go_to_page, args=("upload",),
+        )
+
+        st.markdown("---")
+
+        # Statistics (if data available)
+        if st.session_state.catalog.tag_count():
+            st.markdown("### 📈 Statistics")
+            st.metric("Industries", st.session_state.catalog.tags_data["Industry"].nunique())
+            st.metric("Plants", st.session_state.catalog.tags_data["Plant"].nunique())
+            st.metric("Total Tags", len(st.session_state.catalog.tags_data))
+            st.metric("Generic Tags", len(st.session_state.catalog.generic_tags))
@@ -0,0 +1,659 @@
+"""Edit Existing Tags screen: paged grid, single and bulk edits of the saved catalog"""
+
+import streamlit as st
+import pandas as pd
+import sqlite3
+import uuid
+
+from generic_tag_registry import register_generic_tags
+from rerun_profile import profiled
+from screens.common import (
+    get_generic_tags_for_equipment,
+    get_tag_description_for_generic_tag,
+    go_to_page,
+    quick_actions_sidebar,
+    set_tags_data,
+    tag_database,
+    user_action,
+)
+from screens.storage import tag_metadata
+from tag_catalog import plain_columns, set_tag_values
+from tag_metadata_file import CatalogReplacedError
+
+
+# Edit tags grid: page sizes, columns shown per row, and fields editable in bulk
+EDIT_GRID_PAGE_SIZES = [25, 50, 100]
+EDIT_GRID_COLUMNS = ["DCS_Tag", "Raw_Parameter", "Generic_Tag", "Equipment", "UOM"]
+BULK_EDIT_FIELDS = {
+    "UOM": "UOM",
+    "Low-Low Limit": "Low_Low_Limit",
+    "Low Limit": "Low_Limit",
+    "High Limit": "High_Limit",
+    "High-High Limit": "High_High_Limit",
+    "Industry": "Industry",
+    "Plant": "Plant",
+    "Area": "Area",
+    "Equipment": "Equipment",
+    "Asset": "Asset",
+}
+
+
+@profiled("helper")
+def clear_tag_selection():
+    """Clear the selected rows of the edit grid"""
+    st.session_state.selected_tag_ids = set()
+    # A new grid key drops the checkbox state held by the data editor
+    st.session_state.edit_grid_version = st.session_state.get("edit_grid_version", 0) + 1
+
+
+@user_action
+def set_edit_tags_page(page):
+    """Show another page of the edit grid (button callback)"""
+    st.session_state.edit_tags_page = page
+
+
+@user_action
+def select_edit_tags(row_ids):
+    """Add rows to the selection of the edit grid (button callback)"""
+    st.session_state.selected_tag_ids.update(row_ids)
+    st.session_state.edit_grid_version += 1
+
+
+@user_action
+def clear_edit_tags_selection():
+    """Clear the selected rows of the edit grid (button callback)"""
+    clear_tag_selection()
+
+
+@user_action
+def edit_selected_tags():
+    """Open the edit form of the selected tag, or the bulk form for several (button callback)"""
+    selected_ids = st.session_state.selected_tag_ids
+    if len(selected_ids) == 1:
+        st.session_state.editing_tag_index = next(iter(selected_ids))
+        st.session_state.bulk_edit_ids = None
+    else:
+        st.session_state.editing_tag_index = None
+        st.session_state.bulk_edit_ids = sorted(selected_ids)
+
+
+@user_action
+def cancel_bulk_edit():
+    """Close the bulk edit form (button callback)"""
+    st.session_state.bulk_edit_ids = None
+
+
+@user_action
+def cancel_tag_edit():
+    """Close the edit form of a tag, discarding its changes (button callback)"""
+    st.session_state.editing_tag_index = None
+    st.session_state.edit_form_values = {}
+
+
+@profiled("helper")
+def load_edit_tags_page(offset, limit):
+    """One page of the tags being edited, indexed by row id"""
+    db = tag_database()
+    if db is not None:
+        return plain_columns(db.tags_frame(offset, limit))
+    return plain_columns(st.session_state.edit_tags_df.iloc[offset:offset + limit])
+
+
+@profiled("helper")
+def read_edit_tag(tag_id):
+    """A single tag being edited as a Series, or None if it no longer exists"""
+    db = tag_database()
+    if db is not None:
+        return db.tag(tag_id)
+    return plain_columns(st.session_state.edit_tags_df.loc[[tag_id]]).iloc[0]
+
+
+@profiled("helper")
+def write_edit_tags(tag_ids, values):
+    """Set column values on tags being edited; the database commits them immediately"""
+    db = tag_database()
+    if db is not None:
+        db.update_tags(tag_ids, values)
+    else:
+        df = st.session_state.edit_tags_df
+        tag_ids = list(tag_ids)
+        old_values = {
+            column: df.loc[tag_ids, column].tolist() if column in df.columns else [None] * len(tag_ids)
+            for column in values
+        }
+        set_tag_values(df, tag_ids, values)
+        # Kept until Update & Save, which saves (and if needed merges) only these changes
+        st.session_state.edit_tags_changes.append((tag_ids, values, old_values))
+
+
+@profiled("helper")
+def edit_tags_grid(n_tags):
+    """Display one page of tags with selection checkboxes and edit actions"""
+    if "edit_tags_page" not in st.session_state:
+        st.session_state.edit_tags_page = 0
+    if "edit_grid_version" not in st.session_state:
+        st.session_state.edit_grid_version = 0
+
+    selected_ids = st.session_state.selected_tag_ids
+
+    # Pagination controls
+    col_size, col_prev, col_page, col_next = st.columns([2, 1, 2, 1])
+    with col_size:
+        page_size = st.selectbox(
+            "Rows per page", EDIT_GRID_PAGE_SIZES, key="edit_tags_page_size"
+        )
+    n_pages = max(1, -(-n_tags // page_size))
+    page = min(st.session_state.edit_tags_page, n_pages - 1)
+    with col_prev:
+        st.button(
+            "◀ Prev", key="edit_tags_prev", disabled=page == 0, use_container_width=True,
+            on_click=set_edit_tags_page, args=(page - 1,),
+        )
+    with col_page:
+        st.markdown(f"Page **{page + 1}** of **{n_pages}**")
+    with col_next:
+        st.button(
+            "Next ▶", key="edit_tags_next", disabled=page == n_pages - 1, use_container_width=True,
+            on_click=set_edit_tags_page, args=(page + 1,),
+        )
+
+    # Only the rows of the current page are loaded and rendered
+    page_df = load_edit_tags_page(page * page_size, page_size)
+    grid_columns = [col for col in EDIT_GRID_COLUMNS if col in page_df.columns]
+    grid_df = page_df[grid_columns]
+    grid_df.insert(0, "Select", [row_id in selected_ids for row_id in page_df.index])
+
+    edited = st.data_editor(
+        grid_df,
+        key=f"edit_grid_{page}_{page_size}_{st.session_state.edit_grid_version}",
+        use_container_width=True,
+        disabled=grid_columns,
+        column_config={"Select": st.column_config.CheckboxColumn("Select", width="small")},
+    )
+
+    # Sync the selection of this page back into the set of selected row ids
+    for row_id, is_selected in zip(page_df.index, edited["Select"].tolist()):
+        if is_selected:
+            selected_ids.add(row_id)
+        else:
+            selected_ids.discard(row_id)
+
+    with st.expander("📊 View All Columns (current page)", expanded=False):
+        st.dataframe(page_df, use_container_width=True, hide_index=True)
+
+    # Selection actions
+    col_count, col_page_select, col_clear, col_edit = st.columns([2, 1, 1, 2])
+    with col_count:
+        st.markdown(f"**{len(selected_ids)}** of {n_tags} tags selected")
+    with col_page_select:
+        st.button(
+            "☑️ Select Page", key="edit_tags_select_page", use_container_width=True,
+            on_click=select_edit_tags, args=(list(page_df.index),),
+        )
+    with col_clear:
+        st.button(
+            "✖️ Clear", key="edit_tags_clear_selection", use_container_width=True, on_click=clear_edit_tags_selection
+        )
+    with col_edit:
+        st.button(
+            f"✏️ Edit Selected ({len(selected_ids)})",
+            key="edit_selected_tags",
+            type="primary",
+            disabled=not selected_ids,
+            use_container_width=True,
+            on_click=edit_selected_tags,
+        )
+
+
+@profiled("helper")
+def bulk_edit_tags_form(row_ids):
+    """Apply the same field values to several selected tags in one update"""
+    st.subheader(f"✏️ Editing {len(row_ids)} Tags")
+
+    fields = st.multiselect(
+        "Fields to update",
+        list(BULK_EDIT_FIELDS),
+        key="bulk_edit_fields",
+        help="Only the chosen fields are changed, all other values of the selected tags are kept",
+    )
+
+    values = {}
+    for field in fields:
+        column = BULK_EDIT_FIELDS[field]
+        if column == "UOM":
+            values[column] = st.selectbox(field, [""] + st.session_state.catalog.uom_list, key=f"bulk_edit_{column}")
+        elif column.endswith("_Limit"):
+            values[column] = st.number_input(field, value=0.0, format="%.2f", key=f"bulk_edit_{column}")
+        else:
+            values[column] = st.text_input(field, key=f"bulk_edit_{column}")
+
+    col_apply, col_cancel = st.columns(2)
+    with col_apply:
+        if st.button(
+            f"💾 Apply to {len(row_ids)} Tags",
+            type="primary",
+            use_container_width=True,
+            key="bulk_edit_apply",
+            disabled=not values,
+        ):
+            if values.get("UOM", "x") == "":
+                st.error("⚠️ Please select a UOM")
+            else:
+                try:
+                    # Single vectorized update (or transaction) for every selected row
+                    write_edit_tags(row_ids, values)
+                except sqlite3.IntegrityError:
+                    st.error("⚠️ The update would give two tags the same hierarchy and DCS Tag")
+                else:
+                    st.session_state.bulk_edit_ids = None
+                    clear_tag_selection()
+                    st.session_state.edit_tags_notice = f"✅ {len(row_ids)} tags updated successfully!"
+                    st.rerun()
+    with col_cancel:
+        st.button("❌ Cancel", use_container_width=True, key="bulk_edit_cancel", on_click=cancel_bulk_edit)
+
+
+@profiled("screen")
+def edit_tags_screen():
+    """Display edit existing tags screen"""
+    quick_actions_sidebar()
+
+    # Track current page
+    st.session_state.last_page = "edit_tags"
+
+    st.title("✏️ Edit Existing Tags")
+    st.markdown("---")
+
+    # Result of an edit applied on the previous run
+    if "edit_tags_notice" in st.session_state:
+        st.success(st.session_state.pop("edit_tags_notice"))
+
+    # Initialize session state for edit mode
+    if "edit_tags_df" not in st.session_state:
+        st.session_state.edit_tags_df = pd.DataFrame()
+    if "selected_tag_ids" not in st.session_state:
+        st.session_state.selected_tag_ids = set()
+    if "editing_tag_index" not in st.session_state:
+        st.session_state.editing_tag_index = None
+    if "bulk_edit_ids" not in st.session_state:
+        st.session_state.bulk_edit_ids = None
+    # Unsaved (row ids, new values, old values) changes made to edit_tags_df
+    if "edit_tags_changes" not in st.session_state:
+        st.session_state.edit_tags_changes = []
+    # Version stamp of tag_metadata.csv when edit_tags_df was loaded
+    if "edit_tags_version" not in st.session_state:
+        st.session_state.edit_tags_version = (0, 0)
+
+    # Load tags from tag_metadata.csv, or page them from the tag database
+    db = tag_database()
+
+    if db is not None or tag_metadata().exists():
+        # Load fresh data from CSV (with journaled changes replayed on top) and its version stamp
+        if db is None and (st.session_state.edit_tags_df.empty or st.button("🔄 Refresh Data", key="refresh_csv")):
+            st.session_state.edit_tags_df, st.session_state.edit_tags_version = tag_metadata().load()
+            st.session_state.edit_tags_changes = []
+            clear_tag_selection()
+            st.session_state.editing_tag_index = None
+            st.session_state.bulk_edit_ids = None
+
+        n_tags = db.count_tags() if db is not None else len(st.session_state.edit_tags_df)
+        source_name = "tag database" if db is not None else "tag_metadata.csv"
+
+        # Drop an edit of a tag that was removed from the database meanwhile
+        if st.session_state.editing_tag_index is not None and read_edit_tag(st.session_state.editing_tag_index) is None:
+            st.session_state.editing_tag_index = None
+
+        if n_tags:
+            st.subheader(f"📋 Tags from {source_name} ({n_tags} records)")
+
+            # Paginated grid with row selection (only the current page is rendered)
+            edit_tags_grid(n_tags)
+
+            st.markdown("---")
+
+            # Bulk edit form - shown when several tags are selected for editing
+            if st.session_state.bulk_edit_ids:
+                bulk_edit_tags_form(st.session_state.bulk_edit_ids)
+
+            # Edit form - shown when a tag is selected for editing
+            if st.session_state.editing_tag_index is not None:
+                idx = st.session_state.editing_tag_index
+                row = read_edit_tag(idx)
+
+                st.subheader(f"✏️ Editing Tag: {row.get('DCS_Tag', 'N/A')}")
+
+                # Initialize edit form values in session state if not present
+                if "edit_form_values" not in st.session_state:
+                    st.session_state.edit_form_values = {}
+
+                # Initialize values for this editing session
+                if st.session_state.edit_form_values.get("editing_idx") != idx:
+                    current_industry = str(row.get('Industry', ''))
+                    current_equipment = str(row.get('Equipment', ''))
+                    st.session_state.edit_form_values = {
+                        "editing_idx": idx,
+                        "dcs_tag": str(row.get('DCS_Tag', '')),
+                        "raw_parameter": str(row.get('Raw_Parameter', '')),
+                        "generic_tag": str(row.get('Generic_Tag', '')),
+                        "original_generic_tag": str(row.get('Generic_Tag', '')),  # Track original for comparison
+                        "uuid": str(row.get('UUID', '')),
+                        "uom": str(row.get('UOM', '')),
+                        "tag_description": str(row.get('Tag_Description', '')),
+                        "industry": current_industry,
+                        "plant": str(row.get('Plant', '')),
+                        "area": str(row.get('Area', '')),
+                        "equipment": current_equipment,
+                        "asset": str(row.get('Asset', '')),
+                        "low_low_limit": float(row.get('Low_Low_Limit', 0.0)),
+                        "low_limit": float(row.get('Low_Limit', 0.0)),
+                        "high_limit": float(row.get('High_Limit', 0.0)),
+                        "high_high_limit": float(row.get('High_High_Limit', 0.0)),
+                        "show_new_generic_tag": False,
+                        "is_new_generic_tag": False,  # Track if this is a new generic tag
+                    }
+
+                # Get available generic tags from available_generic_tags dataframe
+                current_industry = st.session_state.edit_form_values.get("industry", "")
+                current_equipment = st.session_state.edit_form_values.get("equipment", "")
+
+                # Get generic tags for this industry and equipment
+                available_tags = get_generic_tags_for_equipment(current_industry, current_equipment)
+
+                # Combine with default generic tags
+                if available_tags:
+                    combined_tags = available_tags + [
+                        tag for tag in st.session_state.catalog.generic_tags if tag not in available_tags
+                    ]
+                else:
+                    combined_tags = st.session_state.catalog.generic_tags.copy()
+
+                # Add "+ Add New" option
+                combined_tags_with_new = combined_tags + ["+ Add New"]
+
+                col1, col2 = st.columns(2)
+
+                with col1:
+                    edit_dcs_tag = st.text_input(
+                        "DCS Tag *",
+                        value=st.session_state.edit_form_values["dcs_tag"],
+                        key="edit_dcs_tag_input"
+                    )
+                    st.session_state.edit_form_values["dcs_tag"] = edit_dcs_tag
+
+                    edit_raw_parameter = st.text_input(
+                        "Raw Parameter *",
+                        value=st.session_state.edit_form_values["raw_parameter"],
+                        key="edit_raw_param_input"
+                    )
+                    st.session_state.edit_form_values["raw_parameter"] = edit_raw_parameter
+
+                    # Generic Tag dropdown with available_generic_tags
+                    current_generic_tag = st.session_state.edit_form_values["generic_tag"]
+
+                    # Determine index for selectbox
+                    if current_generic_tag in combined_tags_with_new:
+                        generic_idx = combined_tags_with_new.index(current_generic_tag) + 1
+                    elif current_generic_tag:
+                        # If current tag not in list, add it temporarily
+                        combined_tags_with_new = [current_generic_tag] + combined_tags_with_new
+                        generic_idx = 1
+                    else:
+                        generic_idx = 0
+
+                    generic_tag_option = st.selectbox(
+                        "Generic Tag *",
+                        [""] + combined_tags_with_new,
+                        index=generic_idx,
+                        key="edit_generic_tag_select"
+                    )
+
+                    # Handle "+ Add New" selection
+                    if generic_tag_option == "+ Add New":
+                        st.session_state.edit_form_values["show_new_generic_tag"] = True
+                        st.session_state.edit_form_values["is_new_generic_tag"] = True
+                    else:
+                        st.session_state.edit_form_values["show_new_generic_tag"] = False
+                        st.session_state.edit_form_values["is_new_generic_tag"] = False
+
+                    # Show text input for new generic tag
+                    if st.session_state.edit_form_values["show_new_generic_tag"]:
+                        edit_generic_tag = st.text_input(
+                            "Enter New Generic Tag",
+                            value="",
+                            key="edit_new_generic_tag_input"
+                        )
+                        # Generate new UUID for new generic tag
+                        if edit_generic_tag:
+                            if st.session_state.edit_form_values.get("new_tag_name") != edit_generic_tag:
+                                # New tag name entered, generate new UUID
+                                st.session_state.edit_form_values["uuid"] = str(uuid.uuid4())
+                                st.session_state.edit_form_values["new_tag_name"] = edit_generic_tag
+                                st.session_state.edit_form_values["tag_description"] = ""  # Clear tag description for new tag
+                    else:
+                        edit_generic_tag = generic_tag_option
+
+                        # Update tag description and UUID when generic tag changes
+                        if edit_generic_tag and edit_generic_tag != st.session_state.edit_form_values.get("last_generic_tag", ""):
+                            # Get tag description for this generic tag
+                            auto_tag_description = get_tag_description_for_generic_tag(
+                                edit_generic_tag,
+                                current_industry,
+                                current_equipment
+                            )
+                            if auto_tag_description:
+                                st.session_state.edit_form_values["tag_description"] = auto_tag_description
+
+                            # Get existing UUID for this generic tag (exact match, then industry only)
+                            existing_uuid = st.session_state.catalog.generic_tag_registry.get(
+                                edit_generic_tag,
+                                current_industry,
+                                current_equipment,
+                                "UUID",
+                                default=None,
+                            )
+                            if existing_uuid is not None:
+                                st.session_state.edit_form_values["uuid"] = existing_uuid
+
+                            st.session_state.edit_form_values["last_generic_tag"] = edit_generic_tag
+
+                    st.session_state.edit_form_values["generic_tag"] = edit_generic_tag
+
+                    # Display UUID (read-only)
+                    st.text_input(
+                        "UUID (Auto-generated)",
+                        value=st.session_state.edit_form_values.get("uuid", ""),
+                        key="edit_uuid_display",
+                        disabled=True,
+                        help="UUID is immutable once a generic tag is created. New generic tags get new UUIDs."
+                    )
+
+                    # UOM
+                    current_uom = st.session_state.edit_form_values["uom"]
+                    if current_uom in st.session_state.catalog.uom_list:
+                        uom_idx = st.session_state.catalog.uom_list.index(current_uom) + 1
+                    else:
+                        uom_idx = 0
+                    edit_uom = st.selectbox(
+                        "UOM *",
+                        [""] + st.session_state.catalog.uom_list,
+                        index=uom_idx,
+                        key="edit_uom_select"
+                    )
+                    st.session_state.edit_form_values["uom"] = edit_uom
+
+                    edit_tag_description = st.text_area(
+                        "Tag Description *",
+                        value=st.session_state.edit_form_values["tag_description"],
+                        key="edit_tag_description_input"
+                    )
+                    st.session_state.edit_form_values["tag_description"] = edit_tag_description
+
+                with col2:
+                    edit_industry = st.text_input(
+                        "Industry",
+                        value=st.session_state.edit_form_values["industry"],
+                        key="edit_industry_input"
+                    )
+                    st.session_state.edit_form_values["industry"] = edit_industry
+
+                    edit_plant = st.text_input(
+                        "Plant",
+                        value=st.session_state.edit_form_values["plant"],
+                        key="edit_plant_input"
+                    )
+                    st.session_state.edit_form_values["plant"] = edit_plant
+
+                    edit_area = st.text_input(
+                        "Area",
+                        value=st.session_state.edit_form_values["area"],
+                        key="edit_area_input"
+                    )
+                    st.session_state.edit_form_values["area"] = edit_area
+
+                    edit_equipment = st.text_input(
+                        "Equipment",
+                        value=st.session_state.edit_form_values["equipment"],
+                        key="edit_equipment_input"
+                    )
+                    st.session_state.edit_form_values["equipment"] = edit_equipment
+
+                    edit_asset = st.text_input(
+                        "Asset",
+                        value=st.session_state.edit_form_values["asset"],
+                        key="edit_asset_input"
+                    )
+                    st.session_state.edit_form_values["asset"] = edit_asset
+
+                st.markdown("#### Limits")
+                limit_col1, limit_col2, limit_col3, limit_col4 = st.columns(4)
+
+                with limit_col1:
+                    edit_low_low = st.number_input(
+                        "Low-Low Limit",
+                        value=st.session_state.edit_form_values["low_low_limit"],
+                        format="%.2f",
+                        key="edit_low_low_input"
+                    )
+                    st.session_state.edit_form_values["low_low_limit"] = edit_low_low
+
+                with limit_col2:
+                    edit_low = st.number_input(
+                        "Low Limit",
+                        value=st.session_state.edit_form_values["low_limit"],
+                        format="%.2f",
+                        key="edit_low_input"
+                    )
+                    st.session_state.edit_form_values["low_limit"] = edit_low
+
+                with limit_col3:
+                    edit_high = st.number_input(
+                        "High Limit",
+                        value=st.session_state.edit_form_values["high_limit"],
+                        format="%.2f",
+                        key="edit_high_input"
+                    )
+                    st.session_state.edit_form_values["high_limit"] = edit_high
+
+                with limit_col4:
+                    edit_high_high = st.number_input(
+                        "High-High Limit",
+                        value=st.session_state.edit_form_values["high_high_limit"],
+                        format="%.2f",
+                        key="edit_high_high_input"
+                    )
+                    st.session_state.edit_form_values["high_high_limit"] = edit_high_high
+
+                st.markdown("---")
+                col_save, col_cancel = st.columns(2)
+
+                with col_save:
+                    if st.button("💾 Save Changes", type="primary", use_container_width=True, key="save_edit_btn"):
+                        edit_generic_tag = st.session_state.edit_form_values["generic_tag"]
+                        edit_dcs_tag = st.session_state.edit_form_values["dcs_tag"]
+                        edit_uom = st.session_state.edit_form_values["uom"]
+                        edit_raw_parameter = st.session_state.edit_form_values["raw_parameter"]
+                        edit_uuid = st.session_state.edit_form_values.get("uuid", "")
+
+                        if edit_dcs_tag and edit_raw_parameter and edit_generic_tag and edit_uom:
+                            # Add new generic tag to list if it's a new one
+                            if st.session_state.edit_form_values.get("is_new_generic_tag"):
+                                st.session_state.catalog.add_generic_tag(edit_generic_tag)
+
+                            # Update the tag
+                            try:
+                                write_edit_tags(
+                                    [idx],
+                                    {
+                                        "DCS_Tag": edit_dcs_tag,
+                                        "Raw_Parameter": edit_raw_parameter,
+                                        "Generic_Tag": edit_generic_tag,
+                                        "UUID": edit_uuid,
+                                        "UOM": edit_uom,
+                                        "Tag_Description": st.session_state.edit_form_values["tag_description"],
+                                        "Industry": st.session_state.edit_form_values["industry"],
+                                        "Plant": st.session_state.edit_form_values["plant"],
+                                        "Area": st.session_state.edit_form_values["area"],
+                                        "Equipment": st.session_state.edit_form_values["equipment"],
+                                        "Asset": st.session_state.edit_form_values["asset"],
+                                        "Low_Low_Limit": st.session_state.edit_form_values["low_low_limit"],
+                                        "Low_Limit": st.session_state.edit_form_values["low_limit"],
+                                        "High_Limit": st.session_state.edit_form_values["high_limit"],
+                                        "High_High_Limit": st.session_state.edit_form_values["high_high_limit"],
+                                    },
+                                )
+                            except sqlite3.IntegrityError:
+                                st.error(f"⚠️ A tag '{edit_dcs_tag}' already exists at this hierarchy")
+                            else:
+                                st.session_state.editing_tag_index = None
+                                clear_tag_selection()
+                                st.session_state.edit_form_values = {}
+                                st.session_state.edit_tags_notice = f"✅ Tag '{edit_dcs_tag}' updated successfully!"
+                                st.rerun()
+                        else:
+                            st.error("⚠️ Please fill all required fields (marked with *)")
+
+                with col_cancel:
+                    st.button("❌ Cancel", use_container_width=True, key="cancel_edit_btn", on_click=cancel_tag_edit)
+
+            # Update & Save button
+            st.markdown("---")
+            if st.button("💾 Update & Save", type="primary", use_container_width=True, key="update_save_csv"):
+                if db is not None:
+                    # Edits are already committed, only register their new generic tags
+                    added = db.sync_generic_tags()
+                    st.success(f"✅ Tag database and Available Generic Tags updated ({added} new generic tags)!")
+                else:
+                    try:
+                        # Locked, atomic save; merged into the latest catalog if another session saved meanwhile
+                        catalog, version, merged, conflicts = tag_metadata().save_changes(
+                            st.session_state.edit_tags_df,
+                            st.session_state.edit_tags_changes,
+                            st.session_state.edit_tags_version,
+                        )
+                    except CatalogReplacedError:
+                        st.error(
+                            "⚠️ tag_metadata.csv was replaced by another session since it was loaded. "
+                            "Click 'Refresh Data' and apply your changes again."
+                        )
+                    else:
+                        st.session_state.edit_tags_df = catalog
+                        st.session_state.edit_tags_version = version
+                        st.session_state.edit_tags_changes = []
+
+                        # Update 'Tags Configured' (tags_data) - replace with edited data
+                        set_tags_data(st.session_state.edit_tags_df.copy(deep=False))
+
+                        # Update 'Available Generic Tags with Tag Description' - append new entries only
+                        register_generic_tags(st.session_state.edit_tags_df, st.session_state.catalog.generic_tag_registry)
+
+                        if merged:
+                            overwritten = f", overwriting {len(conflicts)} values it also changed" if conflicts else ""
+                            st.warning(f"⚠️ Another session saved tag_metadata.csv meanwhile, your changes were merged into it{overwritten}")
+                        st.success("✅ tag_metadata.csv, Tags Configured, and Available Generic Tags updated successfully!")
+
+        else:
+            st.info(f"📂 {source_name} is empty. Configure some tags first.")
+    else:
+        st.warning("⚠️ tag_metadata.csv not found. Please configure tags and click 'Create' in the Summary page first.")
+
+        st.button("← Go to Summary", type="primary", on_click=go_to_page, args=("summary",))
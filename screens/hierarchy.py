@@ -0,0 +1,478 @@
+"""Plant Hierarchy screen: hierarchy form, existing paths and the hierarchy tree"""
+
+import streamlit as st
+
+from rerun_profile import profiled
+from screens.common import fragment_rerun, quick_actions_sidebar, request_page_rerun, user_action
+from tag_catalog import valid_hierarchy_name
+
+
+# Hierarchy tree panel: items per page at each level, and cap on search results
+HIERARCHY_TREE_PAGE_SIZE = 20
+HIERARCHY_TREE_SEARCH_LIMIT = 500
+HIERARCHY_TREE_ICONS = ["🏭", "📍", "⚙️", "🔧"]
+
+
+@profiled("helper")
+def validate_hierarchy_input(text):
+    """Validate that input contains only uppercase letters, numbers, and underscores"""
+    return valid_hierarchy_name(text)
+
+
+@profiled("helper")
+def get_unique_values(column_name, industry=None, filters=None):
+    """Get unique values from hierarchy data for dropdown with optional filters"""
+    return st.session_state.catalog.unique_values(column_name, industry=industry, filters=filters)
+
+
+@profiled("helper")
+def select_hierarchy_path(plant, area, equipment, asset):
+    """Auto-fill the hierarchy form with an existing path"""
+    st.session_state.plant_hierarchy["plant"] = plant
+    st.session_state.plant_hierarchy["area"] = area
+    st.session_state.plant_hierarchy["equipment"] = equipment
+    st.session_state.plant_hierarchy["asset"] = asset
+
+    # Set input modes to "Select Existing"
+    st.session_state.hierarchy_input_mode = {
+        "plant": "Select Existing",
+        "area": "Select Existing",
+        "equipment": "Select Existing",
+        "asset": "Select Existing",
+    }
+
+
+@user_action
+def quick_select_hierarchy_path(path):
+    """Auto-fill the hierarchy form with a path picked in the tree (button callback)"""
+    select_hierarchy_path(*path)
+    # Drop the form's widget values, so its widgets show the selected path
+    for level in ["plant", "area", "equipment", "asset"]:
+        for widget in ["radio", "select", "input"]:
+            if f"{level}_{widget}" in st.session_state:
+                del st.session_state[f"{level}_{widget}"]
+    # The hierarchy form is outside the tree's fragment
+    request_page_rerun()
+
+
+@user_action
+def back_to_industries():
+    """Reset the hierarchy form and return to the industries (button callback)"""
+    # Reset hierarchy fields
+    st.session_state.plant_hierarchy = {
+        "plant": "",
+        "area": "",
+        "equipment": "",
+        "asset": "",
+    }
+    # Reset input modes to Select Existing
+    st.session_state.hierarchy_input_mode = {
+        "plant": "Select Existing",
+        "area": "Select Existing",
+        "equipment": "Select Existing",
+        "asset": "Select Existing",
+    }
+    st.session_state.page = "welcome"
+
+
+@user_action
+def set_hierarchy_tree_page(page_key, page):
+    """Show another page of a tree level (button callback)"""
+    st.session_state.hierarchy_tree_pages[page_key] = page
+
+
+@user_action
+def toggle_hierarchy_tree_node(path):
+    """Expand or collapse a tree node (button callback)"""
+    expanded = st.session_state.hierarchy_tree_expanded
+    if path in expanded:
+        expanded.discard(path)
+    else:
+        expanded.add(path)
+
+
+@profiled("helper")
+def hierarchy_tree_page_range(page_key, total):
+    """Show pagination controls for one tree level and return its (start, stop) slice"""
+    pages = st.session_state.hierarchy_tree_pages
+    n_pages = max(1, -(-total // HIERARCHY_TREE_PAGE_SIZE))
+    page = min(pages.get(page_key, 0), n_pages - 1)
+    start = page * HIERARCHY_TREE_PAGE_SIZE
+    stop = min(start + HIERARCHY_TREE_PAGE_SIZE, total)
+
+    if n_pages > 1:
+        col_prev, col_label, col_next = st.columns([1, 2, 1])
+        with col_prev:
+            st.button(
+                "◀", key=f"tree_prev_{page_key}", disabled=page == 0,
+                on_click=set_hierarchy_tree_page, args=(page_key, page - 1),
+            )
+        with col_label:
+            st.caption(f"{start + 1}-{stop} of {total}")
+        with col_next:
+            st.button(
+                "▶", key=f"tree_next_{page_key}", disabled=page == n_pages - 1,
+                on_click=set_hierarchy_tree_page, args=(page_key, page + 1),
+            )
+
+    return start, stop
+
+
+@profiled("helper")
+def hierarchy_tree_asset_row(path, label):
+    """One selectable asset row of the hierarchy tree"""
+    col_tree, col_btn = st.columns([3, 1])
+    with col_tree:
+        st.markdown(label)
+    with col_btn:
+        st.button(
+            "✓",
+            key=f"btn_select_{'/'.join(path)}",
+            help=f"Select: {' → '.join(path)}",
+            on_click=quick_select_hierarchy_path,
+            args=(path,),
+        )
+
+
+@profiled("helper")
+def hierarchy_tree_level(industry, path):
+    """Render the children of an expanded tree node, one page at a time"""
+    names = st.session_state.catalog.hierarchy_index.names(industry, *path)
+    if names is None:
+        return
+
+    depth = len(path)
+    indent = "&nbsp;" * 4 * depth
+    icon = HIERARCHY_TREE_ICONS[depth]
+    expanded = st.session_state.hierarchy_tree_expanded
+    start, stop = hierarchy_tree_page_range("/".join(path), len(names))
+
+    page_names = names.slice(start, stop)
+    for idx, name in enumerate(page_names):
+        child_path = path + (name,)
+
+        # Assets are leaves with a select button
+        if depth == len(HIERARCHY_TREE_ICONS) - 1:
+            tree_symbol = "└─" if idx == len(page_names) - 1 else "├─"
+            hierarchy_tree_asset_row(child_path, f"{indent}{tree_symbol} {icon} {name}")
+            continue
+
+        is_expanded = child_path in expanded
+        st.button(
+            f"{'▾' if is_expanded else '▸'} {icon} {name}",
+            key=f"tree_toggle_{'/'.join(child_path)}",
+            on_click=toggle_hierarchy_tree_node,
+            args=(child_path,),
+        )
+
+        # Children are only loaded once their parent is expanded
+        if is_expanded:
+            hierarchy_tree_level(industry, child_path)
+
+
+@st.fragment
+@profiled("fragment")
+def hierarchy_tree_panel(industry):
+    """Display the lazily expanded, paginated tree of existing hierarchies
+
+    A fragment: expanding nodes, paging and searching rerun only the tree.
+    """
+    fragment_rerun()
+    if "hierarchy_tree_expanded" not in st.session_state:
+        st.session_state.hierarchy_tree_expanded = set()
+    if "hierarchy_tree_pages" not in st.session_state:
+        st.session_state.hierarchy_tree_pages = {}
+
+    hierarchy_index = st.session_state.catalog.hierarchy_index
+    if not len(hierarchy_index):
+        st.info("No hierarchy data saved yet")
+        return
+    if not hierarchy_index.names(industry):
+        st.info(f"No hierarchy data for {industry} yet")
+        return
+
+    search = st.text_input(
+        "🔍 Search hierarchy",
+        key="hierarchy_tree_search",
+        placeholder="Plant, area, equipment or asset name",
+    )
+
+    if search:
+        # Matching paths, capped so a broad search stays cheap
+        matches = hierarchy_index.search(industry, search, limit=HIERARCHY_TREE_SEARCH_LIMIT)
+        if not matches:
+            st.info(f"No hierarchy matches '{search}'")
+            return
+        if len(matches) == HIERARCHY_TREE_SEARCH_LIMIT:
+            st.caption(f"Showing the first {HIERARCHY_TREE_SEARCH_LIMIT} matches, refine your search to narrow them down")
+
+        start, stop = hierarchy_tree_page_range(f"search:{search}", len(matches))
+        for path in matches[start:stop]:
+            hierarchy_tree_asset_row(path, f"🔧 {' → '.join(path)}")
+        return
+
+    hierarchy_tree_level(industry, ())
+
+
+@profiled("screen")
+def plant_hierarchy_screen():
+    """Display plant hierarchy setup screen"""
+    quick_actions_sidebar()
+
+    st.title(f"Plant Hierarchy Setup - {st.session_state.selected_industry}")
+
+    # Reset to "Select Existing" when entering this page from another page
+    if st.session_state.last_page != "hierarchy":
+        st.session_state.hierarchy_input_mode = {
+            "plant": "Select Existing",
+            "area": "Select Existing",
+            "equipment": "Select Existing",
+            "asset": "Select Existing",
+        }
+        st.session_state.last_page = "hierarchy"
+
+    # Initialize if not present
+    if "hierarchy_input_mode" not in st.session_state:
+        st.session_state.hierarchy_input_mode = {
+            "plant": "Select Existing",
+            "area": "Select Existing",
+            "equipment": "Select Existing",
+            "asset": "Select Existing",
+        }
+
+    st.button("← Back to Industries", on_click=back_to_industries)
+
+    st.markdown("---")
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.subheader("Define Plant Hierarchy")
+
+        # Plant Name
+        st.markdown("### 🏭 Plant Name")
+        plant_options = get_unique_values(
+            "Plant", industry=st.session_state.selected_industry
+        )
+
+        # Determine default radio selection
+        plant_radio_default = (
+            0
+            if st.session_state.hierarchy_input_mode["plant"] == "Select Existing"
+            else 1
+        )
+        plant_input_type = st.radio(
+            "Plant Input",
+            ["Select Existing", "Add New"],
+            index=plant_radio_default,
+            horizontal=True,
+            key="plant_radio",
+        )
+        st.session_state.hierarchy_input_mode["plant"] = plant_input_type
+
+        if plant_input_type == "Select Existing" and plant_options:
+            # Get index for select box based on session state
+            plant_value = st.session_state.plant_hierarchy.get("plant", "")
+            if plant_value in plant_options:
+                plant_idx = plant_options.index(plant_value) + 1
+            else:
+                plant_idx = 0
+            plant = st.selectbox(
+                "Select Plant",
+                [""] + plant_options,
+                index=plant_idx,
+                key="plant_select",
+            )
+        else:
+            plant = st.text_input(
+                "Enter Plant Name",
+                value=st.session_state.plant_hierarchy.get("plant", ""),
+                key="plant_input",
+                help="Only uppercase letters (A-Z), numbers (0-9), and underscores (_) are allowed",
+            )
+            # Validate input
+            if plant and not validate_hierarchy_input(plant):
+                st.error("❌ Invalid input! Only uppercase letters (A-Z), numbers (0-9), and underscores (_) are allowed.")
+                plant = ""  # Clear invalid input
+
+        st.session_state.plant_hierarchy["plant"] = plant
+
+        # Area
+        st.markdown("### 📍 Area")
+        area_options = get_unique_values(
+            "Area",
+            industry=st.session_state.selected_industry,
+            filters={"Plant": plant} if plant else None,
+        )
+
+        area_radio_default = (
+            0
+            if st.session_state.hierarchy_input_mode["area"] == "Select Existing"
+            else 1
+        )
+        area_input_type = st.radio(
+            "Area Input",
+            ["Select Existing", "Add New"],
+            index=area_radio_default,
+            horizontal=True,
+            key="area_radio",
+        )
+        st.session_state.hierarchy_input_mode["area"] = area_input_type
+
+        if area_input_type == "Select Existing" and area_options:
+            area_value = st.session_state.plant_hierarchy.get("area", "")
+            if area_value in area_options:
+                area_idx = area_options.index(area_value) + 1
+            else:
+                area_idx = 0
+            area = st.selectbox(
+                "Select Area", [""] + area_options, index=area_idx, key="area_select"
+            )
+        else:
+            area = st.text_input(
+                "Enter Area Name",
+                value=st.session_state.plant_hierarchy.get("area", ""),
+                key="area_input",
+                help="Only uppercase letters (A-Z), numbers (0-9), and underscores (_) are allowed",
+            )
+            # Validate input
+            if area and not validate_hierarchy_input(area):
+                st.error("❌ Invalid input! Only uppercase letters (A-Z), numbers (0-9), and underscores (_) are allowed.")
+                area = ""  # Clear invalid input
+
+        st.session_state.plant_hierarchy["area"] = area
+
+        # Equipment
+        st.markdown("### ⚙️ Equipment")
+        equipment_options = get_unique_values(
+            "Equipment",
+            industry=st.session_state.selected_industry,
+            filters={"Plant": plant, "Area": area} if plant and area else None,
+        )
+
+        equipment_radio_default = (
+            0
+            if st.session_state.hierarchy_input_mode["equipment"] == "Select Existing"
+            else 1
+        )
+        equipment_input_type = st.radio(
+            "Equipment Input",
+            ["Select Existing", "Add New"],
+            index=equipment_radio_default,
+            horizontal=True,
+            key="equipment_radio",
+        )
+        st.session_state.hierarchy_input_mode["equipment"] = equipment_input_type
+
+        if equipment_input_type == "Select Existing" and equipment_options:
+            equipment_value = st.session_state.plant_hierarchy.get("equipment", "")
+            if equipment_value in equipment_options:
+                equipment_idx = equipment_options.index(equipment_value) + 1
+            else:
+                equipment_idx = 0
+            equipment = st.selectbox(
+                "Select Equipment",
+                [""] + equipment_options,
+                index=equipment_idx,
+                key="equipment_select",
+            )
+        else:
+            equipment = st.text_input(
+                "Enter Equipment Name",
+                value=st.session_state.plant_hierarchy.get("equipment", ""),
+                key="equipment_input",
+                help="Only uppercase letters (A-Z), numbers (0-9), and underscores (_) are allowed",
+            )
+            # Validate input
+            if equipment and not validate_hierarchy_input(equipment):
+                st.error("❌ Invalid input! Only uppercase letters (A-Z), numbers (0-9), and underscores (_) are allowed.")
+                equipment = ""  # Clear invalid input
+
+        st.session_state.plant_hierarchy["equipment"] = equipment
+
+        # Asset
+        st.markdown("### 🔧 Asset")
+        asset_options = get_unique_values(
+            "Asset",
+            industry=st.session_state.selected_industry,
+            filters=(
+                {"Plant": plant, "Area": area, "Equipment": equipment}
+                if plant and area and equipment
+                else None
+            ),
+        )
+
+        asset_radio_default = (
+            0
+            if st.session_state.hierarchy_input_mode["asset"] == "Select Existing"
+            else 1
+        )
+        asset_input_type = st.radio(
+            "Asset Input",
+            ["Select Existing", "Add New"],
+            index=asset_radio_default,
+            horizontal=True,
+            key="asset_radio",
+        )
+        st.session_state.hierarchy_input_mode["asset"] = asset_input_type
+
+        if asset_input_type == "Select Existing" and asset_options:
+            asset_value = st.session_state.plant_hierarchy.get("asset", "")
+            if asset_value in asset_options:
+                asset_idx = asset_options.index(asset_value) + 1
+            else:
+                asset_idx = 0
+            asset = st.selectbox(
+                "Select Asset",
+                [""] + asset_options,
+                index=asset_idx,
+                key="asset_select",
+            )
+        else:
+            asset = st.text_input(
+                "Enter Asset Name",
+                value=st.session_state.plant_hierarchy.get("asset", ""),
+                key="asset_input",
+                help="Only uppercase letters (A-Z), numbers (0-9), and underscores (_) are allowed",
+            )
+            # Validate input
+            if asset and not validate_hierarchy_input(asset):
+                st.error("❌ Invalid input! Only uppercase letters (A-Z), numbers (0-9), and underscores (_) are allowed.")
+                asset = ""  # Clear invalid input
+
+        st.session_state.plant_hierarchy["asset"] = asset
+
+        # Save and Proceed button
+        st.markdown("---")
+        all_filled = all(
+            [
+                st.session_state.plant_hierarchy["plant"],
+                st.session_state.plant_hierarchy["area"],
+                st.session_state.plant_hierarchy["equipment"],
+                st.session_state.plant_hierarchy["asset"],
+            ]
+        )
+
+        if all_filled:
+            if st.button(
+                "📝 Define Tags & Details →", type="primary", use_container_width=True
+            ):
+                # Save hierarchy to the catalog
+                st.session_state.catalog.add_hierarchy_path(
+                    st.session_state.selected_industry,
+                    st.session_state.plant_hierarchy["plant"],
+                    st.session_state.plant_hierarchy["area"],
+                    st.session_state.plant_hierarchy["equipment"],
+                    st.session_state.plant_hierarchy["asset"],
+                )
+
+                st.session_state.page = "tags"
+                st.rerun()
+        else:
+            st.warning("⚠️ Please fill all hierarchy fields to proceed")
+
+    with col2:
+        st.subheader("Available Hierarchies")
+        st.info("💡 Click on any item below to auto-fill the hierarchy")
+
+        hierarchy_tree_panel(st.session_state.selected_industry)
@@ -0,0 +1,34 @@
+"""Sidebar panel of the rerun profiling mode (TAG_PROFILE=1)"""
+
+import streamlit as st
+import pandas as pd
+
+from rerun_profile import TRACE_PATH
+
+
+def rerun_profile_panel():
+    """Debug panel with the timings of this session's last reruns (TAG_PROFILE=1)"""
+    profiles = st.session_state.rerun_profiles
+    last = profiles[0]
+    with st.sidebar.expander("🐞 Rerun Profile"):
+        st.caption(f"Last rerun ({last.page}): {last.seconds * 1000:.1f} ms, appended to {TRACE_PATH}")
+        st.caption(
+            f"Last action: {st.session_state.last_action or 'none'}, "
+            f"{st.session_state.action_reruns} rerun(s) since"
+        )
+        st.dataframe(
+            pd.DataFrame(last.rows(), columns=["Function", "Kind", "Calls", "ms"]),
+            use_container_width=True,
+            hide_index=True,
+            column_config={"ms": st.column_config.NumberColumn("ms", format="%.2f")},
+        )
+        st.caption("Last reruns (times include the helpers and I/O they call)")
+        st.dataframe(
+            pd.DataFrame(
+                [(p.started.strftime("%H:%M:%S"), p.page, p.seconds * 1000) for p in profiles],
+                columns=["Time", "Page", "ms"],
+            ),
+            use_container_width=True,
+            hide_index=True,
+            column_config={"ms": st.column_config.NumberColumn("ms", format="%.1f")},
+        )
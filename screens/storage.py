@@ -0,0 +1,20 @@
+"""tag_metadata.csv access of the Summary and Edit Existing Tags screens
+
+Kept apart from screens.common since it loads pandas, which the other
+screens do not need.
+"""
+
+from rerun_profile import profiled
+from screens.common import TAG_STORAGE
+from tag_journal import open_journal
+from tag_metadata_file import open_tag_metadata
+
+
+@profiled("io")
+def tag_metadata():
+    """Process-wide tag_metadata.csv with locked, atomic and versioned saves
+
+    With the journal backend, saves are appended to its journal.
+    """
+    journal = open_journal("tag_metadata.csv") if TAG_STORAGE == "journal" else None
+    return open_tag_metadata("tag_metadata.csv", journal)
@@ -0,0 +1,214 @@
+"""Summary screen: configured tags, validation report, exports and saving tag_metadata.csv"""
+
+import streamlit as st
+from datetime import datetime
+import time
+
+from exports import EXPORT_FORMATS
+from rerun_profile import profiled
+from screens.common import quick_actions_sidebar, tag_database
+from screens.storage import tag_metadata
+from tag_validation import validate_tags
+
+
+@profiled("helper")
+def export_buttons(name, df, version, file_prefix, sheet_name):
+    """CSV, Excel and JSON download buttons whose files are built only when clicked"""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    columns = st.columns(len(EXPORT_FORMATS))
+
+    for col, (export_format, (_, extension, mime, label)) in zip(columns, EXPORT_FORMATS.items()):
+        with col:
+            st.download_button(
+                label=label,
+                data=st.session_state.export_cache.builder(
+                    name, version, df, export_format, sheet_name=sheet_name
+                ),
+                file_name=f"{file_prefix}_{timestamp}.{extension}",
+                mime=mime,
+                use_container_width=True,
+                key=f"download_{name}_{export_format}",
+            )
+
+
+@profiled("helper")
+def tag_validation_report():
+    """Issues of the whole tags_data, checked again only when the tags or UOMs change"""
+    st.markdown("---")
+    st.subheader("🩺 Validation")
+
+    catalog = st.session_state.catalog
+    version = (catalog.tags_data_version, len(catalog.uom_list))
+    cached = st.session_state.get("tag_issues")
+    if cached is None or cached[0] != version:
+        start = time.perf_counter()
+        issues = validate_tags(catalog.tags_data, known_uoms=catalog.uom_list)
+        cached = (version, issues, time.perf_counter() - start)
+        st.session_state.tag_issues = cached
+    _, issues, elapsed = cached
+
+    if issues.empty:
+        st.success(f"✅ All {len(catalog.tags_data):,} tags are valid (checked in {elapsed:.2f}s)")
+        return
+    st.error(f"❌ {len(issues):,} issues in {issues['Row'].nunique():,} tags (checked in {elapsed:.2f}s)")
+    summary = issues.groupby(["Column", "Issue"], sort=False).size().reset_index(name="Tags")
+    st.dataframe(summary, use_container_width=True, hide_index=True)
+    with st.expander("Show all issues"):
+        st.dataframe(issues, use_container_width=True, hide_index=True)
+    export_buttons("tag_issues", issues, version, "tag_issues", sheet_name="Issues")
+
+
+@profiled("screen")
+def summary_screen():
+    """Display final summary with all configured data"""
+    quick_actions_sidebar()
+
+    # Track current page
+    st.session_state.last_page = "summary"
+
+    st.title("📊 New Tags Configuration Summary")
+
+    # Show the result of an upload that redirected here
+    upload_report = st.session_state.pop("upload_report", None)
+    if upload_report:
+        st.success(upload_report)
+
+    st.markdown("---")
+
+    # Tabs for different dataframes
+    tab1, tab2 = st.tabs(["📋 Tags Configured", "🏷️ Available Generic Tags with Tag Description"])
+
+    with tab1:
+        # Display complete dataframe
+        if not st.session_state.catalog.tags_data.empty:
+            st.subheader("Complete Tags Configuration")
+
+            # Ensure UUID column exists (for backward compatibility)
+            if "UUID" not in st.session_state.catalog.tags_data.columns:
+                st.session_state.catalog.tags_data.insert(8, "UUID", "")
+                st.session_state.catalog.tags_data_version += 1
+
+            st.dataframe(
+                st.session_state.catalog.tags_data, use_container_width=True, hide_index=True
+            )
+            memory = st.session_state.catalog.tags_data.memory_usage(index=False, deep=True).sum()
+            st.caption(f"{len(st.session_state.catalog.tags_data):,} tags, {memory / 1e6:.1f} MB in memory")
+
+            tag_validation_report()
+
+            # Create button to save tag_metadata.csv
+            st.markdown("---")
+            st.subheader("💾 Save to Tag Metadata")
+            if st.button("✅ Create", type="primary", use_container_width=True, key="create_tag_metadata"):
+                db = tag_database()
+                if db is not None:
+                    # Upsert tags_data into the tag database in one transaction
+                    written = db.upsert_tags(st.session_state.catalog.tags_data)
+                    st.success(f"✅ {written} tags saved to the tag database!")
+                else:
+                    # Save tags_data to tag_metadata.csv (locked and atomic, or journaled)
+                    tag_metadata().replace(st.session_state.catalog.tags_data)
+                    st.success("✅ tag_metadata.csv created successfully!")
+
+            # Export options
+            st.markdown("---")
+            st.subheader("💾 Export Tags Data")
+
+            export_buttons(
+                "tags_config",
+                st.session_state.catalog.tags_data,
+                st.session_state.catalog.tags_data_version,
+                "tags_config",
+                sheet_name="Tags",
+            )
+        else:
+            st.info("No configuration data available yet.")
+
+    with tab2:
+        # Display Available Generic Tags with Tag Description
+        # Only the filter options and the selected slice are read from the registry
+        registry = st.session_state.catalog.generic_tag_registry
+        if not registry.empty:
+            st.subheader("Available Generic Tags by Industry & Equipment")
+
+            # Filter section
+            col1, col2 = st.columns(2)
+
+            with col1:
+                # Get all unique industries from available_generic_tags
+                available_industries = registry.industries()
+                selected_industry_filter = st.selectbox(
+                    "🏭 Select Industry",
+                    [""] + available_industries,
+                    key="industry_filter_select",
+                )
+
+            with col2:
+                # Get equipment options based on selected industry
+                if selected_industry_filter:
+                    equipment_options = registry.equipment_for(selected_industry_filter)
+                else:
+                    equipment_options = []
+
+                selected_equipment_filter = st.selectbox(
+                    "⚙️ Select Equipment",
+                    [""] + equipment_options if equipment_options else [""],
+                    key="equipment_filter_select",
+                )
+
+            st.markdown("---")
+
+            # Display filtered results
+            if selected_industry_filter and selected_equipment_filter:
+                # Filter available_generic_tags based on selections
+                filtered_data = registry.rows_for(
+                    selected_industry_filter, selected_equipment_filter
+                )
+
+                if not filtered_data.empty:
+                    # Create a dataframe with Generic_Tag, UUID, and Tag_Description columns
+                    result_df = filtered_data[["Generic_Tag", "UUID", "Tag_Description"]].copy()
+
+                    # Display the filtered dataframe
+                    st.dataframe(result_df, use_container_width=True, hide_index=True)
+
+                    # Export filtered data
+                    st.markdown("---")
+                    st.subheader("💾 Export Filtered Data")
+
+                    export_buttons(
+                        "filtered_generic_tags",
+                        result_df,
+                        (registry.version, selected_industry_filter, selected_equipment_filter),
+                        f"generic_tags_{selected_industry_filter}_{selected_equipment_filter}",
+                        sheet_name="Generic Tags",
+                    )
+                else:
+                    st.warning(
+                        f"⚠️ No tags found for {selected_industry_filter} - {selected_equipment_filter}"
+                    )
+            elif selected_industry_filter:
+                st.info(
+                    "💡 Please select an equipment to view generic tags and tag description"
+                )
+            else:
+                st.info(
+                    "💡 Please select an industry and equipment to view generic tags and tag description"
+                )
+
+            # Export Available Generic Tags
+            st.markdown("---")
+            st.subheader("💾 Export Available Generic Tags")
+
+            # The full table is only read when a download is clicked
+            export_buttons(
+                "available_generic_tags",
+                lambda: registry.frame,
+                registry.version,
+                "available_generic_tags",
+                sheet_name="Generic Tags",
+            )
+        else:
+            st.info(
+                "No available generic tags data yet. Upload generic tags to build this dataset."
+            )
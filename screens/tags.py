@@ -0,0 +1,743 @@
+"""Tags Configuration screen: single tag entry and bulk entry of DCS point lists"""
+
+import streamlit as st
+import pandas as pd
+
+from rerun_profile import profiled
+from screens.common import (
+    fragment_rerun,
+    get_generic_tags_for_equipment,
+    get_or_create_uuid_for_generic_tag,
+    get_tag_description_for_generic_tag,
+    match_generic_tags,
+    quick_actions_sidebar,
+    request_page_rerun,
+    user_action,
+)
+from tag_catalog import AUTO_MATCH_SCORE, TAG_LIMIT_COLUMNS
+from tag_validation import validate_tags
+
+
+# Configured tags are listed one expander each up to this many, as a table beyond
+MAX_TAG_EXPANDERS = 50
+
+# Widgets of the single tag form, dropped to clear it
+TAG_FORM_WIDGET_KEYS = [
+    "dcs_tag_input", "raw_param_input", "generic_tag_select",
+    "new_generic_tag", "uom_select", "new_uom",
+    "low_low_input", "low_input", "high_input", "high_high_input",
+    "uuid_display", "tag_description_input"
+]
+
+
+@user_action
+def back_to_hierarchy():
+    """Reset the tag form and return to the Plant Hierarchy screen (button callback)"""
+    # Reset tag input values
+    st.session_state.tag_input_values = {
+        "dcs_tag": "",
+        "raw_parameter": "",
+        "generic_tag_select": "",
+        "new_generic_tag": "",
+        "uuid": "",
+        "tag_description": "",
+        "uom_select": "",
+        "new_uom": "",
+        "low_low_limit": 0.0,
+        "low_limit": 0.0,
+        "high_limit": 0.0,
+        "high_high_limit": 0.0,
+    }
+    # Reset show flags
+    st.session_state.show_new_generic_tag = False
+    st.session_state.show_new_uom = False
+    st.session_state.page = "hierarchy"
+
+
+@profiled("screen")
+def tags_configuration_screen():
+    """Display tags configuration screen"""
+    quick_actions_sidebar()
+
+    # Track current page
+    st.session_state.last_page = "tags"
+
+    # Breadcrumb
+    hierarchy = st.session_state.plant_hierarchy
+    breadcrumb_html = f"""
+    <div class="breadcrumb">
+        <span class="breadcrumb-item">🏭 {hierarchy['plant']}</span> → 
+        <span class="breadcrumb-item">📍 {hierarchy['area']}</span> → 
+        <span class="breadcrumb-item">⚙️ {hierarchy['equipment']}</span> → 
+        <span class="breadcrumb-item">🔧 {hierarchy['asset']}</span>
+    </div>
+    """
+    st.markdown(breadcrumb_html, unsafe_allow_html=True)
+
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        st.title("Tags & Details Configuration")
+    with col2:
+        st.button("← Back to Hierarchy", on_click=back_to_hierarchy)
+
+    st.markdown("---")
+
+    # Get suggested generic tags for this equipment and industry
+    suggested_tags = get_generic_tags_for_equipment(
+        st.session_state.selected_industry, hierarchy["equipment"]
+    )
+
+    if suggested_tags:
+        st.info(
+            f"💡 Suggested Generic Tags for {hierarchy['equipment']}: {', '.join(suggested_tags[:5])}"
+        )
+
+    # Add tags one at a time, or a whole DCS point list at once
+    entry_mode = st.radio(
+        "Entry Mode",
+        ["Single Tag", "Bulk from DCS Point List"],
+        horizontal=True,
+        key="tag_entry_mode",
+    )
+    if entry_mode == "Single Tag":
+        single_tag_entry_section(hierarchy, suggested_tags)
+    else:
+        bulk_tag_entry_section(hierarchy)
+
+    # Display current tags
+    st.markdown("---")
+    configured_tags_list()
+
+
+@user_action
+def delete_tag_entries(entries):
+    """Remove the configured tag entries drawn by the list (button callback, before it is drawn again)"""
+    deleted = {id(entry) for entry in entries}
+    st.session_state.catalog.tag_entries = [
+        entry for entry in st.session_state.catalog.tag_entries if id(entry) not in deleted
+    ]
+    # A new table key drops the row selection, whose positions now point at other tags
+    st.session_state.configured_tags_version = st.session_state.get("configured_tags_version", 0) + 1
+
+
+@st.fragment
+@profiled("fragment")
+def configured_tags_list():
+    """Configured tags with their delete buttons, rerun on its own when a tag is deleted"""
+    fragment_rerun()
+    st.subheader(f"📋 Configured Tags ({len(st.session_state.catalog.tag_entries)})")
+
+    if st.session_state.catalog.tag_entries:
+        # Convert to dataframe for display
+        tags_df = pd.DataFrame(st.session_state.catalog.tag_entries)
+
+        # Ensure UUID column exists (for backward compatibility)
+        if "UUID" not in tags_df.columns:
+            tags_df["UUID"] = ""
+
+        if len(tags_df) > MAX_TAG_EXPANDERS:
+            # Long lists (e.g. bulk entries) as one table, deleting the selected rows
+            selection = st.dataframe(
+                tags_df,
+                use_container_width=True,
+                hide_index=True,
+                on_select="rerun",
+                selection_mode="multi-row",
+                key=f"configured_tags_table_{st.session_state.get('configured_tags_version', 0)}",
+            )
+            selected_entries = [st.session_state.catalog.tag_entries[idx] for idx in selection.selection.rows]
+            st.button(
+                f"🗑️ Delete {len(selected_entries)} Selected Tags",
+                disabled=not selected_entries,
+                key="delete_selected_tags",
+                on_click=delete_tag_entries,
+                args=(selected_entries,),
+            )
+        else:
+            # Display with option to delete
+            for idx, row in tags_df.iterrows():
+                with st.expander(
+                    f"🏷️ {row['DCS_Tag']} - {row['Raw_Parameter']}", expanded=False
+                ):
+                    col1, col2, col3 = st.columns([2, 2, 1])
+
+                    with col1:
+                        st.write(f"**Generic Tag:** {row['Generic_Tag']}")
+                        st.write(f"**UUID:** {row['UUID'] if row['UUID'] else 'N/A'}")
+                        st.write(f"**UOM:** {row['UOM']}")
+                        st.write(
+                            f"**Tag Description:** {row['Tag_Description'] if row['Tag_Description'] else 'N/A'}"
+                        )
+
+                    with col2:
+                        st.write(f"**Low-Low Limit:** {row['Low_Low_Limit']}")
+                        st.write(f"**Low Limit:** {row['Low_Limit']}")
+                        st.write(f"**High Limit:** {row['High_Limit']}")
+                        st.write(f"**High-High Limit:** {row['High_High_Limit']}")
+
+                    with col3:
+                        st.button(
+                            "🗑️ Delete",
+                            key=f"delete_{idx}",
+                            on_click=delete_tag_entries,
+                            args=([st.session_state.catalog.tag_entries[idx]],),
+                        )
+
+        # Finish button
+        st.markdown("---")
+        st.button(
+            "✅ Finish Configuration", type="primary", use_container_width=True, on_click=finish_configuration
+        )
+    else:
+        st.info("No tags configured yet. Add your first tag above!")
+
+
+@user_action
+def finish_configuration():
+    """Move all tag entries to the configured tags and open the summary (button callback)"""
+    # Cleared from the tag entries to prevent duplicates
+    st.session_state.catalog.finish_tag_entries()
+    st.session_state.page = "summary"
+    # The summary replaces the whole page, not only this fragment
+    request_page_rerun()
+
+
+@user_action
+def clear_tag_form():
+    """Reset all form values to their initial state (button callback)"""
+    st.session_state.tag_input_values = {
+        "dcs_tag": "",
+        "raw_parameter": "",
+        "generic_tag_select": "",
+        "new_generic_tag": "",
+        "uuid": "",
+        "tag_description": "",
+        "uom_select": "",
+        "new_uom": "",
+        "low_low_limit": 0.0,
+        "low_limit": 0.0,
+        "high_limit": 0.0,
+        "high_high_limit": 0.0,
+    }
+    # Clear widget states
+    for key in TAG_FORM_WIDGET_KEYS:
+        if key in st.session_state:
+            del st.session_state[key]
+
+    # Reset the show flags
+    st.session_state.show_new_generic_tag = False
+    st.session_state.show_new_uom = False
+    # Reset form submission to hide Section 2
+    st.session_state.tag_form_submitted = False
+    # Reset last selected generic tag
+    st.session_state.last_selected_generic_tag = ""
+    st.session_state.tag_form_notice = "✅ Form cleared successfully!"
+
+
+@user_action
+def generic_tag_changed():
+    """Hide Section 2 when "+ Add New" is picked as generic tag (selectbox callback)"""
+    # Reset form submission when changing generic tag
+    if st.session_state.generic_tag_select == "+ Add New" and st.session_state.tag_form_submitted:
+        st.session_state.tag_form_submitted = False
+        # Section 2 is outside this fragment
+        request_page_rerun()
+
+
+@user_action
+def submit_tag_basic_info(hierarchy):
+    """Store Section 1 and look up the generic tag's description and UUID (Submit callback)"""
+    # Section 1 values, as its widgets hold them
+    generic_tag = st.session_state.generic_tag_select
+    if generic_tag == "+ Add New":
+        generic_tag = st.session_state.get("new_generic_tag", "")
+    uom = st.session_state.uom_select
+    if uom == "+ Add New":
+        uom = st.session_state.get("new_uom", "")
+    dcs_tag = st.session_state.dcs_tag_input
+    raw_parameter = st.session_state.raw_param_input
+
+    if not (dcs_tag and raw_parameter and generic_tag and uom):
+        st.session_state.tag_form_error = "⚠️ Please fill all required fields (marked with *) before submitting"
+        return
+
+    # Store all form values in session state
+    st.session_state.tag_input_values["dcs_tag"] = dcs_tag
+    st.session_state.tag_input_values["raw_parameter"] = raw_parameter
+    st.session_state.tag_input_values["generic_tag_select"] = generic_tag
+    st.session_state.tag_input_values["uom_select"] = uom
+    st.session_state.tag_input_values["low_low_limit"] = st.session_state.low_low_input
+    st.session_state.tag_input_values["low_limit"] = st.session_state.low_input
+    st.session_state.tag_input_values["high_limit"] = st.session_state.high_input
+    st.session_state.tag_input_values["high_high_limit"] = st.session_state.high_high_input
+
+    # Update metadata and UUID when form is submitted
+    auto_metadata = get_tag_description_for_generic_tag(
+        generic_tag,
+        st.session_state.selected_industry,
+        hierarchy["equipment"]
+    )
+    auto_uuid = get_or_create_uuid_for_generic_tag(
+        generic_tag,
+        st.session_state.selected_industry,
+        hierarchy["equipment"],
+        auto_metadata
+    )
+    st.session_state.tag_input_values["tag_description"] = auto_metadata
+    st.session_state.tag_input_values["uuid"] = auto_uuid
+    # Section 2 shows the new values rather than what its widgets held
+    for key in ["uuid_display", "tag_description_input"]:
+        if key in st.session_state:
+            del st.session_state[key]
+    st.session_state.tag_form_submitted = True
+    # Section 2 is outside this fragment
+    request_page_rerun()
+
+
+@user_action
+def add_tag_entry(hierarchy):
+    """Add the submitted tag and clear the form, keeping Section 2 visible (Add Tag callback)"""
+    # The tag description as typed, which Section 2 has not stored if it was edited with this click
+    tag_description = st.session_state.get(
+        "tag_description_input", st.session_state.tag_input_values["tag_description"]
+    )
+    if not tag_description.strip():
+        st.session_state.tag_input_values["tag_description"] = tag_description
+        return
+
+    # Get all values from session state
+    dcs_tag = st.session_state.tag_input_values["dcs_tag"]
+    raw_parameter = st.session_state.tag_input_values["raw_parameter"]
+    generic_tag = st.session_state.tag_input_values["generic_tag_select"]
+    uom = st.session_state.tag_input_values["uom_select"]
+    low_low_limit = st.session_state.tag_input_values["low_low_limit"]
+    low_limit = st.session_state.tag_input_values["low_limit"]
+    high_limit = st.session_state.tag_input_values["high_limit"]
+    high_high_limit = st.session_state.tag_input_values["high_high_limit"]
+    tag_uuid = st.session_state.tag_input_values["uuid"]
+
+    # Add new generic tag and UOM to the lists if custom
+    if st.session_state.show_new_generic_tag:
+        st.session_state.catalog.add_generic_tag(generic_tag)
+    if st.session_state.show_new_uom:
+        st.session_state.catalog.add_uom(uom)
+
+    # Add the tag; its (possibly edited) tag description is saved to the available
+    # generic tags and the generic tags mapping is updated
+    st.session_state.catalog.add_tag_entry(
+        {
+            "Industry": st.session_state.selected_industry,
+            "Plant": hierarchy["plant"],
+            "Area": hierarchy["area"],
+            "Equipment": hierarchy["equipment"],
+            "Asset": hierarchy["asset"],
+            "DCS_Tag": dcs_tag,
+            "Raw_Parameter": raw_parameter,
+            "Generic_Tag": generic_tag,
+            "UUID": tag_uuid,
+            "Tag_Description": tag_description,
+            "UOM": uom,
+            "Low_Low_Limit": low_low_limit,
+            "Low_Limit": low_limit,
+            "High_Limit": high_limit,
+            "High_High_Limit": high_high_limit,
+        }
+    )
+
+    # Clear all input values and widgets but keep Section 2 visible
+    st.session_state.tag_input_values = {
+        "dcs_tag": "",
+        "raw_parameter": "",
+        "generic_tag_select": "",
+        "new_generic_tag": "",
+        "uuid": "",
+        "tag_description": "",
+        "uom_select": "",
+        "new_uom": "",
+        "low_low_limit": 0.0,
+        "low_limit": 0.0,
+        "high_limit": 0.0,
+        "high_high_limit": 0.0,
+    }
+    for key in TAG_FORM_WIDGET_KEYS:
+        if key in st.session_state:
+            del st.session_state[key]
+
+    # Reset the show flags
+    st.session_state.show_new_generic_tag = False
+    st.session_state.show_new_uom = False
+    # Keep tag_form_submitted as True to keep Section 2 visible
+
+    # Reset last selected generic tag
+    st.session_state.last_selected_generic_tag = ""
+
+    st.session_state.tag_form_notice = f"✅ Tag '{dcs_tag}' added successfully!"
+    # Section 1 and the configured tags are outside this fragment
+    request_page_rerun()
+
+
+@profiled("helper")
+def single_tag_entry_section(hierarchy, suggested_tags):
+    """Section 1 and Section 2 forms adding one tag at a time"""
+    # Add Tag Entry Section with Clear All button
+    col_title, col_clear = st.columns([3, 1])
+    with col_title:
+        st.subheader("➕ Add New Tag")
+    with col_clear:
+        st.button("🗑️ Clear All", use_container_width=True, key="clear_all_button", on_click=clear_tag_form)
+
+    # Result of the last Clear All or Add Tag
+    if "tag_form_notice" in st.session_state:
+        st.success(st.session_state.pop("tag_form_notice"))
+
+    # Initialize input values in session state if they don't exist or need to be cleared
+    if "tag_input_values" not in st.session_state:
+        st.session_state.tag_input_values = {
+            "dcs_tag": "",
+            "raw_parameter": "",
+            "generic_tag_select": "",
+            "new_generic_tag": "",
+            "uuid": "",
+            "tag_description": "",
+            "uom_select": "",
+            "new_uom": "",
+            "low_low_limit": 0.0,
+            "low_limit": 0.0,
+            "high_limit": 0.0,
+            "high_high_limit": 0.0,
+        }
+
+    # Ensure uuid key exists (for backward compatibility with existing sessions)
+    if "uuid" not in st.session_state.tag_input_values:
+        st.session_state.tag_input_values["uuid"] = ""
+
+    # Track last selected generic tag to detect changes
+    if "last_selected_generic_tag" not in st.session_state:
+        st.session_state.last_selected_generic_tag = ""
+
+    tag_basic_info_section(hierarchy, suggested_tags)
+
+    # Section 2: UUID and Tag Description (shown only after Submit)
+    if st.session_state.tag_form_submitted:
+        tag_generated_info_section(hierarchy)
+
+
+@st.fragment
+@profiled("fragment")
+def tag_basic_info_section(hierarchy, suggested_tags):
+    """Section 1: DCS tag, raw parameter, generic tag, UOM and limits, rerun on its own while typing"""
+    fragment_rerun()
+    st.markdown("### 📝 Section 1: Basic Tag Information")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        dcs_tag = st.text_input(
+            "DCS Tag *",
+            placeholder="e.g., TI-101",
+            value=st.session_state.tag_input_values["dcs_tag"],
+            key="dcs_tag_input",
+        )
+        raw_parameter = st.text_input(
+            "Raw Parameter *",
+            placeholder="e.g., Kiln Temperature",
+            value=st.session_state.tag_input_values["raw_parameter"],
+            key="raw_param_input",
+        )
+
+        # Generic tags that best match the DCS tag and raw parameter typed so far
+        matched_tags = []
+        if dcs_tag or raw_parameter:
+            matches = match_generic_tags(
+                dcs_tag, raw_parameter, st.session_state.selected_industry, hierarchy["equipment"]
+            )
+            matched_tags = [tag for tag, _ in matches]
+            if matches:
+                st.caption(
+                    "🔎 Best matches: " + ", ".join(f"{tag} ({score:.2f})" for tag, score in matches)
+                )
+
+        # Generic Tag with custom option - show matched and suggested tags first if available
+        if matched_tags or suggested_tags:
+            first_tags = list(dict.fromkeys(matched_tags + suggested_tags))
+            combined_tags = (
+                first_tags
+                + [
+                    tag
+                    for tag in st.session_state.catalog.generic_tags
+                    if tag not in first_tags
+                ]
+                + ["+ Add New"]
+            )
+        else:
+            combined_tags = st.session_state.catalog.generic_tags + ["+ Add New"]
+
+        # Get the index for the selectbox
+        if st.session_state.tag_input_values["generic_tag_select"] in combined_tags:
+            generic_tag_index = (
+                combined_tags.index(
+                    st.session_state.tag_input_values["generic_tag_select"]
+                )
+                + 1
+            )
+        else:
+            generic_tag_index = 0
+
+        generic_tag_option = st.selectbox(
+            "Generic Tag *",
+            [""] + combined_tags,
+            index=generic_tag_index,
+            key="generic_tag_select",
+            on_change=generic_tag_changed,
+        )
+
+        # Update session state when "+ Add New" is selected
+        if generic_tag_option == "+ Add New":
+            st.session_state.show_new_generic_tag = True
+        else:
+            st.session_state.show_new_generic_tag = False
+
+        # Show text input immediately when "+ Add New" is selected
+        if st.session_state.show_new_generic_tag:
+            st.text_input(
+                "Enter New Generic Tag",
+                value=st.session_state.tag_input_values["new_generic_tag"],
+                key="new_generic_tag",
+            )
+
+        # UOM with custom option
+        # Get the index for the selectbox
+        if st.session_state.tag_input_values["uom_select"] in st.session_state.catalog.uom_list:
+            uom_index = (
+                st.session_state.catalog.uom_list.index(
+                    st.session_state.tag_input_values["uom_select"]
+                )
+                + 1
+            )
+        else:
+            uom_index = 0
+
+        uom_option = st.selectbox(
+            "UOM (Unit of Measurement) *",
+            [""] + st.session_state.catalog.uom_list + ["+ Add New"],
+            index=uom_index,
+            key="uom_select",
+        )
+
+        # Update session state when "+ Add New" is selected
+        if uom_option == "+ Add New":
+            st.session_state.show_new_uom = True
+        else:
+            st.session_state.show_new_uom = False
+
+        # Show text input immediately when "+ Add New" is selected
+        if st.session_state.show_new_uom:
+            st.text_input(
+                "Enter New UOM",
+                value=st.session_state.tag_input_values["new_uom"],
+                key="new_uom",
+            )
+
+    with col2:
+        st.number_input(
+            "Low-Low Limit",
+            value=st.session_state.tag_input_values["low_low_limit"],
+            format="%.2f",
+            key="low_low_input",
+        )
+        st.number_input(
+            "Low Limit",
+            value=st.session_state.tag_input_values["low_limit"],
+            format="%.2f",
+            key="low_input",
+        )
+        st.number_input(
+            "High Limit",
+            value=st.session_state.tag_input_values["high_limit"],
+            format="%.2f",
+            key="high_input",
+        )
+        st.number_input(
+            "High-High Limit",
+            value=st.session_state.tag_input_values["high_high_limit"],
+            format="%.2f",
+            key="high_high_input",
+        )
+
+    # Submit button for Section 1
+    st.markdown("---")
+    submit_col1, submit_col2, submit_col3 = st.columns([1, 1, 1])
+    with submit_col2:
+        st.button(
+            "✅ Submit", type="primary", use_container_width=True, key="submit_section1",
+            on_click=submit_tag_basic_info, args=(hierarchy,),
+        )
+        if "tag_form_error" in st.session_state:
+            st.error(st.session_state.pop("tag_form_error"))
+
+
+@st.fragment
+@profiled("fragment")
+def tag_generated_info_section(hierarchy):
+    """Section 2: UUID and tag description of the submitted tag, and the Add Tag button"""
+    fragment_rerun()
+    st.markdown("---")
+    st.markdown("### 📋 Section 2: Generated Information")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Display UUID field (read-only)
+        st.text_input(
+            "UUID (Auto-generated)",
+            value=st.session_state.tag_input_values["uuid"],
+            key="uuid_display",
+            disabled=True,
+            help="Automatically generated unique identifier for this generic tag"
+        )
+
+    with col2:
+        tag_description = st.text_area(
+            "Tag Description *",
+            placeholder="Enter tag description (required)",
+            value=st.session_state.tag_input_values["tag_description"],
+            height=100,
+            key="tag_description_input",
+        )
+
+        # Update session state with current tag description value (user may have edited it)
+        if tag_description != st.session_state.tag_input_values["tag_description"]:
+            st.session_state.tag_input_values["tag_description"] = tag_description
+
+    # Add Tag button (shown only after Submit) - requires Tag Description
+    st.markdown("---")
+    add_tag_col1, add_tag_col2, add_tag_col3 = st.columns([1, 1, 1])
+    with add_tag_col2:
+        # Check if tag description is filled
+        tag_description_filled = bool(st.session_state.tag_input_values.get("tag_description", "").strip())
+        if not tag_description_filled:
+            st.warning("⚠️ Tag Description is required to add a tag")
+        st.button(
+            "➕ Add Tag", type="primary", use_container_width=True, disabled=not tag_description_filled,
+            on_click=add_tag_entry, args=(hierarchy,),
+        )
+
+
+@profiled("helper")
+def bulk_tag_entry_section(hierarchy):
+    """Map a DCS point list onto tag columns, assign generic tags and UUIDs, review and add it"""
+    # tag_batch imports the storage backends, loaded only once bulk entry is used
+    from tag_batch import guess_point_list_columns, map_point_list, numeric_limits, parse_point_list, point_list_tags
+
+    st.markdown("### 📥 Bulk Entry from a DCS Point List")
+    st.info(
+        "💡 Upload a DCS export (CSV or Excel) with one row per point and map its columns. "
+        "Generic tags are matched automatically and can be reviewed before the tags are added."
+    )
+
+    if "tag_form_notice" in st.session_state:
+        st.success(st.session_state.pop("tag_form_notice"))
+
+    point_list_file = st.file_uploader(
+        "Choose a DCS point list",
+        type=["csv", "xlsx", "xls"],
+        key=f"bulk_point_list_file_{st.session_state.get('bulk_entry_version', 0)}",
+    )
+    if point_list_file is None:
+        st.session_state.pop("bulk_tags", None)
+        return
+
+    # Parse each uploaded file once
+    parsed = st.session_state.get("bulk_point_list")
+    if parsed is None or parsed[0] != point_list_file.file_id:
+        try:
+            parsed = (point_list_file.file_id, parse_point_list(point_list_file, point_list_file.name))
+        except Exception as e:
+            st.error(f"⚠️ Error reading file: {str(e)}")
+            return
+        st.session_state.bulk_point_list = parsed
+        st.session_state.pop("bulk_tags", None)
+    file_id, point_list = parsed
+    st.success(f"✅ {len(point_list):,} points in {point_list_file.name}")
+
+    # Column mapping, guessed from the point list's column names
+    st.markdown("#### 🔗 Column Mapping")
+    options = ["(none)"] + list(point_list.columns)
+    column_map = {}
+    mapping_columns = st.columns(3)
+    for i, (tag_column, column) in enumerate(guess_point_list_columns(point_list.columns).items()):
+        with mapping_columns[i % 3]:
+            choice = st.selectbox(
+                tag_column + (" *" if tag_column == "DCS_Tag" else ""),
+                options,
+                index=options.index(column) if column else 0,
+                key=f"bulk_column_{tag_column}_{file_id}",
+            )
+        column_map[tag_column] = None if choice == "(none)" else choice
+
+    if not column_map["DCS_Tag"]:
+        st.warning("⚠️ Please map the DCS_Tag column to continue")
+        return
+
+    if st.button("🔎 Assign Generic Tags and UUIDs", type="primary", use_container_width=True, key="bulk_prepare"):
+        tags = point_list_tags(
+            map_point_list(
+                point_list,
+                column_map,
+                {
+                    "Industry": st.session_state.selected_industry,
+                    "Plant": hierarchy["plant"],
+                    "Area": hierarchy["area"],
+                    "Equipment": hierarchy["equipment"],
+                    "Asset": hierarchy["asset"],
+                },
+            )
+        )
+        tags = tags[tags["DCS_Tag"] != ""].reset_index(drop=True)
+        # Generic tags, UUIDs and descriptions for all points in one pass
+        scores = st.session_state.catalog.prepare_tag_entries(tags)
+        tags.insert(tags.columns.get_loc("Generic_Tag") + 1, "Match", scores.round(2))
+        st.session_state.bulk_tags = tags
+        st.session_state.bulk_tags_version = st.session_state.get("bulk_tags_version", 0) + 1
+
+    prepared = st.session_state.get("bulk_tags")
+    if prepared is None:
+        return
+
+    # Review grid: generic tags, descriptions, UOMs and limits can be corrected before adding
+    st.markdown("#### 📋 Review")
+    matched = int((prepared["Match"] >= AUTO_MATCH_SCORE).sum())
+    without_generic_tag = int((prepared["Generic_Tag"] == "").sum())
+    st.caption(
+        f"{len(prepared):,} tags: {matched:,} generic tags matched automatically, "
+        f"{without_generic_tag:,} without a generic tag. New generic tags get a UUID when the tags are added."
+    )
+    reviewed = st.data_editor(
+        prepared,
+        use_container_width=True,
+        hide_index=True,
+        column_order=["DCS_Tag", "Raw_Parameter", "Generic_Tag", "Match", "UUID", "Tag_Description", "UOM"]
+        + TAG_LIMIT_COLUMNS,
+        disabled=["DCS_Tag", "Match", "UUID"],
+        column_config={"Match": st.column_config.NumberColumn("Match", format="%.2f")},
+        key=f"bulk_review_{st.session_state.bulk_tags_version}",
+    )
+
+    issues = validate_tags(reviewed, known_uoms=st.session_state.catalog.uom_list)
+    if not issues.empty:
+        st.warning(f"⚠️ {len(issues):,} validation issues")
+        with st.expander("Show issues"):
+            st.dataframe(issues, use_container_width=True, hide_index=True)
+
+    if st.button(f"✅ Add {len(reviewed):,} Tags", type="primary", use_container_width=True, key="bulk_add"):
+        reviewed = reviewed.drop(columns="Match")
+        # Generic tags changed in the review are resolved again, keeping descriptions edited by hand
+        changed = reviewed["Generic_Tag"] != prepared["Generic_Tag"]
+        reviewed.loc[changed, "UUID"] = ""
+        reviewed.loc[changed & (reviewed["Tag_Description"] == prepared["Tag_Description"]), "Tag_Description"] = ""
+        n_tags = st.session_state.catalog.add_tag_entries(numeric_limits(reviewed))
+        # Start over with an empty uploader, so the same points cannot be added twice
+        del st.session_state["bulk_tags"]
+        st.session_state.pop("bulk_point_list", None)
+        st.session_state.bulk_entry_version = st.session_state.get("bulk_entry_version", 0) + 1
+        st.session_state.tag_form_notice = f"✅ {n_tags:,} tags added successfully!"
+        st.rerun()
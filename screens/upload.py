@@ -0,0 +1,272 @@
+"""Upload Generic Tags screen"""
+
+import streamlit as st
+import pandas as pd
+import hashlib
+import time
+
+from generic_tag_upload import (
+    ingest_generic_tags_batch,
+    ingest_generic_tags_file,
+    inspect_upload,
+    mapping_from_file_name,
+    parse_uploads,
+    prefetch_upload,
+    upload_cache,
+)
+from rerun_profile import profiled
+from screens.common import INDUSTRIES, go_to_page, quick_actions_sidebar
+
+
+@profiled("screen")
+def upload_generic_tags_screen():
+    """Display upload page for generic tags mapping"""
+    quick_actions_sidebar()
+
+    # Track current page
+    st.session_state.last_page = "upload"
+
+    st.title("📤 Upload Generic Tags Mapping")
+
+    st.button("← Back to Summary", on_click=go_to_page, args=("summary",))
+
+    st.markdown("---")
+
+    st.info("💡 Upload a CSV or Excel file with 'Generic Tag' and 'Tag Description' columns for a specific Industry and Equipment combination.")
+
+    # Industry and Equipment selection
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Get list of industries without emojis
+        industries_clean = [ind.split(" ", 1)[1] for ind in INDUSTRIES]
+        selected_industry = st.selectbox(
+            "🏭 Select Industry *",
+            [""] + industries_clean,
+            key="upload_industry_select"
+        )
+
+    with col2:
+        # Get existing equipment options from tags_data for selected industry
+        if selected_industry and not st.session_state.catalog.tags_data.empty:
+            equipment_options = sorted(
+                st.session_state.catalog.tags_data[
+                    st.session_state.catalog.tags_data["Industry"] == selected_industry
+                ]["Equipment"].unique().tolist()
+            )
+        else:
+            equipment_options = []
+
+        # Allow both selecting existing or entering new equipment
+        equipment_input_type = st.radio(
+            "Equipment Input",
+            ["Select Existing", "Enter New"],
+            horizontal=True,
+            key="upload_equipment_radio"
+        )
+
+        if equipment_input_type == "Select Existing" and equipment_options:
+            selected_equipment = st.selectbox(
+                "⚙️ Select Equipment *",
+                [""] + equipment_options,
+                key="upload_equipment_select"
+            )
+        else:
+            selected_equipment = st.text_input(
+                "⚙️ Enter Equipment Name *",
+                key="upload_equipment_input"
+            )
+
+    st.markdown("---")
+
+    # File upload section
+    st.subheader("📁 Upload Files")
+
+    uploaded_files = st.file_uploader(
+        "Choose CSV or Excel files",
+        type=["csv", "xlsx", "xls"],
+        accept_multiple_files=True,
+        help="Each file should contain at least 'Generic Tag' and 'Tag Description' columns"
+    )
+
+    if not uploaded_files:
+        st.info("📂 Please upload a file to continue")
+    elif len(uploaded_files) == 1:
+        upload_generic_tags_file(uploaded_files[0], selected_industry, selected_equipment)
+    else:
+        upload_generic_tags_files(uploaded_files, industries_clean, selected_industry, selected_equipment)
+
+
+@profiled("helper")
+def finish_upload(upload_report):
+    """Show the result of an upload and redirect to the summary page"""
+    st.session_state.upload_report = upload_report
+
+    st.success(upload_report)
+    st.balloons()
+
+    # Redirect to summary page after short delay
+    st.info("Redirecting to summary page...")
+    st.session_state.page = "summary"
+    st.rerun()
+
+
+@profiled("helper")
+def upload_generic_tags_file(uploaded_file, selected_industry, selected_equipment):
+    """Preview and process a single uploaded generic tags file"""
+    st.success(f"✅ File uploaded: {uploaded_file.name}")
+
+    # Preview the file (only the header and the first rows are parsed here,
+    # cached by file content so widget reruns do not parse it again)
+    try:
+        file_columns, missing_columns, df_preview = inspect_upload(
+            uploaded_file, uploaded_file.name, n_rows=10
+        )
+
+        st.subheader("📋 File Preview")
+        st.dataframe(df_preview, use_container_width=True, hide_index=True)
+
+        # Check if required columns exist
+
+        if missing_columns:
+            st.error(f"⚠️ Missing required columns: {', '.join(missing_columns)}")
+            st.info(f"Available columns: {', '.join(str(col) for col in file_columns)}")
+        else:
+            st.success("✅ File contains all required columns!")
+
+            # Parse the full file in the background while the user picks industry and equipment
+            prefetch_upload(uploaded_file, uploaded_file.name)
+
+            # Upload button
+            if selected_industry and selected_equipment:
+                if st.button("📤 Upload and Process", type="primary", use_container_width=True):
+                    # Stream the file in chunks, each processed in one set-based pass
+                    progress_bar = st.progress(0.0, text="Processing file...")
+                    n_rows, elapsed = ingest_generic_tags_file(
+                        uploaded_file,
+                        uploaded_file.name,
+                        selected_industry,
+                        selected_equipment,
+                        st.session_state.catalog.generic_tag_registry,
+                        st.session_state.catalog.generic_tags_mapping,
+                        st.session_state.catalog.generic_tags,
+                        on_progress=lambda fraction, rows: progress_bar.progress(
+                            fraction, text=f"Processed {rows:,} rows..."
+                        ),
+                        cache=upload_cache,
+                    )
+                    progress_bar.progress(1.0, text=f"Processed {n_rows:,} rows")
+                    rows_per_second = n_rows / elapsed if elapsed else float(n_rows)
+                    finish_upload(
+                        f"✅ Successfully uploaded {n_rows} generic tags for {selected_industry} - {selected_equipment}! "
+                        f"({elapsed:.2f}s, {rows_per_second:,.0f} rows/s)"
+                    )
+            else:
+                st.warning("⚠️ Please select both Industry and Equipment to proceed with upload")
+
+    except Exception as e:
+        st.error(f"⚠️ Error reading file: {str(e)}")
+
+
+@profiled("helper")
+def upload_generic_tags_files(uploaded_files, industries, default_industry, default_equipment):
+    """Map several uploaded generic tags files to industries and equipment and process them in one batch"""
+    st.success(f"✅ {len(uploaded_files)} files uploaded")
+
+    from_file_names = st.checkbox(
+        "Take Industry and Equipment from the file names (Industry__EQUIPMENT.xlsx or EQUIPMENT.xlsx)",
+        value=True,
+        key="upload_mapping_from_file_names",
+        help="Files whose name does not give them default to the Industry and Equipment selected above"
+    )
+
+    # Check the header of every file (cached by file content, like the preview)
+    mapping_rows = []
+    mapped_files = []
+    invalid_files = []
+    for file in uploaded_files:
+        try:
+            _, missing_columns, _ = inspect_upload(file, file.name, n_rows=10)
+            status = f"Missing required columns: {', '.join(missing_columns)}" if missing_columns else "OK"
+        except Exception as e:
+            status = f"Error reading file: {str(e)}"
+        if status != "OK":
+            invalid_files.append((file.name, status))
+            continue
+        industry, equipment = mapping_from_file_name(file.name, industries) if from_file_names else (None, "")
+        mapped_files.append(file)
+        mapping_rows.append({
+            "File": file.name,
+            "Industry": industry or default_industry,
+            "Equipment": equipment or default_equipment,
+            "Size (MB)": round(file.size / 1024 / 1024, 2),
+        })
+
+    for file_name, status in invalid_files:
+        st.error(f"⚠️ {file_name}: {status} (skipped)")
+    if not mapping_rows:
+        return
+
+    st.subheader("🗂️ Industry and Equipment per File")
+    # Keyed by the file set, so a new selection starts from the file names again
+    files_key = hashlib.md5(
+        "|".join(row["File"] for row in mapping_rows).encode() + bytes([from_file_names])
+    ).hexdigest()
+    mapping = st.data_editor(
+        pd.DataFrame(mapping_rows),
+        use_container_width=True,
+        hide_index=True,
+        disabled=["File", "Size (MB)"],
+        column_config={
+            "Industry": st.column_config.SelectboxColumn("Industry", options=industries, required=True),
+            "Equipment": st.column_config.TextColumn("Equipment", required=True),
+        },
+        key=f"upload_mapping_{files_key}",
+    )
+
+    unmapped = mapping[(mapping["Industry"].fillna("") == "") | (mapping["Equipment"].fillna("").str.strip() == "")]
+    if not unmapped.empty:
+        st.warning(f"⚠️ Please set Industry and Equipment for: {', '.join(unmapped['File'])}")
+        return
+
+    if st.button("📤 Upload and Process All", type="primary", use_container_width=True):
+        # Rows follow mapped_files, so files sharing a name stay apart
+        uploads = [(file.name, file.getvalue()) for file in mapped_files]
+        n_bytes = sum(len(content) for _, content in uploads)
+
+        # Parse and validate the files in parallel worker processes
+        start = time.perf_counter()
+        progress_bar = st.progress(0.0, text=f"Parsing {len(uploads)} files...")
+        results = parse_uploads(
+            uploads,
+            on_progress=lambda done, total: progress_bar.progress(
+                done / total, text=f"Parsed {done} of {total} files..."
+            ),
+        )
+        errors = [(name, error) for (name, _), (_, error) in zip(uploads, results) if error]
+        if errors:
+            for file_name, error in errors:
+                st.error(f"⚠️ {file_name}: {error}")
+            st.error("Nothing was uploaded, fix or remove these files")
+            return
+
+        # Merge all the files into the available generic tags in one batch
+        batches = [
+            (df, industry, equipment.strip())
+            for (df, _), industry, equipment in zip(results, mapping["Industry"], mapping["Equipment"])
+        ]
+        n_rows, _ = ingest_generic_tags_batch(
+            batches,
+            st.session_state.catalog.generic_tag_registry,
+            st.session_state.catalog.generic_tags_mapping,
+            st.session_state.catalog.generic_tags,
+        )
+        elapsed = time.perf_counter() - start
+        progress_bar.progress(1.0, text=f"Processed {n_rows:,} rows")
+
+        megabytes = n_bytes / 1024 / 1024
+        finish_upload(
+            f"✅ Successfully uploaded {n_rows} generic tags from {len(uploads)} files ({megabytes:.1f} MB)! "
+            f"({elapsed:.2f}s, {n_rows / elapsed if elapsed else n_rows:,.0f} rows/s, "
+            f"{megabytes / elapsed if elapsed else megabytes:,.1f} MB/s)"
+        )
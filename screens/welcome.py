@@ -0,0 +1,35 @@
+"""Welcome screen: industry selection"""
+
+import streamlit as st
+
+from rerun_profile import profiled
+from screens.common import INDUSTRIES, quick_actions_sidebar, user_action
+
+
+@user_action
+def select_industry(industry):
+    """Open the Plant Hierarchy screen of an industry (button callback)"""
+    st.session_state.selected_industry = industry.split(" ", 1)[1]  # Remove emoji
+    st.session_state.page = "hierarchy"
+
+
+@profiled("screen")
+def welcome_screen():
+    """Display welcome screen with industry selection"""
+    quick_actions_sidebar()
+
+    # Track current page
+    st.session_state.last_page = "welcome"
+
+    st.markdown(
+        '<div class="welcome-header">Hey, Infinitian! Welcome 👋</div>',
+        unsafe_allow_html=True,
+    )
+    st.markdown("---")
+    st.subheader("Select Manufacturing Industry")
+
+    # Create industry cards in grid
+    cols = st.columns(4)
+    for idx, industry in enumerate(INDUSTRIES):
+        with cols[idx % 4]:
+            st.button(industry, key=f"ind_{idx}", use_container_width=True, on_click=select_industry, args=(industry,))
@@ -0,0 +1,645 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+import pandas as pd
+
+from generic_tag_registry import GENERIC_TAG_CATEGORY_COLUMNS, GENERIC_TAG_COLUMNS, MAPPING_COLUMNS
+from hierarchy_index import HIERARCHY_LEVELS
+from rerun_profile import profiled
+from tag_catalog import HIERARCHY_COLUMNS, TAG_COLUMNS, TAG_LIMIT_COLUMNS, compact_tags, plain_columns
+# Rows read from tag_metadata.csv per chunk during the migration
+IMPORT_CHUNK_ROWS = 50_000
+# Row ids bound per statement, well below SQLite's host parameter limit
+_ID_BATCH = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value
+);
+
+CREATE TABLE IF NOT EXISTS tags (
+    id INTEGER PRIMARY KEY,
+    Industry TEXT NOT NULL DEFAULT '',
+    Plant TEXT NOT NULL DEFAULT '',
+    Area TEXT NOT NULL DEFAULT '',
+    Equipment TEXT NOT NULL DEFAULT '',
+    Asset TEXT NOT NULL DEFAULT '',
+    DCS_Tag TEXT NOT NULL DEFAULT '',
+    Raw_Parameter TEXT NOT NULL DEFAULT '',
+    Generic_Tag TEXT NOT NULL DEFAULT '',
+    UUID TEXT NOT NULL DEFAULT '',
+    Tag_Description TEXT NOT NULL DEFAULT '',
+    UOM TEXT NOT NULL DEFAULT '',
+    Low_Low_Limit REAL,
+    Low_Limit REAL,
+    High_Limit REAL,
+    High_High_Limit REAL
+);
+-- Hierarchy lookups use the (Industry, Plant, Area, Equipment, Asset) prefix;
+-- DCS_Tag last makes it the natural key of a tag as well
+CREATE UNIQUE INDEX IF NOT EXISTS idx_tags_hierarchy
+    ON tags (Industry, Plant, Area, Equipment, Asset, DCS_Tag);
+CREATE INDEX IF NOT EXISTS idx_tags_dcs_tag ON tags (DCS_Tag);
+CREATE INDEX IF NOT EXISTS idx_tags_uuid ON tags (UUID);
+CREATE INDEX IF NOT EXISTS idx_tags_generic_tag ON tags (Generic_Tag);
+
+CREATE TABLE IF NOT EXISTS hierarchy (
+    Industry TEXT NOT NULL,
+    Plant TEXT NOT NULL,
+    Area TEXT NOT NULL,
+    Equipment TEXT NOT NULL,
+    Asset TEXT NOT NULL,
+    PRIMARY KEY (Industry, Plant, Area, Equipment, Asset)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS generic_tags (
+    id INTEGER PRIMARY KEY,
+    Generic_Tag TEXT,
+    UUID TEXT,
+    Tag_Description TEXT,
+    Industry TEXT,
+    Equipment TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_generic_tags_lookup
+    ON generic_tags (Generic_Tag, Industry, Equipment);
+CREATE INDEX IF NOT EXISTS idx_generic_tags_equipment
+    ON generic_tags (Industry, Equipment);
+CREATE INDEX IF NOT EXISTS idx_generic_tags_uuid ON generic_tags (UUID);
+
+CREATE TABLE IF NOT EXISTS generic_tags_mapping (
+    Generic_Tag TEXT NOT NULL,
+    Industry TEXT NOT NULL,
+    Equipment TEXT NOT NULL,
+    Count INTEGER NOT NULL,
+    Last_Updated TEXT,
+    PRIMARY KEY (Generic_Tag, Industry, Equipment)
+) WITHOUT ROWID;
+"""
+
+
+def _text(value):
+    """Text cell value, with missing values stored as an empty string"""
+    if value is None or (isinstance(value, float) and value != value):
+        return ""
+    return str(value)
+
+
+def _number(value):
+    """Limit cell value, with missing or non-numeric values stored as NULL"""
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if value != value else value
+
+
+def _tag_rows(df):
+    """Rows of a tags DataFrame as tuples in TAG_COLUMNS order"""
+    df = plain_columns(df)
+    columns = []
+    for column in TAG_COLUMNS:
+        values = df[column].tolist() if column in df.columns else [None] * len(df)
+        convert = _number if column in TAG_LIMIT_COLUMNS else _text
+        columns.append([convert(value) for value in values])
+    return zip(*columns)
+
+
+def _batches(values, size=_ID_BATCH):
+    values = list(values)
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+class TagDatabase:
+    """Embedded SQLite store for tags, hierarchy and the generic tag catalog
+
+    One instance is shared by every session of the process (see open_database).
+    Streamlit runs each rerun on a new thread, so all threads share one
+    connection, used by one thread at a time (a transaction holds it until it
+    ends). Every write method is one transaction.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, isolation_level=None, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock:
+            self._conn.executescript(SCHEMA)
+
+    @contextmanager
+    def connection(self):
+        """The shared SQLite connection, held by the calling thread"""
+        with self._lock:
+            yield self._conn
+
+    @contextmanager
+    def transaction(self):
+        """Write transaction, committed on success and rolled back on error
+
+        Nested use joins the enclosing transaction.
+        """
+        with self.connection() as conn:
+            if conn.in_transaction:
+                yield conn
+                return
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    @profiled("io")
+    def query(self, sql, params=()):
+        with self.connection() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    @profiled("io")
+    def scalar(self, sql, params=()):
+        with self.connection() as conn:
+            row = conn.execute(sql, params).fetchone()
+        return row[0] if row is not None else None
+
+    @profiled("io")
+    def frame(self, sql, params=(), columns=None, index=None):
+        """Result of a query as a DataFrame"""
+        with self.connection() as conn:
+            cursor = conn.execute(sql, params)
+            columns = columns or [description[0] for description in cursor.description]
+            rows = cursor.fetchall()
+        df = pd.DataFrame.from_records(rows, columns=columns)
+        if index is not None:
+            df = df.set_index(index)
+            df.index.name = None
+        return df
+
+    def get_meta(self, key, default=None):
+        value = self.scalar("SELECT value FROM meta WHERE key = ?", (key,))
+        return default if value is None else value
+
+    def set_meta(self, key, value):
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT INTO meta (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, value),
+            )
+
+    def bump_version(self, name):
+        """Increment a change counter inside the current transaction"""
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT INTO meta (key, value) VALUES (?, 1) "
+                "ON CONFLICT(key) DO UPDATE SET value = value + 1",
+                (f"{name}_version",),
+            )
+
+    # Tags
+
+    def count_tags(self, **filters):
+        """Number of tags matching equality filters on tag columns"""
+        where, params = self._tag_filters(filters)
+        return self.scalar(f"SELECT COUNT(*) FROM tags{where}", params)
+
+    def tags_frame(self, offset=0, limit=None, **filters):
+        """One page of tags in insertion order, indexed by tag id"""
+        where, params = self._tag_filters(filters)
+        sql = f"SELECT id, {', '.join(TAG_COLUMNS)} FROM tags{where} ORDER BY id"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params = params + (limit, offset)
+        return compact_tags(self.frame(sql, params, columns=["id"] + TAG_COLUMNS, index="id"))
+
+    def tag(self, tag_id):
+        """A single tag as a Series, or None"""
+        df = self.frame(
+            f"SELECT id, {', '.join(TAG_COLUMNS)} FROM tags WHERE id = ?",
+            (int(tag_id),),
+            columns=["id"] + TAG_COLUMNS,
+            index="id",
+        )
+        return df.iloc[0] if not df.empty else None
+
+    def _tag_filters(self, filters):
+        unknown = set(filters) - set(TAG_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown tag columns: {sorted(unknown)}")
+        if not filters:
+            return "", ()
+        where = " AND ".join(f"{column} = ?" for column in filters)
+        return f" WHERE {where}", tuple(filters.values())
+
+    @profiled("io")
+    def upsert_tags(self, df):
+        """Insert tags, replacing the ones with the same hierarchy and DCS_Tag
+
+        The hierarchy paths of the tags are registered too. Returns the number of
+        rows written.
+        """
+        updates = ", ".join(
+            f"{column} = excluded.{column}" for column in TAG_COLUMNS if column not in HIERARCHY_COLUMNS + ["DCS_Tag"]
+        )
+        sql = (
+            f"INSERT INTO tags ({', '.join(TAG_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(TAG_COLUMNS))}) "
+            f"ON CONFLICT(Industry, Plant, Area, Equipment, Asset, DCS_Tag) DO UPDATE SET {updates}"
+        )
+        with self.transaction() as conn:
+            before = conn.total_changes
+            conn.executemany(sql, _tag_rows(df))
+            written = conn.total_changes - before
+            paths = df[HIERARCHY_COLUMNS].drop_duplicates()
+            conn.executemany(
+                f"INSERT OR IGNORE INTO hierarchy ({', '.join(HIERARCHY_COLUMNS)}) VALUES (?, ?, ?, ?, ?)",
+                ([_text(value) for value in path] for path in paths.itertuples(index=False)),
+            )
+            self.bump_version("tags")
+        return written
+
+    @profiled("io")
+    def update_tags(self, tag_ids, values):
+        """Set the same column values on several tags in one transaction
+
+        Raises sqlite3.IntegrityError if a tag would duplicate another tag's
+        hierarchy and DCS_Tag.
+        """
+        unknown = set(values) - set(TAG_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown tag columns: {sorted(unknown)}")
+        assignments = ", ".join(f"{column} = ?" for column in values)
+        params = tuple(
+            _number(value) if column in TAG_LIMIT_COLUMNS else _text(value)
+            for column, value in values.items()
+        )
+
+        with self.transaction() as conn:
+            for batch in _batches(int(tag_id) for tag_id in tag_ids):
+                placeholders = ", ".join("?" * len(batch))
+                conn.execute(f"UPDATE tags SET {assignments} WHERE id IN ({placeholders})", params + tuple(batch))
+                # Moved tags register their new hierarchy path
+                if set(values) & set(HIERARCHY_COLUMNS):
+                    conn.execute(
+                        f"INSERT OR IGNORE INTO hierarchy ({', '.join(HIERARCHY_COLUMNS)}) "
+                        f"SELECT DISTINCT {', '.join(HIERARCHY_COLUMNS)} FROM tags WHERE id IN ({placeholders})",
+                        tuple(batch),
+                    )
+            self.bump_version("tags")
+
+    @profiled("io")
+    def sync_generic_tags(self):
+        """Register generic tags used by tags but missing from the catalog
+
+        Mirrors saving tag_metadata.csv: the first tag of each generic tag,
+        industry and equipment combination that has a UUID is added, existing
+        catalog entries are never changed. Returns the number of entries added.
+        """
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO generic_tags (Generic_Tag, UUID, Tag_Description, Industry, Equipment)
+                SELECT t.Generic_Tag, t.UUID, t.Tag_Description, t.Industry, t.Equipment
+                FROM tags t
+                WHERE t.id IN (
+                    SELECT MIN(id) FROM tags
+                    WHERE Generic_Tag != '' AND UUID != ''
+                    GROUP BY Generic_Tag, Industry, Equipment
+                )
+                AND NOT EXISTS (
+                    SELECT 1 FROM generic_tags g
+                    WHERE g.Generic_Tag = t.Generic_Tag
+                    AND g.Industry = t.Industry
+                    AND g.Equipment = t.Equipment
+                )
+                ORDER BY t.id
+                """
+            )
+            added = cursor.rowcount
+            if added:
+                self.bump_version("generic_tags")
+        return added
+
+    def import_tag_metadata_csv(self, csv_path, chunk_rows=IMPORT_CHUNK_ROWS):
+        """Migrate a tag_metadata.csv file into the database in one transaction
+
+        Tags (and their hierarchy paths) are upserted chunk by chunk, then their
+        generic tags are registered. Returns the number of rows read.
+        """
+        n_rows = 0
+        with self.transaction():
+            for chunk in pd.read_csv(csv_path, chunksize=chunk_rows):
+                self.upsert_tags(chunk)
+                n_rows += len(chunk)
+            self.sync_generic_tags()
+        return n_rows
+
+    def migrate_tag_metadata_csv(self, csv_path):
+        """Import tag_metadata.csv once; later calls are no-ops
+
+        Returns the number of rows imported, or None if nothing was done.
+        """
+        if not os.path.exists(csv_path) or self.get_meta("tag_metadata_migrated"):
+            return None
+        with self.transaction():
+            n_rows = self.import_tag_metadata_csv(csv_path)
+            self.set_meta("tag_metadata_migrated", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        return n_rows
+
+
+_databases = {}
+_databases_lock = threading.Lock()
+
+
+def open_database(path, migrate_csv=None):
+    """Process-wide TagDatabase for a path, created (and migrated) on first use"""
+    key = os.path.abspath(path)
+    with _databases_lock:
+        db = _databases.get(key)
+        if db is None:
+            db = TagDatabase(path)
+            if migrate_csv is not None:
+                db.migrate_tag_metadata_csv(migrate_csv)
+            _databases[key] = db
+    return db
+
+
+class _HierarchyNames:
+    """Sorted child names under a hierarchy path, read from SQLite a page at a time"""
+
+    def __init__(self, db, industry, path):
+        self._db = db
+        self._level = HIERARCHY_LEVELS[len(path)]
+        self._where = " AND ".join(f"{column} = ?" for column in HIERARCHY_COLUMNS[:len(path) + 1])
+        self._params = (industry,) + tuple(path)
+        self._length = None
+
+    def __len__(self):
+        if self._length is None:
+            self._length = self._db.scalar(
+                f"SELECT COUNT(DISTINCT {self._level}) FROM hierarchy WHERE {self._where}",
+                self._params,
+            )
+        return self._length
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def slice(self, start, stop):
+        """Names between two positions in sorted order"""
+        rows = self._db.query(
+            f"SELECT DISTINCT {self._level} FROM hierarchy WHERE {self._where} "
+            f"ORDER BY {self._level} LIMIT ? OFFSET ?",
+            self._params + (max(stop - start, 0), start),
+        )
+        return [row[0] for row in rows]
+
+    def tolist(self):
+        return self.slice(0, len(self))
+
+
+class SQLiteHierarchyIndex:
+    """HierarchyIndex backed by the hierarchy table of a TagDatabase"""
+
+    def __init__(self, db):
+        self._db = db
+
+    def __len__(self):
+        """Number of distinct Industry/Plant/Area/Equipment/Asset paths"""
+        return self._db.scalar("SELECT COUNT(*) FROM hierarchy")
+
+    def add(self, industry, plant, area, equipment, asset):
+        """Add a hierarchy path; returns False if it already existed"""
+        with self._db.transaction() as conn:
+            cursor = conn.execute(
+                f"INSERT OR IGNORE INTO hierarchy ({', '.join(HIERARCHY_COLUMNS)}) VALUES (?, ?, ?, ?, ?)",
+                (industry, plant, area, equipment, asset),
+            )
+        return cursor.rowcount == 1
+
+    def names(self, industry, *path):
+        """Sorted child names under a path (empty path -> plants), or None"""
+        names = _HierarchyNames(self._db, industry, path)
+        return names if len(names) else None
+
+    def children(self, industry, *path):
+        """Sorted child names under a path (empty path -> plants)"""
+        names = self.names(industry, *path)
+        return names.tolist() if names is not None else []
+
+    def search(self, industry, text, limit=None):
+        """Full paths of an industry where any level name contains text (case-insensitive)"""
+        matches = " OR ".join(f"instr(lower({level}), ?) > 0" for level in HIERARCHY_LEVELS)
+        sql = (
+            f"SELECT {', '.join(HIERARCHY_LEVELS)} FROM hierarchy "
+            f"WHERE Industry = ? AND ({matches}) ORDER BY {', '.join(HIERARCHY_LEVELS)}"
+        )
+        params = (industry,) + (text.lower(),) * len(HIERARCHY_LEVELS)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params += (limit,)
+        return [tuple(row) for row in self._db.query(sql, params)]
+
+    def values(self, level, industry=None, filters=None):
+        """Sorted unique names at a level, optionally filtered by industry and parent names"""
+        depth = HIERARCHY_LEVELS.index(level)
+        filters = filters or {}
+        conditions = {"Industry": industry} if industry else {}
+        for parent in HIERARCHY_LEVELS[:depth]:
+            if filters.get(parent):
+                conditions[parent] = filters[parent]
+
+        where = " AND ".join(f"{column} = ?" for column in conditions)
+        rows = self._db.query(
+            f"SELECT DISTINCT {level} FROM hierarchy"
+            f"{' WHERE ' + where if where else ''} ORDER BY {level}",
+            tuple(conditions.values()),
+        )
+        return [row[0] for row in rows]
+
+
+class SQLiteGenericTagRegistry:
+    """GenericTagRegistry backed by the generic_tags table of a TagDatabase
+
+    Lookups return the first matching entry, like the in-memory registry.
+    """
+
+    def __init__(self, db):
+        self._db = db
+
+    def __len__(self):
+        return self._db.scalar("SELECT COUNT(*) FROM generic_tags")
+
+    @property
+    def empty(self):
+        return self._db.scalar("SELECT 1 FROM generic_tags LIMIT 1") is None
+
+    @property
+    def frame(self):
+        """DataFrame of all available generic tags (reads the whole table)"""
+        df = self._db.frame(
+            f"SELECT {', '.join(GENERIC_TAG_COLUMNS)} FROM generic_tags ORDER BY id",
+            columns=GENERIC_TAG_COLUMNS,
+        )
+        return df.astype(dict.fromkeys(GENERIC_TAG_CATEGORY_COLUMNS, "category"))
+
+    @property
+    def version(self):
+        """Change counter of the available generic tags"""
+        return self._db.get_meta("generic_tags_version", 0)
+
+    def find(self, generic_tag, industry, equipment):
+        """Row id for a generic tag: exact equipment match first, then industry only"""
+        row = self._db.scalar(
+            "SELECT id FROM generic_tags WHERE Generic_Tag = ? AND Industry = ? AND Equipment = ? "
+            "ORDER BY id LIMIT 1",
+            (generic_tag, industry, equipment),
+        )
+        if row is None:
+            row = self._db.scalar(
+                "SELECT id FROM generic_tags WHERE Generic_Tag = ? AND Industry = ? ORDER BY id LIMIT 1",
+                (generic_tag, industry),
+            )
+        return row
+
+    def contains(self, generic_tag, industry, equipment):
+        """Check whether the exact generic tag, industry and equipment combination exists"""
+        return self._db.scalar(
+            "SELECT 1 FROM generic_tags WHERE Generic_Tag = ? AND Industry = ? AND Equipment = ? LIMIT 1",
+            (generic_tag, industry, equipment),
+        ) is not None
+
+    def get(self, generic_tag, industry, equipment, column, default=""):
+        """Value of a column for a generic tag, using the same fallback as find()"""
+        if column not in GENERIC_TAG_COLUMNS:
+            raise ValueError(f"Unknown generic tag column: {column}")
+        row = self.find(generic_tag, industry, equipment)
+        if row is None:
+            return default
+        return self._db.scalar(f"SELECT {column} FROM generic_tags WHERE id = ?", (row,))
+
+    def tags_for_equipment(self, industry, equipment):
+        """Generic tags for an industry and equipment, falling back to the industry"""
+        rows = self._db.query(
+            "SELECT Generic_Tag FROM generic_tags WHERE Industry = ? AND Equipment = ? "
+            "GROUP BY Generic_Tag ORDER BY MIN(id)",
+            (industry, equipment),
+        )
+        if not rows:
+            rows = self._db.query(
+                "SELECT Generic_Tag FROM generic_tags WHERE Industry = ? GROUP BY Generic_Tag ORDER BY MIN(id)",
+                (industry,),
+            )
+        return [row[0] for row in rows]
+
+    def industries(self):
+        """Sorted industries that have generic tags"""
+        return [row[0] for row in self._db.query("SELECT DISTINCT Industry FROM generic_tags ORDER BY Industry")]
+
+    def equipment_for(self, industry):
+        """Sorted equipment that has generic tags in an industry"""
+        rows = self._db.query(
+            "SELECT DISTINCT Equipment FROM generic_tags WHERE Industry = ? ORDER BY Equipment",
+            (industry,),
+        )
+        return [row[0] for row in rows]
+
+    def descriptions(self, start=0):
+        """(Generic_Tag, Tag_Description) of the entries from position start on, in insertion order"""
+        return self._db.query(
+            "SELECT Generic_Tag, Tag_Description FROM generic_tags ORDER BY id LIMIT -1 OFFSET ?", (start,)
+        )
+
+    def rows_for(self, industry, equipment):
+        """Generic tags of an industry and equipment as a DataFrame"""
+        return self._db.frame(
+            f"SELECT {', '.join(GENERIC_TAG_COLUMNS)} FROM generic_tags "
+            "WHERE Industry = ? AND Equipment = ? ORDER BY id",
+            (industry, equipment),
+            columns=GENERIC_TAG_COLUMNS,
+        )
+
+    def add(self, generic_tag, tag_uuid, tag_description, industry, equipment):
+        """Append a single generic tag"""
+        self.add_columns(
+            {
+                "Generic_Tag": [generic_tag],
+                "UUID": [tag_uuid],
+                "Tag_Description": [tag_description],
+                "Industry": [industry],
+                "Equipment": [equipment],
+            }
+        )
+
+    def add_many(self, entries):
+        """Append several generic tag entries (dicts keyed by GENERIC_TAG_COLUMNS)"""
+        entries = list(entries)
+        self.add_columns({column: [entry.get(column) for entry in entries] for column in GENERIC_TAG_COLUMNS})
+
+    def add_columns(self, columns):
+        """Append generic tags given column-wise as a dict of equally long lists"""
+        n_rows = len(next(iter(columns.values()))) if columns else 0
+        if not n_rows:
+            return
+        values = [columns.get(column) or [None] * n_rows for column in GENERIC_TAG_COLUMNS]
+        with self._db.transaction() as conn:
+            conn.executemany(
+                f"INSERT INTO generic_tags ({', '.join(GENERIC_TAG_COLUMNS)}) VALUES (?, ?, ?, ?, ?)",
+                zip(*values),
+            )
+            self._db.bump_version("generic_tags")
+
+    def update_description(self, generic_tag, industry, equipment, tag_description):
+        """Update the tag description of an exact match; returns False if there is none"""
+        with self._db.transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE generic_tags SET Tag_Description = ? WHERE id = ("
+                "SELECT id FROM generic_tags WHERE Generic_Tag = ? AND Industry = ? AND Equipment = ? "
+                "ORDER BY id LIMIT 1)",
+                (tag_description, generic_tag, industry, equipment),
+            )
+            if cursor.rowcount:
+                self._db.bump_version("generic_tags")
+        return cursor.rowcount == 1
+
+
+class SQLiteGenericTagMapping:
+    """GenericTagMapping backed by the generic_tags_mapping table of a TagDatabase"""
+
+    def __init__(self, db):
+        self._db = db
+
+    def __len__(self):
+        return self._db.scalar("SELECT COUNT(*) FROM generic_tags_mapping")
+
+    @property
+    def empty(self):
+        return self._db.scalar("SELECT 1 FROM generic_tags_mapping LIMIT 1") is None
+
+    @property
+    def frame(self):
+        """DataFrame of the generic tags mapping (reads the whole table)"""
+        return self._db.frame(
+            f"SELECT {', '.join(MAPPING_COLUMNS)} FROM generic_tags_mapping",
+            columns=MAPPING_COLUMNS,
+        )
+
+    def record(self, generic_tag, industry, equipment):
+        """Add a new mapping with count 1 or increment the count of an existing one"""
+        self.record_counts([(generic_tag, 1)], industry, equipment)
+
+    def record_counts(self, counts, industry, equipment):
+        """Upsert (generic_tag, count) pairs for one industry and equipment"""
+        last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._db.transaction() as conn:
+            conn.executemany(
+                f"INSERT INTO generic_tags_mapping ({', '.join(MAPPING_COLUMNS)}) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(Generic_Tag, Industry, Equipment) "
+                "DO UPDATE SET Count = Count + excluded.Count, Last_Updated = excluded.Last_Updated",
+                ((generic_tag, industry, equipment, int(count), last_updated) for generic_tag, count in counts),
+            )
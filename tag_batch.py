@@ -0,0 +1,268 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from exports import EXPORT_FORMATS
+from generic_tag_registry import GenericTagMapping, GenericTagRegistry, register_generic_tags
+from generic_tag_upload import (
+    ingest_generic_tags_batch,
+    is_csv,
+    missing_required_columns,
+    parse_required_columns,
+    read_header,
+)
+from rerun_profile import profiled
+from sqlite_store import SQLiteGenericTagMapping, SQLiteGenericTagRegistry, open_database
+from tag_catalog import (
+    HIERARCHY_COLUMNS,
+    TAG_COLUMNS,
+    TAG_LIMIT_COLUMNS,
+    TAG_TEXT_COLUMNS,
+    assign_uuids,
+    plain_columns,
+)
+from tag_journal import open_journal
+from tag_metadata_file import atomic_write, atomic_write_csv, file_lock, open_tag_metadata
+from tag_validation import TAG_KEY_COLUMNS
+
+# Columns a DCS point list must have (Industry may come from the command line instead)
+POINT_LIST_COLUMNS = HIERARCHY_COLUMNS + ["DCS_Tag"]
+# Names DCS exports commonly use for each tag column, compared in lowercase
+# without spaces, underscores, dashes and dots
+POINT_LIST_COLUMN_NAMES = {
+    "DCS_Tag": ["dcstag", "tag", "tagname", "tagid", "pointname", "point", "pointid", "name"],
+    "Raw_Parameter": ["rawparameter", "parameter", "description", "desc", "pointdescription", "descriptor"],
+    "Generic_Tag": ["generictag"],
+    "Tag_Description": ["tagdescription"],
+    "UOM": ["uom", "units", "unit", "eu", "engunits", "engineeringunits"],
+    "Low_Low_Limit": ["lowlowlimit", "lowlow", "lolo", "ll", "lowlowalarm"],
+    "Low_Limit": ["lowlimit", "low", "lo", "l", "lowalarm"],
+    "High_Limit": ["highlimit", "high", "hi", "h", "highalarm"],
+    "High_High_Limit": ["highhighlimit", "highhigh", "hihi", "hh", "highhighalarm"],
+}
+
+
+def parse_files(parse, paths, jobs=None):
+    """Parse several files in parallel worker processes; returns frames in paths order
+
+    parse must be a module-level function so it can be sent to the workers.
+    """
+    paths = list(paths)
+    jobs = jobs or os.cpu_count() or 1
+    if len(paths) <= 1 or jobs == 1:
+        return [parse(path) for path in paths]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(paths))) as pool:
+        return list(pool.map(parse, paths))
+
+
+def parse_generic_tags_file(path):
+    """Required columns of a generic tags file, as uploaded on the Upload screen"""
+    file_name = os.path.basename(path)
+    with open(path, "rb") as f:
+        missing = missing_required_columns(read_header(f, file_name))
+        if missing:
+            raise ValueError(f"{path}: missing required columns: {', '.join(missing)}")
+        return parse_required_columns(f, file_name)
+
+
+@profiled("io")
+def parse_point_list(path, file_name=None):
+    """All cells of a DCS point list (CSV or Excel path or file) as text"""
+    read = pd.read_csv if is_csv(file_name or path) else pd.read_excel
+    df = read(path, dtype=str, keep_default_na=False)
+    df.columns = [str(column).strip() for column in df.columns]
+    return df
+
+
+def _column_key(name):
+    return "".join(c for c in str(name).lower() if c not in " _-.")
+
+
+def guess_point_list_columns(columns):
+    """Guessed {tag column: point list column or None} from POINT_LIST_COLUMN_NAMES, no column used twice"""
+    by_key = {}
+    for column in columns:
+        by_key.setdefault(_column_key(column), column)
+    guessed = {}
+    used = set()
+    for tag_column, names in POINT_LIST_COLUMN_NAMES.items():
+        guessed[tag_column] = None
+        for name in names:
+            column = by_key.get(name)
+            if column is not None and column not in used:
+                guessed[tag_column] = column
+                used.add(column)
+                break
+    return guessed
+
+
+def map_point_list(df, column_map, hierarchy=None):
+    """Point list columns renamed by a {tag column: point list column} mapping, with hierarchy values added"""
+    mapped = pd.DataFrame({tag_column: df[column] for tag_column, column in column_map.items() if column}, index=df.index)
+    for column, value in (hierarchy or {}).items():
+        mapped[column] = value
+    return mapped
+
+
+def point_list_tags(df, industry=None, source="point list"):
+    """Tags of a parsed point list in tag_metadata.csv columns, industry filling rows that have none
+
+    Limits stay text, blank if not given, so validation can report the ones that
+    are not numbers (see numeric_limits).
+    """
+    missing = [
+        column for column in POINT_LIST_COLUMNS
+        if column not in df.columns and not (column == "Industry" and industry)
+    ]
+    if missing:
+        raise ValueError(f"{source}: missing required columns: {', '.join(missing)}")
+
+    df = df.reset_index(drop=True)
+    tags = pd.DataFrame(index=df.index)
+    for column in TAG_TEXT_COLUMNS:
+        tags[column] = df[column].fillna("").astype(str).str.strip() if column in df.columns else ""
+    if industry:
+        tags["Industry"] = tags["Industry"].mask(tags["Industry"] == "", industry)
+    for column in TAG_LIMIT_COLUMNS:
+        tags[column] = df[column].fillna("").astype(str).str.strip() if column in df.columns else ""
+    return tags
+
+
+def numeric_limits(tags):
+    """Convert the limit columns of tags to floats in place; blank or invalid limits become NaN"""
+    for column in TAG_LIMIT_COLUMNS:
+        tags[column] = pd.to_numeric(tags[column], errors="coerce").astype(float)
+    return tags
+
+
+def upsert_tags(catalog, tags):
+    """Catalog with tags added, replacing the ones with the same hierarchy and DCS_Tag in place"""
+    tags = tags.drop_duplicates(TAG_KEY_COLUMNS, keep="last").reset_index(drop=True)
+    if catalog.empty:
+        return tags
+    # Compact (categorical, float32) columns would not take the new values
+    catalog = plain_columns(catalog.reset_index(drop=True))
+    for column in TAG_TEXT_COLUMNS:
+        # Empty text columns are parsed from CSV as float NaN
+        if column in catalog.columns:
+            catalog[column] = catalog[column].fillna("").astype(str)
+    catalog_keys = pd.MultiIndex.from_frame(catalog[TAG_KEY_COLUMNS])
+    tag_keys = pd.MultiIndex.from_frame(tags[TAG_KEY_COLUMNS])
+
+    positions = tag_keys.get_indexer(catalog_keys)
+    replaced = positions >= 0
+    merged = catalog.copy(deep=False)
+    if replaced.any():
+        for column in TAG_COLUMNS:
+            merged.loc[replaced, column] = tags[column].to_numpy()[positions[replaced]]
+    added = tags[~tag_keys.isin(catalog_keys)]
+    return pd.concat([merged, added], ignore_index=True)
+
+
+class BatchStore:
+    """The tag catalog and generic tags of a TAG_STORAGE backend, without Streamlit
+
+    Without the database the available generic tags are kept in generic_tags_path.
+    """
+
+    def __init__(self, storage, csv_path, db_path, generic_tags_path):
+        self.storage = storage
+        self.csv_path = csv_path
+        self.generic_tags_path = generic_tags_path
+        if storage == "sqlite":
+            self.db = open_database(db_path, migrate_csv=csv_path)
+        else:
+            self.db = None
+            journal = open_journal(csv_path) if storage == "journal" else None
+            self.tag_file = open_tag_metadata(csv_path, journal)
+
+    def tags(self):
+        """The whole tag catalog"""
+        if self.db is not None:
+            return self.db.tags_frame().reset_index(drop=True)
+        if not self.tag_file.exists():
+            return pd.DataFrame(columns=TAG_COLUMNS)
+        return self.tag_file.load()[0]
+
+    def _load_registry(self):
+        if os.path.exists(self.generic_tags_path):
+            return GenericTagRegistry(pd.read_csv(self.generic_tags_path, dtype=str, keep_default_na=False))
+        return GenericTagRegistry()
+
+    def generic_tags(self):
+        """The available generic tags"""
+        if self.db is not None:
+            return SQLiteGenericTagRegistry(self.db).frame
+        return self._load_registry().frame
+
+    def update_generic_tags(self, change):
+        """Run change(registry, mapping) on the available generic tags and save them under the file lock"""
+        if self.db is not None:
+            with self.db.transaction():
+                return change(SQLiteGenericTagRegistry(self.db), SQLiteGenericTagMapping(self.db))
+        with file_lock(self.generic_tags_path + ".lock"):
+            registry = self._load_registry()
+            result = change(registry, GenericTagMapping())
+            atomic_write_csv(registry.frame, self.generic_tags_path)
+            return result
+
+    def register_catalog_generic_tags(self, registry):
+        """Add the generic tags of the catalog's tags that the registry does not have"""
+        if self.db is not None:
+            self.db.sync_generic_tags()
+        else:
+            register_generic_tags(self.tags(), registry)
+
+    def upsert_tags(self, tags):
+        """Add tags to the catalog, replacing the ones with the same hierarchy and DCS_Tag"""
+        if self.db is not None:
+            self.db.upsert_tags(tags)
+        else:
+            self.tag_file.update(lambda catalog: upsert_tags(catalog, tags))
+
+
+def import_generic_tags(store, paths, industry, equipment, jobs=None):
+    """Parse generic tags files in parallel and add all their rows in one batch
+
+    Returns (rows per file, elapsed seconds).
+    """
+    start = time.perf_counter()
+    frames = parse_files(parse_generic_tags_file, paths, jobs)
+
+    batches = [(df, industry, equipment) for df in frames]
+    store.update_generic_tags(lambda registry, mapping: ingest_generic_tags_batch(batches, registry, mapping, []))
+    return [len(df) for df in frames], time.perf_counter() - start
+
+
+def load_point_lists(store, paths, industry=None, jobs=None, check=None):
+    """Parse DCS point lists in parallel and upsert their tags, registering new generic tags
+
+    check(tags) may raise to reject the tags before anything is saved.
+    Returns (tags, elapsed seconds).
+    """
+    start = time.perf_counter()
+    frames = parse_files(parse_point_list, paths, jobs)
+    tags = pd.concat(
+        [point_list_tags(df, industry, source=path) for path, df in zip(paths, frames)],
+        ignore_index=True,
+    )
+    tags = tags.drop_duplicates(TAG_KEY_COLUMNS, keep="last").reset_index(drop=True)
+
+    def resolve(registry, mapping):
+        # Generic tags of tags already in the catalog keep their UUIDs
+        store.register_catalog_generic_tags(registry)
+        assign_uuids(tags, registry)
+        if check is not None:
+            check(tags)
+        store.upsert_tags(numeric_limits(tags))
+
+    store.update_generic_tags(resolve)
+    return tags, time.perf_counter() - start
+
+
+def export_frame(df, path, export_format, sheet_name="Sheet1"):
+    """Write a DataFrame in one of the Summary screen's export formats"""
+    payload = EXPORT_FORMATS[export_format][0](df, sheet_name=sheet_name)
+    atomic_write(path, lambda f: f.write(payload), binary=True)
@@ -0,0 +1,401 @@
+import re
+import uuid
+from contextlib import nullcontext
+
+from generic_tag_registry import GENERIC_TAG_COLUMNS, GenericTagMapping, GenericTagRegistry
+from hierarchy_index import HIERARCHY_LEVELS, HierarchyIndex
+
+HIERARCHY_COLUMNS = ["Industry"] + HIERARCHY_LEVELS
+TAG_TEXT_COLUMNS = HIERARCHY_COLUMNS + [
+    "DCS_Tag",
+    "Raw_Parameter",
+    "Generic_Tag",
+    "UUID",
+    "Tag_Description",
+    "UOM",
+]
+TAG_LIMIT_COLUMNS = ["Low_Low_Limit", "Low_Limit", "High_Limit", "High_High_Limit"]
+TAG_COLUMNS = TAG_TEXT_COLUMNS + TAG_LIMIT_COLUMNS
+
+# Compact layout of tag DataFrames in memory: text columns whose values repeat
+# (the hierarchy, the vocabularies, and UUIDs, which every tag of a generic tag
+# shares) are categorical, limits are nullable float32
+TAG_CATEGORY_COLUMNS = HIERARCHY_COLUMNS + ["Generic_Tag", "UUID", "UOM"]
+TAG_LIMIT_DTYPE = "Float32"
+# Significant digits of float32 limits written out (0.1, not 0.10000000149)
+LIMIT_DIGITS = 7
+
+# Lowest match score at which bulk entry assigns a generic tag by itself
+AUTO_MATCH_SCORE = 0.5
+
+# Hierarchy names accepted for Plant, Area, Equipment and Asset
+HIERARCHY_NAME_PATTERN = r"[A-Z0-9_]*"
+_HIERARCHY_NAME = re.compile(HIERARCHY_NAME_PATTERN)
+
+DEFAULT_GENERIC_TAGS = [
+    "Temperature",
+    "Pressure",
+    "Flow",
+    "Level",
+    "Speed",
+    "Current",
+    "Voltage",
+    "Power",
+    "Vibration",
+    "pH",
+    "Density",
+    "Moisture",
+]
+DEFAULT_UOMS = [
+    "°C",
+    "°F",
+    "K",
+    "bar",
+    "psi",
+    "kPa",
+    "MPa",
+    "m³/h",
+    "L/min",
+    "kg/h",
+    "m",
+    "mm",
+    "%",
+    "RPM",
+    "A",
+    "V",
+    "kW",
+    "MW",
+    "mm/s",
+    "g",
+]
+
+
+def compact_tags(df):
+    """A tags DataFrame in the compact layout, sharing the columns that already have it"""
+    import pandas as pd
+
+    compact = df.copy(deep=False)
+    for column in df.columns:
+        values = df[column]
+        if column in TAG_CATEGORY_COLUMNS:
+            if not isinstance(values.dtype, pd.CategoricalDtype):
+                compact[column] = values.fillna("").astype(str).astype("category")
+        elif column in TAG_LIMIT_COLUMNS:
+            if values.dtype != TAG_LIMIT_DTYPE:
+                compact[column] = pd.to_numeric(values, errors="coerce").astype(TAG_LIMIT_DTYPE)
+        elif column in TAG_TEXT_COLUMNS:
+            compact[column] = values.fillna("").astype(str)
+    return compact
+
+
+def limit_values(values):
+    """A limit column as a float64 array (NaN if missing), float32 limits rounded to LIMIT_DIGITS"""
+    import numpy as np
+
+    x = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    if values.dtype != TAG_LIMIT_DTYPE:
+        return x
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = 10.0 ** (LIMIT_DIGITS - 1 - np.floor(np.log10(np.abs(x))))
+        rounded = np.round(x * scale) / scale
+    # 0, NaN and infinities have no scale
+    return np.where(np.isfinite(scale), rounded, x)
+
+
+def plain_columns(df):
+    """A DataFrame with categorical columns as text and float32 limits as float64, for exports and the database"""
+    import pandas as pd
+
+    plain = df.copy(deep=False)
+    for column in df.columns:
+        values = df[column]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            plain[column] = values.astype(str)
+        elif values.dtype == TAG_LIMIT_DTYPE:
+            plain[column] = pd.Series(limit_values(values), index=df.index)
+    return plain
+
+
+def set_tag_values(df, rows, values):
+    """df.loc[rows, column] = value for each {column: value} in place, adding new categories first"""
+    import pandas as pd
+
+    rows = list(rows)
+    for column, value in values.items():
+        if column in df.columns and isinstance(df[column].dtype, pd.CategoricalDtype):
+            value = "" if value is None else value
+            if value not in df[column].cat.categories:
+                df[column] = df[column].cat.add_categories([value])
+        df.loc[rows, column] = value
+
+
+def valid_hierarchy_name(text):
+    """Check that a hierarchy name has only uppercase letters, numbers and underscores"""
+    return _HIERARCHY_NAME.fullmatch(text) is not None
+
+
+def _add_sorted(values, value):
+    """Add a value to a sorted vocabulary list; returns False if it was already there"""
+    if not value or value in values:
+        return False
+    values.append(value)
+    values.sort()
+    return True
+
+
+def _merge_sorted(values, new_values):
+    """Add several values to a sorted vocabulary list, sorting once; returns the number added"""
+    known = set(values)
+    added = [value for value in dict.fromkeys(new_values) if value and value not in known]
+    if added:
+        values.extend(added)
+        values.sort()
+    return len(added)
+
+
+def assign_uuids(tags, registry, register=True):
+    """Fill in missing UUIDs and tag descriptions from the available generic tags, in place
+
+    Unknown generic tags get a new registered UUID (an empty one with register=False).
+    Returns the number of generic tags added to the registry.
+    """
+    missing = (tags["Generic_Tag"] != "") & (tags["UUID"] == "")
+    if not missing.any():
+        return 0
+    keys = list(zip(tags.loc[missing, "Generic_Tag"], tags.loc[missing, "Industry"], tags.loc[missing, "Equipment"]))
+    first_descriptions = dict(zip(reversed(keys), reversed(tags.loc[missing, "Tag_Description"].tolist())))
+
+    resolved = {}
+    new = {column: [] for column in GENERIC_TAG_COLUMNS}
+    for key in dict.fromkeys(keys):
+        generic_tag, industry, equipment = key
+        tag_uuid = registry.get(generic_tag, industry, equipment, "UUID", default=None)
+        if tag_uuid is not None:
+            resolved[key] = (tag_uuid, registry.get(generic_tag, industry, equipment, "Tag_Description"))
+            continue
+        if not register:
+            resolved[key] = ("", first_descriptions[key])
+            continue
+        tag_uuid = str(uuid.uuid4())
+        resolved[key] = (tag_uuid, first_descriptions[key])
+        for column, value in zip(GENERIC_TAG_COLUMNS, (generic_tag, tag_uuid, first_descriptions[key], industry, equipment)):
+            new[column].append(value)
+    if new["UUID"]:
+        registry.add_columns(new)
+
+    tags.loc[missing, "UUID"] = [resolved[key][0] for key in keys]
+    no_description = missing & (tags["Tag_Description"] == "")
+    if no_description.any():
+        described = [resolved[key][1] or "" for key, empty in zip(keys, no_description[missing]) if empty]
+        tags.loc[no_description, "Tag_Description"] = described
+    return len(new["UUID"])
+
+
+class TagCatalog:
+    """Tags, plant hierarchy, generic tags and UOMs of one configuration session, without any UI"""
+
+    def __init__(self, db=None):
+        self.db = db
+        if db is not None:
+            from sqlite_store import SQLiteGenericTagMapping, SQLiteGenericTagRegistry, SQLiteHierarchyIndex
+
+            self.hierarchy_index = SQLiteHierarchyIndex(db)
+            self.generic_tag_registry = SQLiteGenericTagRegistry(db)
+            self.generic_tags_mapping = SQLiteGenericTagMapping(db)
+        else:
+            self.hierarchy_index = HierarchyIndex()
+            self.generic_tag_registry = GenericTagRegistry()
+            self.generic_tags_mapping = GenericTagMapping()
+        # Generic tag and UOM vocabularies offered by the forms, kept sorted
+        self.generic_tags = list(DEFAULT_GENERIC_TAGS)
+        self.uom_list = list(DEFAULT_UOMS)
+        # Tags added on the Tags Configuration screen, not yet in tags_data
+        self.tag_entries = []
+        self._tags_data = None
+        # Matcher over the registry's generic tags, indexed up to _matched_entries
+        self._matcher = None
+        self._matched_entries = 0
+        self._matched_version = None
+        # Change counter of tags_data, used to memoize its exports
+        self.tags_data_version = 0
+
+    @property
+    def tags_data(self):
+        """Configured tags (the Summary screen's Tags Configured)"""
+        if self._tags_data is None:
+            import pandas as pd
+
+            self._tags_data = compact_tags(pd.DataFrame(columns=TAG_COLUMNS))
+        return self._tags_data
+
+    def tag_count(self):
+        """Number of configured tags, without building an empty tags_data (and importing pandas)"""
+        return 0 if self._tags_data is None else len(self._tags_data)
+
+    def set_tags_data(self, df):
+        """Replace tags_data (kept in the compact layout) and mark its cached exports as stale"""
+        self._tags_data = compact_tags(df)
+        self.tags_data_version += 1
+
+    def unique_values(self, level, industry=None, filters=None):
+        """Sorted names at a hierarchy level, optionally filtered by industry and parent names"""
+        return self.hierarchy_index.values(level, industry=industry, filters=filters)
+
+    def add_hierarchy_path(self, industry, plant, area, equipment, asset):
+        """Add a Plant/Area/Equipment/Asset path; returns False if it already existed"""
+        return self.hierarchy_index.add(industry, plant, area, equipment, asset)
+
+    def generic_tags_for_equipment(self, industry, equipment):
+        """Available generic tags for an industry and equipment, falling back to the industry"""
+        return self.generic_tag_registry.tags_for_equipment(industry, equipment)
+
+    def tag_description(self, generic_tag, industry, equipment):
+        """Tag description of a generic tag: exact equipment match first, then industry only"""
+        if not generic_tag:
+            return ""
+        return self.generic_tag_registry.get(generic_tag, industry, equipment, "Tag_Description")
+
+    def resolve_uuid(self, generic_tag, industry, equipment, tag_description=""):
+        """UUID of a generic tag, registering it with a new UUID if it is unknown"""
+        if not generic_tag:
+            return ""
+        registry = self.generic_tag_registry
+        existing_uuid = registry.get(generic_tag, industry, equipment, "UUID", default=None)
+        if existing_uuid is not None:
+            return existing_uuid
+
+        new_uuid = str(uuid.uuid4())
+        registry.add(generic_tag, new_uuid, tag_description, industry, equipment)
+        return new_uuid
+
+    def generic_tag_matcher(self):
+        """Matcher over the available generic tags and the vocabulary, updated with their new entries"""
+        if self._matcher is None:
+            from generic_tag_matcher import GenericTagMatcher
+
+            self._matcher = GenericTagMatcher()
+        registry = self.generic_tag_registry
+        version = registry.version
+        if version != self._matched_version:
+            self._matched_entries += self._matcher.add_many(registry.descriptions(self._matched_entries))
+            self._matched_version = version
+        for generic_tag in self.generic_tags:
+            self._matcher.add(generic_tag)
+        return self._matcher
+
+    def match_generic_tags(self, text, industry, equipment, limit=5):
+        """(generic tag, score) pairs ranked by similarity to a DCS tag and raw parameter, the equipment's first"""
+        preferred = self.generic_tags_for_equipment(industry, equipment)
+        return self.generic_tag_matcher().match(text, limit, preferred)
+
+    def match_tags(self, tags, limit=5):
+        """match_generic_tags() for every row of a tags DataFrame, in row order"""
+        matcher = self.generic_tag_matcher()
+        texts = (tags["DCS_Tag"].fillna("").astype(str) + " " + tags["Raw_Parameter"].fillna("").astype(str)).tolist()
+        matches = [None] * len(texts)
+        groups = tags.groupby([tags["Industry"].fillna(""), tags["Equipment"].fillna("")], sort=False).indices
+        for (industry, equipment), positions in groups.items():
+            preferred = self.generic_tags_for_equipment(industry, equipment)
+            found = matcher.match_many([texts[i] for i in positions], limit, preferred)
+            for i, candidates in zip(positions, found):
+                matches[i] = candidates
+        return matches
+
+    def record_generic_tag_use(self, generic_tag, industry, equipment):
+        """Count one more use of a generic tag for an industry and equipment"""
+        self.generic_tags_mapping.record(generic_tag, industry, equipment)
+
+    def add_generic_tag(self, generic_tag):
+        """Add a generic tag to the vocabulary; returns False if it was already there"""
+        return _add_sorted(self.generic_tags, generic_tag)
+
+    def add_uom(self, uom):
+        """Add a UOM to the vocabulary; returns False if it was already there"""
+        return _add_sorted(self.uom_list, uom)
+
+    def add_tag_entry(self, entry):
+        """Add a tag (dict keyed by TAG_COLUMNS) to tag_entries and record its generic tag"""
+        generic_tag = entry["Generic_Tag"]
+        industry = entry["Industry"]
+        equipment = entry["Equipment"]
+        registry = self.generic_tag_registry
+        if not registry.update_description(generic_tag, industry, equipment, entry["Tag_Description"]):
+            # Normally created when the UUID was resolved
+            registry.add(generic_tag, entry["UUID"], entry["Tag_Description"], industry, equipment)
+        self.record_generic_tag_use(generic_tag, industry, equipment)
+        self.tag_entries.append(entry)
+
+    def assign_generic_tags(self, tags, min_score=AUTO_MATCH_SCORE):
+        """Fill in empty Generic_Tag cells of a tags DataFrame in place, with matches from min_score on
+
+        Returns the best match score of every row (NaN for rows that already had a
+        generic tag or have no match).
+        """
+        import pandas as pd
+
+        scores = pd.Series(float("nan"), index=tags.index)
+        missing = tags["Generic_Tag"].fillna("").astype(str).str.strip() == ""
+        if not missing.any():
+            return scores
+        best = [found[0] if found else ("", float("nan")) for found in self.match_tags(tags[missing], limit=1)]
+        generic_tags = [tag for tag, _ in best]
+        scores[missing] = [score for _, score in best]
+        assigned = (scores[missing] >= min_score).to_numpy()
+        tags.loc[missing, "Generic_Tag"] = [tag if ok else "" for tag, ok in zip(generic_tags, assigned)]
+        return scores
+
+    def prepare_tag_entries(self, tags, min_score=AUTO_MATCH_SCORE):
+        """Assign generic tags, UUIDs and descriptions to a tags DataFrame in place, registering nothing
+
+        Returns the match scores of assign_generic_tags().
+        """
+        scores = self.assign_generic_tags(tags, min_score)
+        assign_uuids(tags, self.generic_tag_registry, register=False)
+        return scores
+
+    def add_tag_entries(self, tags):
+        """Add a DataFrame of tags to tag_entries in one step like add_tag_entry; returns the number added"""
+        tags = tags.reindex(columns=TAG_COLUMNS).reset_index(drop=True)
+        if tags.empty:
+            return 0
+        for column in TAG_TEXT_COLUMNS:
+            tags[column] = tags[column].fillna("").astype(str).str.strip()
+        registry = self.generic_tag_registry
+
+        with self.db.transaction() if self.db is not None else nullcontext():
+            assign_uuids(tags, registry)
+
+            with_generic_tag = tags[tags["Generic_Tag"] != ""]
+            keys = ["Generic_Tag", "Industry", "Equipment"]
+            new = {column: [] for column in GENERIC_TAG_COLUMNS}
+            last_entries = with_generic_tag.drop_duplicates(keys, keep="last")[GENERIC_TAG_COLUMNS]
+            for generic_tag, tag_uuid, tag_description, industry, equipment in last_entries.itertuples(index=False):
+                if registry.contains(generic_tag, industry, equipment):
+                    if tag_description:
+                        registry.update_description(generic_tag, industry, equipment, tag_description)
+                    continue
+                for column, value in zip(GENERIC_TAG_COLUMNS, (generic_tag, tag_uuid, tag_description, industry, equipment)):
+                    new[column].append(value)
+            if new["UUID"]:
+                registry.add_columns(new)
+
+            usage = with_generic_tag.groupby(keys, sort=False).size()
+            for (industry, equipment), counts in usage.groupby(level=["Industry", "Equipment"], sort=False):
+                self.generic_tags_mapping.record_counts(
+                    ((generic_tag, int(count)) for (generic_tag, _, _), count in counts.items()), industry, equipment
+                )
+
+        _merge_sorted(self.generic_tags, with_generic_tag["Generic_Tag"])
+        _merge_sorted(self.uom_list, tags["UOM"])
+        self.tag_entries.extend(tags.to_dict("records"))
+        return len(tags)
+
+    def finish_tag_entries(self):
+        """Move tag_entries into tags_data; returns the number of tags moved"""
+        import pandas as pd
+
+        n_entries = len(self.tag_entries)
+        if n_entries:
+            self.set_tags_data(pd.concat([self.tags_data, pd.DataFrame(self.tag_entries)], ignore_index=True))
+            self.tag_entries = []
+        return n_entries
@@ -0,0 +1,216 @@
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from rerun_profile import profiled
+from tag_catalog import plain_columns
+from tag_metadata_file import file_lock, replace_file, write_temp_file
+
+# Journal size that triggers a background compaction into the base file
+JOURNAL_COMPACT_BYTES = 1024 * 1024
+
+
+def _json_default(value):
+    """Convert numpy scalars (and anything else json cannot encode) for json.dumps"""
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def replay(base, records):
+    """Apply journal records, in order, on top of the base catalog
+
+    "reset" records replace the whole catalog, "update" records set column values
+    on rows given by their position in the catalog. Both are absolute, so
+    replaying a record twice gives the same result.
+    """
+    # Only the records after the last reset matter
+    df = base
+    start = 0
+    for i, record in enumerate(records):
+        if record["op"] == "reset":
+            df = pd.DataFrame(record["rows"], columns=record["columns"])
+            start = i + 1
+
+    # Later updates of a cell win; apply them once per column instead of per record
+    cells = {}
+    for record in records[start:]:
+        if record["op"] == "update":
+            for column, value in record["values"].items():
+                column_cells = cells.setdefault(column, {})
+                for row in record["rows"]:
+                    column_cells[row] = value
+    if not cells:
+        return df
+
+    if df is base:
+        df = base.copy()
+    for column, column_cells in cells.items():
+        df.loc[list(column_cells), column] = list(column_cells.values())
+    return df
+
+
+class TagMetadataJournal:
+    """tag_metadata.csv plus an append-only log of the changes saved since it was written
+
+    Saves append one JSON line per change to <csv>.journal, so their cost depends
+    on the size of the change rather than on the size of the catalog. read()
+    replays the log on top of the base file, and once the log grows past
+    compact_bytes it is folded into the base file in a background thread.
+    """
+
+    def __init__(self, csv_path, compact_bytes=JOURNAL_COMPACT_BYTES):
+        self.csv_path = csv_path
+        self.journal_path = csv_path + ".journal"
+        # Log being folded into the base file by a running (or interrupted) compaction
+        self.compacting_path = csv_path + ".journal.compacting"
+        self.compact_bytes = compact_bytes
+        # Advisory file locks, so appends and compactions of other processes are serialized too
+        self._lock = file_lock(csv_path + ".lock")
+        # Held for a whole compaction, so only one ever writes the base file
+        self._compact_lock = file_lock(csv_path + ".compact.lock")
+        self._executor_lock = threading.Lock()
+        self._executor = None
+        self._compaction = None
+
+    def exists(self):
+        """Check whether there is a catalog, in the base file or only in the log"""
+        return any(
+            os.path.exists(path)
+            for path in (self.csv_path, self.journal_path, self.compacting_path)
+        )
+
+    def _read_base(self):
+        if not os.path.exists(self.csv_path):
+            return pd.DataFrame()
+        return pd.read_csv(self.csv_path)
+
+    def _read_records(self, path):
+        if not os.path.exists(path):
+            return []
+        with open(path, encoding="utf-8") as f:
+            records = []
+            for line in f:
+                if not line.endswith("\n"):
+                    # A torn last line from a crash mid-append is ignored (and cut off by the next append)
+                    break
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A damaged line is skipped, the records after it still count
+                    continue
+            return records
+
+    def _drop_torn_line(self):
+        """Cut a torn last line, left by a crash mid-append, off the log (holding the lock)"""
+        if not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path, "r+b") as f:
+            end = f.seek(0, os.SEEK_END)
+            # Search backwards for the newline ending the last complete record
+            position = end
+            while position > 0:
+                start = max(0, position - 65536)
+                f.seek(start)
+                chunk = f.read(position - start)
+                if position == end and chunk.endswith(b"\n"):
+                    return
+                newline = chunk.rfind(b"\n")
+                if newline != -1:
+                    f.truncate(start + newline + 1)
+                    return
+                position = start
+            f.truncate(0)
+
+    @profiled("io")
+    def read(self):
+        """Current catalog: the base file with the logged changes replayed on top"""
+        with self._lock:
+            base = self._read_base()
+            records = self._read_records(self.compacting_path) + self._read_records(self.journal_path)
+        return replay(base, records)
+
+    def pending_records(self):
+        """Number of logged changes not yet compacted into the base file"""
+        with self._lock:
+            return len(self._read_records(self.compacting_path)) + len(self._read_records(self.journal_path))
+
+    @profiled("io")
+    def _append(self, records):
+        lines = "".join(json.dumps(record, default=_json_default) + "\n" for record in records)
+        if not lines:
+            return
+        with self._lock:
+            # Written onto a torn line, the new records would be unreadable
+            self._drop_torn_line()
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+            size = os.path.getsize(self.journal_path)
+        if size >= self.compact_bytes:
+            self.compact_in_background()
+
+    def reset(self, df):
+        """Log a replacement of the whole catalog with the rows of df"""
+        self._append(
+            [{"op": "reset", "columns": list(df.columns), "rows": plain_columns(df).values.tolist()}]
+        )
+
+    def append_updates(self, changes):
+        """Log (row ids, {column: value}) changes, written together in one append"""
+        self._append(
+            [
+                {"op": "update", "rows": list(row_ids), "values": values}
+                for row_ids, values in changes
+            ]
+        )
+
+    def compact(self):
+        """Fold the log into the base file
+
+        The log is first moved aside, so saves made meanwhile go to a fresh log.
+        The new base file is written next to the old one and renamed over it.
+        """
+        with self._compact_lock:
+            with self._lock:
+                if not os.path.exists(self.compacting_path):
+                    if not os.path.exists(self.journal_path):
+                        return
+                    os.replace(self.journal_path, self.compacting_path)
+                records = self._read_records(self.compacting_path)
+
+            # Only compactions write the base file, so it can be read and rewritten unlocked
+            catalog = replay(self._read_base(), records)
+            temp_path = write_temp_file(self.csv_path, lambda f: catalog.to_csv(f, index=False))
+
+            with self._lock:
+                replace_file(temp_path, self.csv_path)
+                os.remove(self.compacting_path)
+
+    def compact_in_background(self):
+        """Start a compaction in a background thread unless one is running"""
+        with self._executor_lock:
+            if self._compaction is not None and not self._compaction.done():
+                return self._compaction
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="journal-compact")
+            self._compaction = self._executor.submit(self.compact)
+            return self._compaction
+
+
+_journals = {}
+_journals_lock = threading.Lock()
+
+
+def open_journal(csv_path):
+    """Process-wide TagMetadataJournal for a catalog file"""
+    key = os.path.abspath(csv_path)
+    with _journals_lock:
+        journal = _journals.get(key)
+        if journal is None:
+            journal = _journals[key] = TagMetadataJournal(csv_path)
+    return journal
@@ -0,0 +1,333 @@
+import os
+import tempfile
+import threading
+
+import pandas as pd
+
+from rerun_profile import profiled
+from tag_catalog import compact_tags, set_tag_values
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Sessions share one parsed catalog through shallow copies, which must not write
+# through to it. Copy-on-write is always on from pandas 3.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+
+def _lock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        return
+    while True:
+        try:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            # LK_LOCK gives up after about 10 seconds, keep waiting
+            continue
+
+
+def _unlock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class FileLock:
+    """Advisory lock file shared by the threads of a process and by other processes
+
+    Re-entrant within a thread: only the outermost acquisition locks the file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._file = None
+
+    def __enter__(self):
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                self._file = open(self.path, "a+b")
+                _lock_file(self._file)
+            except BaseException:
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        self._depth -= 1
+        if self._depth == 0:
+            _unlock_file(self._file)
+            self._file.close()
+            self._file = None
+        self._thread_lock.release()
+
+
+_file_locks = {}
+_file_locks_lock = threading.Lock()
+
+
+def file_lock(path):
+    """Process-wide FileLock for a lock file path"""
+    key = os.path.abspath(path)
+    with _file_locks_lock:
+        lock = _file_locks.get(key)
+        if lock is None:
+            lock = _file_locks[key] = FileLock(path)
+    return lock
+
+
+def write_temp_file(path, write, binary=False):
+    """Write a file through write(f) next to path, flushed to disk; returns its path"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") if binary else os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return temp_path
+
+
+def replace_file(temp_path, path):
+    """Atomically rename a file written by write_temp_file over path"""
+    os.replace(temp_path, path)
+    # Persist the rename itself (directories cannot be opened on Windows)
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+@profiled("io")
+def atomic_write(path, write, binary=False):
+    """Write a file through write(f) on a temp file that is then renamed over path
+
+    Readers see either the old or the new file, never a partial one, and a crash
+    mid-write leaves the old file in place.
+    """
+    replace_file(write_temp_file(path, write, binary), path)
+
+
+@profiled("io")
+def atomic_write_csv(df, path):
+    """Save a DataFrame as CSV with atomic_write"""
+    atomic_write(path, lambda f: df.to_csv(f, index=False))
+
+
+class CatalogReplacedError(Exception):
+    """The catalog was replaced (saved as a whole, e.g. by Create) since it was loaded"""
+
+
+def _same(a, b):
+    if a is b:
+        return True
+    try:
+        if pd.isna(a) and pd.isna(b):
+            return True
+    except (TypeError, ValueError):
+        pass
+    try:
+        return bool(a == b)
+    except (TypeError, ValueError):
+        return False
+
+
+def merge_changes(current, changes):
+    """Apply a session's changes on top of a catalog saved by another session
+
+    changes are (row ids, {column: new value}, {column: [old values]}) tuples.
+    Returns the merged catalog and the (row, column) cells that both sessions
+    changed; the session's values win on those cells.
+    """
+    # (row, column) -> (value when loaded, value saved by the session)
+    cells = {}
+    for row_ids, values, old_values in changes:
+        for column, value in values.items():
+            for row_id, old in zip(row_ids, old_values[column]):
+                loaded = cells[(row_id, column)][0] if (row_id, column) in cells else old
+                cells[(row_id, column)] = (loaded, value)
+
+    conflicts = [
+        (row_id, column)
+        for (row_id, column), (loaded, value) in cells.items()
+        if column in current.columns
+        and not _same(current.at[row_id, column], loaded)
+        and not _same(current.at[row_id, column], value)
+    ]
+
+    merged = current.copy(deep=False)
+    for row_ids, values, _ in changes:
+        set_tag_values(merged, row_ids, values)
+    return merged, conflicts
+
+
+class TagMetadataFile:
+    """tag_metadata.csv saved with locking, atomic renames and optimistic concurrency
+
+    A version stamp (<csv>.version) is (generation, saves): saves is incremented
+    by every save, generation only by a replacement of the whole catalog.
+    Sessions keep the version they loaded; a save on top of a newer version of
+    the same generation merges the session's changes into the latest catalog
+    instead of overwriting it, and one on top of another generation is refused,
+    since changes are keyed by row position. With a
+    journal, saves are appended to it instead of rewriting the file.
+
+    The parsed catalog is kept, in the compact layout, and shared by every load
+    until the version stamp or the mtime or size of its files change. Loads
+    return copy-on-write views of it, so sessions only copy the columns they edit.
+    """
+
+    def __init__(self, csv_path, journal=None):
+        self.csv_path = csv_path
+        self.version_path = csv_path + ".version"
+        self.journal = journal
+        self._lock = file_lock(csv_path + ".lock")
+        # ((file signature, version), catalog) of the last parse
+        self._cache = None
+
+    def exists(self):
+        if self.journal is not None:
+            return self.journal.exists()
+        return os.path.exists(self.csv_path)
+
+    @profiled("io")
+    def version(self):
+        """Current (generation, saves) version stamp ((0, 0) before the first save)"""
+        try:
+            with open(self.version_path, encoding="utf-8") as f:
+                # "<saves> <generation>"; files written before generations hold only the saves
+                fields = [int(field) for field in f.read().split()]
+        except FileNotFoundError:
+            fields = []
+        saves = fields[0] if fields else 0
+        generation = fields[1] if len(fields) > 1 else 0
+        return generation, saves
+
+    def _bump_version(self, replaced=False):
+        generation, saves = self.version()
+        version = (generation + 1 if replaced else generation, saves + 1)
+        atomic_write(self.version_path, lambda f: f.write(f"{version[1]} {version[0]}"))
+        return version
+
+    @profiled("io")
+    def _read(self):
+        if self.journal is not None:
+            return self.journal.read()
+        return pd.read_csv(self.csv_path)
+
+    def _signature(self):
+        """mtime and size of the files the catalog is read from"""
+        paths = [self.csv_path]
+        if self.journal is not None:
+            paths += [self.journal.journal_path, self.journal.compacting_path]
+        signature = []
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _current(self):
+        """Shared catalog and its version, parsed again only if the files changed"""
+        with self._lock:
+            key = (self._signature(), self.version())
+            if self._cache is None or self._cache[0] != key:
+                self._cache = (key, compact_tags(self._read()))
+            return self._cache[1], key[1]
+
+    @profiled("io")
+    def load(self):
+        """Current catalog and its version stamp, read consistently
+
+        The catalog is a copy-on-write view of the shared one, so it can be edited freely.
+        """
+        catalog, version = self._current()
+        return catalog.copy(deep=False), version
+
+    @profiled("io")
+    def replace(self, df):
+        """Save df as the whole catalog; returns the new version"""
+        with self._lock:
+            if self.journal is not None:
+                self.journal.reset(df)
+            else:
+                atomic_write_csv(df, self.csv_path)
+            return self._bump_version(replaced=True)
+
+    @profiled("io")
+    def update(self, change):
+        """Replace the catalog with change(current catalog), with no save in between
+
+        Returns the new catalog and version. The catalog passed to change is
+        empty if there is none yet.
+        """
+        with self._lock:
+            current = self.load()[0] if self.exists() else pd.DataFrame()
+            df = change(current)
+            return df, self.replace(df)
+
+    @profiled("io")
+    def save_changes(self, df, changes, loaded_version):
+        """Save a session's edited catalog given the changes made since it was loaded
+
+        Returns (catalog, version, merged, conflicts): if another session saved
+        since loaded_version, catalog is the latest catalog with the changes
+        merged in and merged is True. Raises CatalogReplacedError if the catalog
+        was replaced since loaded_version, so its rows no longer line up with
+        the ones that were loaded (even with as many rows).
+        """
+        with self._lock:
+            version = self.version()
+            if version[0] != loaded_version[0]:
+                raise CatalogReplacedError(f"{self.csv_path} was replaced since it was loaded")
+            merged = version != loaded_version
+            conflicts = []
+            if merged:
+                current, _ = self._current()
+                if len(current) != len(df):
+                    raise CatalogReplacedError(
+                        f"{self.csv_path} has {len(current)} rows, {len(df)} were loaded"
+                    )
+                df, conflicts = merge_changes(current, changes)
+
+            if self.journal is not None:
+                self.journal.append_updates((row_ids, values) for row_ids, values, _ in changes)
+            else:
+                atomic_write_csv(df, self.csv_path)
+            return df, self._bump_version(), merged, conflicts
+
+
+_files = {}
+_files_lock = threading.Lock()
+
+
+def open_tag_metadata(csv_path, journal=None):
+    """Process-wide TagMetadataFile for a catalog file"""
+    key = os.path.abspath(csv_path)
+    with _files_lock:
+        tag_file = _files.get(key)
+        if tag_file is None:
+            tag_file = _files[key] = TagMetadataFile(csv_path, journal)
+    return tag_file
@@ -0,0 +1,214 @@
+import numpy as np
+import pandas as pd
+
+from hierarchy_index import HIERARCHY_LEVELS
+from tag_catalog import HIERARCHY_COLUMNS, HIERARCHY_NAME_PATTERN, TAG_LIMIT_COLUMNS
+
+# Columns every tag must have a value in, which also identify a tag
+TAG_KEY_COLUMNS = HIERARCHY_COLUMNS + ["DCS_Tag"]
+ISSUE_COLUMNS = ["Row", "DCS_Tag", "Column", "Issue"]
+
+
+class _Columns:
+    """Tag columns factorized once and shared by all rules
+
+    Rules work on the integer codes of each distinct value, so string work
+    (name patterns, UOM lookups) is done once per distinct value instead of
+    once per row.
+    """
+
+    def __init__(self, df):
+        self.df = df
+        self._factorized = {}
+        self._empty = {}
+        self._limits = None
+
+    def factorize(self, column):
+        """(codes, distinct values) of a column; missing cells get code -1"""
+        if column not in self._factorized:
+            self._factorized[column] = pd.factorize(self.df[column])
+        return self._factorized[column]
+
+    def lookup(self, column, values, missing):
+        """Per-row value of a per-distinct-value array, missing for missing cells"""
+        codes, _ = self.factorize(column)
+        # Code -1 picks the appended value
+        return np.append(values, missing)[codes]
+
+    def empty(self, column):
+        """Rows with a missing or blank value in a column"""
+        if column not in self._empty:
+            values = self.df[column]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                # Checked once per category; code -1 is a missing cell
+                blank = np.asarray(values.cat.categories.astype(str).str.strip() == "")
+                self._empty[column] = np.append(blank, True)[values.cat.codes.to_numpy()]
+            elif pd.api.types.is_numeric_dtype(values.dtype):
+                self._empty[column] = values.isna().to_numpy(dtype=bool)
+            else:
+                self._empty[column] = (values.fillna("").astype(str).str.strip() == "").to_numpy(dtype=bool)
+        return self._empty[column]
+
+    def key(self, columns):
+        """One int64 code per row for a combination of columns"""
+        key = np.zeros(len(self.df), dtype=np.int64)
+        for column in columns:
+            codes, uniques = self.factorize(column)
+            key = key * (len(uniques) + 1) + (codes + 1)
+        return key
+
+    def limits(self):
+        """Limit columns as a float array with NaN for anything that is not a number"""
+        if self._limits is None:
+            self._limits = np.column_stack(
+                [
+                    pd.to_numeric(self.df[column], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+                    if column in self.df.columns
+                    else np.full(len(self.df), np.nan)
+                    for column in TAG_LIMIT_COLUMNS
+                ]
+            )
+        return self._limits
+
+
+def _minority(group_key, value_key):
+    """Rows whose value_key is not the most common one of their group_key
+
+    On ties the value seen first wins, so each group keeps one value and only
+    the rows that disagree with it are reported.
+    """
+    group_of_row, groups = pd.factorize(group_key)
+    n_value_codes = int(value_key.max()) + 1
+    pair_of_row, pairs = pd.factorize(group_of_row.astype(np.int64) * n_value_codes + value_key)
+    pair_counts = np.bincount(pair_of_row)
+    pair_groups = pairs // n_value_codes
+    # Pairs by group, most common first; the first pair of each group is its majority
+    order = np.lexsort((-pair_counts, pair_groups))
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = pair_groups[order][1:] != pair_groups[order][:-1]
+    majority = np.empty(len(groups), dtype=np.intp)
+    majority[pair_groups[order][first]] = order[first]
+    return majority[group_of_row] != pair_of_row
+
+
+def empty_key_columns(columns, options):
+    for column in TAG_KEY_COLUMNS:
+        yield columns.empty(column), column, "empty"
+
+
+def hierarchy_names(columns, options):
+    for column in HIERARCHY_LEVELS:
+        _, uniques = columns.factorize(column)
+        names = pd.Series(uniques, dtype=object).astype(str)
+        invalid = ~names.str.fullmatch(HIERARCHY_NAME_PATTERN) & (names != "")
+        yield columns.lookup(column, invalid.to_numpy(), False), column, "only uppercase letters, numbers and underscores are allowed"
+
+
+def duplicate_dcs_tags(columns, options):
+    key = columns.key(["Industry", "Plant", "DCS_Tag"])
+    duplicated = pd.Series(key).duplicated(keep=False).to_numpy() & ~columns.empty("DCS_Tag")
+    yield duplicated, "DCS_Tag", "duplicate DCS_Tag in the same plant"
+
+
+def limit_values(columns, options):
+    limits = columns.limits()
+    for i, column in enumerate(TAG_LIMIT_COLUMNS):
+        if column in columns.df.columns:
+            # Blank limits are not set, not invalid
+            yield np.isnan(limits[:, i]) & ~columns.empty(column), column, "not a number"
+
+
+def limit_order(columns, options):
+    limits = columns.limits()
+    # A limit below any lower limit before it (limits that are not numbers are skipped)
+    highest_before = np.fmax.accumulate(limits, axis=1)[:, :-1]
+    out_of_order = limits[:, 1:] < highest_before
+    first = np.where(out_of_order.any(axis=1), out_of_order.argmax(axis=1), -1)
+    for i, column in enumerate(TAG_LIMIT_COLUMNS[1:]):
+        yield first == i, column, "limits not in Low-Low <= Low <= High <= High-High order"
+
+
+def generic_tag_uuids(columns, options):
+    with_tag = ~columns.empty("Generic_Tag")
+    no_uuid = columns.empty("UUID")
+    yield with_tag & no_uuid, "UUID", "generic tag without a UUID"
+
+    # One UUID per generic tag of an equipment, and one generic tag per UUID: tags
+    # that disagree with the most common pairing are reported
+    rows = with_tag & ~no_uuid
+    if rows.any():
+        generic_tag = columns.key(["Generic_Tag", "Industry", "Equipment"])[rows]
+        uuid_codes = columns.factorize("UUID")[0][rows].astype(np.int64)
+        name_codes = columns.factorize("Generic_Tag")[0][rows].astype(np.int64)
+        for mask, issue in (
+            (_minority(generic_tag, uuid_codes), "UUID differs from other tags of this generic tag and equipment"),
+            (_minority(uuid_codes, name_codes), "UUID also used by another generic tag"),
+        ):
+            found = np.zeros(len(rows), dtype=bool)
+            found[rows] = mask
+            yield found, "UUID", issue
+
+
+def unknown_uoms(columns, options):
+    known_uoms = options.get("known_uoms")
+    if known_uoms is None or "UOM" not in columns.df.columns:
+        return
+    _, uniques = columns.factorize("UOM")
+    uoms = pd.Series(uniques, dtype=object).astype(str).str.strip()
+    unknown = ~uoms.isin(set(known_uoms)) & (uoms != "")
+    yield columns.lookup("UOM", unknown.to_numpy(), False), "UOM", "unknown UOM"
+
+
+# Rules run by validate_tags, in report order: each yields (row mask, column, issue)
+RULES = [
+    empty_key_columns,
+    hierarchy_names,
+    duplicate_dcs_tags,
+    limit_values,
+    limit_order,
+    generic_tag_uuids,
+    unknown_uoms,
+]
+# Columns a rule needs; rules whose columns are missing are skipped
+RULE_COLUMNS = {
+    limit_order: TAG_LIMIT_COLUMNS,
+    generic_tag_uuids: ["Generic_Tag", "UUID"],
+}
+
+
+def validate_tags(df, known_uoms=None):
+    """Check a whole tags DataFrame against every rule in RULES
+
+    Each rule is one vectorized pass over columns factorized once. UOMs are
+    only checked if known_uoms is given. Returns one row per issue (row label,
+    DCS_Tag, column, description); an empty frame means the tags are valid.
+    """
+    missing = [column for column in TAG_KEY_COLUMNS if column not in df.columns]
+    if missing:
+        return pd.DataFrame(
+            [(None, "", column, "missing column") for column in missing], columns=ISSUE_COLUMNS
+        )
+
+    columns = _Columns(df)
+    options = {"known_uoms": known_uoms}
+    found = []
+    for rule in RULES:
+        if not all(column in df.columns for column in RULE_COLUMNS.get(rule, [])):
+            continue
+        for mask, column, issue in rule(columns, options):
+            if mask.any():
+                rows = df[mask]
+                found.append(
+                    pd.DataFrame(
+                        {
+                            "Row": rows.index,
+                            "DCS_Tag": rows["DCS_Tag"].fillna("").astype(str),
+                            "Column": column,
+                            "Issue": issue,
+                        },
+                        columns=ISSUE_COLUMNS,
+                    )
+                )
+    if not found:
+        return pd.DataFrame(columns=ISSUE_COLUMNS)
+    return pd.concat(found, ignore_index=True)
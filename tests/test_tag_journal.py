@@ -0,0 +1,73 @@
+import pandas as pd
+
+from tag_journal import TagMetadataJournal, replay
+
+
+def catalog(n_rows=3):
+    return pd.DataFrame({"DCS_Tag": [f"TI-{i}" for i in range(n_rows)], "High_Limit": [0.0] * n_rows})
+
+
+def test_replay_applies_updates_in_order():
+    records = [
+        {"op": "update", "rows": [0, 1], "values": {"High_Limit": 5.0}},
+        {"op": "update", "rows": [1], "values": {"High_Limit": 7.0}},
+    ]
+    df = replay(catalog(), records)
+    assert df["High_Limit"].tolist() == [5.0, 7.0, 0.0]
+
+
+def test_replay_starts_from_the_last_reset():
+    records = [
+        {"op": "update", "rows": [0], "values": {"High_Limit": 5.0}},
+        {"op": "reset", "columns": ["DCS_Tag", "High_Limit"], "rows": [["TI-9", 1.0]]},
+        {"op": "update", "rows": [0], "values": {"High_Limit": 2.0}},
+    ]
+    df = replay(catalog(), records)
+    assert df.values.tolist() == [["TI-9", 2.0]]
+
+
+def test_replay_leaves_the_base_catalog_unchanged():
+    base = catalog()
+    replay(base, [{"op": "update", "rows": [0], "values": {"High_Limit": 5.0}}])
+    assert base["High_Limit"].tolist() == [0.0, 0.0, 0.0]
+
+
+def test_read_replays_the_log_on_the_base_file(tmp_path):
+    journal = TagMetadataJournal(str(tmp_path / "tag_metadata.csv"))
+    journal.reset(catalog())
+    journal.append_updates([([2], {"High_Limit": 9.0})])
+    assert journal.read()["High_Limit"].tolist() == [0.0, 0.0, 9.0]
+    assert journal.pending_records() == 2
+
+
+def test_appends_after_a_torn_line_are_kept(tmp_path):
+    journal = TagMetadataJournal(str(tmp_path / "tag_metadata.csv"))
+    journal.reset(catalog())
+    with open(journal.journal_path, "a", encoding="utf-8") as f:
+        f.write('{"op": "update", "rows": [0], "val')
+
+    # The torn line is ignored when reading and cut off by the next append
+    assert journal.read()["High_Limit"].tolist() == [0.0, 0.0, 0.0]
+    journal.append_updates([([0], {"High_Limit": 5.0})])
+    journal.append_updates([([1], {"High_Limit": 7.0})])
+    assert journal.read()["High_Limit"].tolist() == [5.0, 7.0, 0.0]
+    assert journal.pending_records() == 3
+
+
+def test_damaged_line_is_skipped(tmp_path):
+    journal = TagMetadataJournal(str(tmp_path / "tag_metadata.csv"))
+    journal.reset(catalog())
+    with open(journal.journal_path, "a", encoding="utf-8") as f:
+        f.write("not json\n")
+    journal.append_updates([([1], {"High_Limit": 7.0})])
+    assert journal.read()["High_Limit"].tolist() == [0.0, 7.0, 0.0]
+
+
+def test_compact_folds_the_log_into_the_base_file(tmp_path):
+    csv_path = tmp_path / "tag_metadata.csv"
+    journal = TagMetadataJournal(str(csv_path))
+    journal.reset(catalog())
+    journal.append_updates([([0], {"High_Limit": 5.0})])
+    journal.compact()
+    assert journal.pending_records() == 0
+    assert pd.read_csv(csv_path)["High_Limit"].tolist() == [5.0, 0.0, 0.0]
@@ -0,0 +1,93 @@
+import pandas as pd
+import pytest
+
+from tag_catalog import set_tag_values
+from tag_journal import TagMetadataJournal
+from tag_metadata_file import CatalogReplacedError, TagMetadataFile, merge_changes
+
+
+def catalog(n_rows=3):
+    return pd.DataFrame(
+        {
+            "DCS_Tag": [f"TI-{i}" for i in range(n_rows)],
+            "UOM": ["°C"] * n_rows,
+            "High_Limit": [0.0] * n_rows,
+        }
+    )
+
+
+@pytest.fixture(params=["plain", "journal"])
+def tag_file(request, tmp_path):
+    csv_path = str(tmp_path / "tag_metadata.csv")
+    journal = TagMetadataJournal(csv_path) if request.param == "journal" else None
+    tag_file = TagMetadataFile(csv_path, journal)
+    tag_file.replace(catalog())
+    return tag_file
+
+
+def edit(df, rows, values):
+    """Change df in place like a session does; returns the (rows, new values, old values) change"""
+    old_values = {column: df.loc[rows, column].tolist() for column in values}
+    set_tag_values(df, rows, values)
+    return rows, values, old_values
+
+
+def test_merge_changes_keeps_other_sessions_changes():
+    current = catalog()
+    current.loc[1, "High_Limit"] = 8.0
+    change = edit(catalog(), [0], {"High_Limit": 5.0})
+
+    merged, conflicts = merge_changes(current, [change])
+    assert merged["High_Limit"].tolist() == [5.0, 8.0, 0.0]
+    assert conflicts == []
+
+
+def test_merge_changes_reports_cells_both_sessions_changed():
+    current = catalog()
+    current.loc[0, "High_Limit"] = 8.0
+    change = edit(catalog(), [0], {"High_Limit": 5.0})
+
+    merged, conflicts = merge_changes(current, [change])
+    assert merged.loc[0, "High_Limit"] == 5.0
+    assert conflicts == [(0, "High_Limit")]
+
+
+def test_save_without_other_saves_is_not_merged(tag_file):
+    df, version = tag_file.load()
+    change = edit(df, [2], {"High_Limit": 9.0})
+
+    saved, new_version, merged, conflicts = tag_file.save_changes(df, [change], version)
+    assert not merged and conflicts == []
+    assert new_version == (version[0], version[1] + 1)
+    assert tag_file.load()[0]["High_Limit"].tolist() == [0.0, 0.0, 9.0]
+
+
+def test_concurrent_saves_are_merged(tag_file):
+    first, first_version = tag_file.load()
+    second, second_version = tag_file.load()
+    tag_file.save_changes(first, [edit(first, [0], {"High_Limit": 5.0})], first_version)
+
+    saved, _, merged, conflicts = tag_file.save_changes(second, [edit(second, [1], {"UOM": "bar"})], second_version)
+    assert merged and conflicts == []
+    latest = tag_file.load()[0]
+    assert latest["High_Limit"].tolist() == [5.0, 0.0, 0.0]
+    assert latest["UOM"].tolist() == ["°C", "bar", "°C"]
+
+
+def test_save_over_a_replaced_catalog_is_refused(tag_file):
+    df, version = tag_file.load()
+    # Same number of rows, so only the generation tells the catalogs apart
+    tag_file.replace(catalog().assign(DCS_Tag=["PI-0", "PI-1", "PI-2"]))
+
+    with pytest.raises(CatalogReplacedError):
+        tag_file.save_changes(df, [edit(df, [0], {"High_Limit": 5.0})], version)
+    assert tag_file.load()[0]["DCS_Tag"].tolist() == ["PI-0", "PI-1", "PI-2"]
+
+
+def test_version_counts_saves_and_replacements(tag_file):
+    assert tag_file.version() == (1, 1)
+    df, version = tag_file.load()
+    tag_file.save_changes(df, [edit(df, [0], {"High_Limit": 1.0})], version)
+    assert tag_file.version() == (1, 2)
+    tag_file.replace(catalog())
+    assert tag_file.version() == (2, 3)
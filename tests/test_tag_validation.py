@@ -0,0 +1,82 @@
+import math
+
+import pandas as pd
+
+from tag_catalog import TAG_COLUMNS, compact_tags
+from tag_validation import validate_tags
+
+
+def tags(*rows):
+    """Valid tags DataFrame, one row per dict of column overrides"""
+    base = {column: "" for column in TAG_COLUMNS}
+    base.update(
+        {
+            "Industry": "Cement",
+            "Plant": "P1",
+            "Area": "A1",
+            "Equipment": "KILN",
+            "Asset": "GB",
+            "Generic_Tag": "KILN_TT",
+            "UUID": "u1",
+            "UOM": "°C",
+            "Low_Low_Limit": 1.0,
+            "Low_Limit": 2.0,
+            "High_Limit": 3.0,
+            "High_High_Limit": 4.0,
+        }
+    )
+    return pd.DataFrame([{**base, "DCS_Tag": f"TI-{i}", **row} for i, row in enumerate(rows)], columns=TAG_COLUMNS)
+
+
+def issues(df, **options):
+    """(row, column, issue) of every issue found"""
+    return [(row, column, issue) for row, _, column, issue in validate_tags(df, **options).itertuples(index=False)]
+
+
+def test_valid_tags_have_no_issues():
+    assert validate_tags(tags({}, {}), known_uoms=["°C"]).empty
+
+
+def test_missing_key_column_is_reported():
+    assert issues(tags({}).drop(columns="Plant")) == [(None, "Plant", "missing column")]
+
+
+def test_empty_key_and_invalid_hierarchy_name():
+    assert issues(tags({"Area": ""}, {"Asset": "gear box"})) == [
+        (0, "Area", "empty"),
+        (1, "Asset", "only uppercase letters, numbers and underscores are allowed"),
+    ]
+
+
+def test_duplicate_dcs_tag_in_a_plant():
+    found = issues(tags({"DCS_Tag": "TI-1"}, {"DCS_Tag": "TI-1", "Asset": "MOTOR"}, {"DCS_Tag": "TI-1", "Plant": "P2"}))
+    assert found == [(0, "DCS_Tag", "duplicate DCS_Tag in the same plant"), (1, "DCS_Tag", "duplicate DCS_Tag in the same plant")]
+
+
+def test_limits_that_are_not_numbers_or_out_of_order():
+    found = issues(tags({"High_Limit": "x"}, {"Low_Limit": 5.0}))
+    assert found == [
+        (0, "High_Limit", "not a number"),
+        (1, "High_Limit", "limits not in Low-Low <= Low <= High <= High-High order"),
+    ]
+
+
+def test_blank_limits_are_not_issues():
+    df = tags({"Low_Low_Limit": math.nan, "Low_Limit": "", "High_High_Limit": math.nan})
+    assert validate_tags(df).empty
+    assert validate_tags(compact_tags(df)).empty
+
+
+def test_conflicting_uuids():
+    found = issues(tags({}, {}, {"UUID": "u2"}, {"Generic_Tag": "KILN_PT"}, {"UUID": ""}))
+    assert found == [
+        (4, "UUID", "generic tag without a UUID"),
+        (2, "UUID", "UUID differs from other tags of this generic tag and equipment"),
+        (3, "UUID", "UUID also used by another generic tag"),
+    ]
+
+
+def test_unknown_uoms_only_with_known_uoms():
+    df = tags({"UOM": "furlong"})
+    assert issues(df, known_uoms=["°C"]) == [(0, "UOM", "unknown UOM")]
+    assert validate_tags(df).empty
@@ -0,0 +1,61 @@
+import math
+
+import pandas as pd
+
+from sqlite_store import TagDatabase
+from tag_batch import upsert_tags
+from tag_catalog import TAG_COLUMNS, TAG_LIMIT_COLUMNS
+
+
+def tags(*rows):
+    """Tags DataFrame of (Asset, DCS_Tag, High_Limit) rows in one Cement plant"""
+    return pd.DataFrame(
+        [
+            {
+                **{column: "" for column in TAG_COLUMNS},
+                **{column: math.nan for column in TAG_LIMIT_COLUMNS},
+                "Industry": "Cement",
+                "Plant": "P1",
+                "Area": "A1",
+                "Equipment": "KILN",
+                "Asset": asset,
+                "DCS_Tag": dcs_tag,
+                "High_Limit": high_limit,
+            }
+            for asset, dcs_tag, high_limit in rows
+        ],
+        columns=TAG_COLUMNS,
+    )
+
+
+def test_upsert_replaces_tags_in_place_and_appends_new_ones():
+    catalog = tags(("GB", "TI-1", 1.0), ("GB", "TI-2", 2.0))
+    result = upsert_tags(catalog, tags(("GB", "TI-2", 20.0), ("GB", "TI-3", 3.0)))
+    assert result[["DCS_Tag", "High_Limit"]].values.tolist() == [["TI-1", 1.0], ["TI-2", 20.0], ["TI-3", 3.0]]
+
+
+def test_upsert_keys_tags_by_hierarchy_and_dcs_tag():
+    catalog = tags(("GB", "TI-1", 1.0))
+    result = upsert_tags(catalog, tags(("MOTOR", "TI-1", 5.0)))
+    assert result[["Asset", "High_Limit"]].values.tolist() == [["GB", 1.0], ["MOTOR", 5.0]]
+
+
+def test_upsert_keeps_the_last_of_duplicate_new_tags():
+    result = upsert_tags(pd.DataFrame(), tags(("GB", "TI-1", 1.0), ("GB", "TI-1", 2.0)))
+    assert result["High_Limit"].tolist() == [2.0]
+
+
+def test_database_upsert_replaces_and_inserts(tmp_path):
+    db = TagDatabase(str(tmp_path / "tags.db"))
+    assert db.upsert_tags(tags(("GB", "TI-1", 1.0), ("GB", "TI-2", 2.0))) == 2
+    assert db.upsert_tags(tags(("GB", "TI-2", 20.0), ("MOTOR", "TI-1", 3.0))) == 2
+
+    stored = db.tags_frame()
+    assert stored[["Asset", "DCS_Tag", "High_Limit"]].values.tolist() == [
+        ["GB", "TI-1", 1.0],
+        ["GB", "TI-2", 20.0],
+        ["MOTOR", "TI-1", 3.0],
+    ]
+    # Blank limits stay empty
+    assert stored["Low_Limit"].isna().all()
+    assert db.scalar("SELECT COUNT(*) FROM hierarchy WHERE Asset != ''") == 2